@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark per-response CPU time: building the agent state and encoding it.
+
+Uses the 5-player late-game position of `bench_card_info.py` and times, per
+response:
+
+- build: `build_agent_state` with full card details (a fresh session cache
+  each call, so nothing is deduplicated away)
+- encode: JSON-encoding the result the way FastMCP formats tool results
+  (`pydantic_core.to_json`, indented), with the stdlib encoder, and with
+  `_json.dumps`
+
+Usage:
+
+    uv run python scripts/bench_agent_state.py --tableau 40 --hand 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import pydantic_core
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_card_info import _player_view, _synthetic_cards
+
+from terraforming_mars_mcp import _cache_store, _json, game_state
+from terraforming_mars_mcp import card_info as card_info_mod
+from terraforming_mars_mcp._card_db import compile_cards
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tableau", type=int, default=40)
+    parser.add_argument("--hand", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    _cache_store.SNAPSHOT_DIR = None
+
+    index = card_info_mod._load_card_info_index()
+    source = "real cards.json"
+    if not index:
+        index = card_info_mod._CARD_INFO_INDEX = compile_cards(_synthetic_cards(600))
+        source = "synthetic card database"
+    view = _player_view(sorted(index), args.tableau, args.hand)
+
+    def build() -> dict[str, object]:
+        game_state._SESSION_CACHES.clear()
+        return game_state.build_agent_state(view, include_board_state=True)
+
+    state = build()
+    encoder = "orjson" if _json.orjson is not None else "json"
+    print(
+        f"5 players x {args.tableau} tableau cards, {args.hand} in hand ({source}); "
+        f"{len(_json.dumps(state))} bytes compact"
+    )
+    for label, func in (
+        ("build", build),
+        ("encode FastMCP", lambda: pydantic_core.to_json(state, indent=2)),
+        ("encode json", lambda: json.dumps(state)),
+        (f"encode _json ({encoder})", lambda: _json.dumps(state)),
+    ):
+        func()
+        seconds = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        print(f"{label:>24}: {seconds * 1000:7.3f} ms / response")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent tool latency with blocking vs. thread-offloaded HTTP.
+
+Starts the stub game server with a fixed per-request latency, then runs
+`--clients` concurrent `get_game_state`-style coroutines on one event loop:
+
+- blocking: calls `get_player()` directly, as async tools did before
+- offloaded: awaits `run_blocking(get_player)`, as async tools do now
+
+Usage:
+
+    uv run python scripts/bench_async_transport.py --clients 10 --latency-ms 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from stub_game_server import start_stub_server
+
+from terraforming_mars_mcp import turn_flow
+
+
+async def _blocking_call(player_id: str) -> None:
+    turn_flow.get_player(player_id)
+
+
+async def _offloaded_call(player_id: str) -> None:
+    await turn_flow.run_blocking(turn_flow.get_player, player_id)
+
+
+async def _run_clients(
+    call: Callable[[str], Awaitable[None]], clients: int
+) -> tuple[float, list[float]]:
+    # All clients issue their call at the same instant, so latency is measured
+    # from the shared start: a blocked loop shows up as queueing delay.
+    latencies: list[float] = []
+    started = time.perf_counter()
+
+    async def one(index: int) -> None:
+        await call(f"p-bench-{index}")
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(clients)))
+    return time.perf_counter() - started, latencies
+
+
+def _report(label: str, wall: float, latencies: list[float]) -> None:
+    print(
+        f"{label:>10}: wall {wall * 1000:8.1f} ms | "
+        f"median {statistics.median(latencies) * 1000:8.1f} ms | "
+        f"max {max(latencies) * 1000:8.1f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(latency_ms=args.latency_ms)
+    turn_flow.CFG.base_url = base_url
+    try:
+        print(
+            f"{args.clients} concurrent get_player calls, "
+            f"{args.latency_ms:.0f} ms server latency"
+        )
+        _report("blocking", *asyncio.run(_run_clients(_blocking_call, args.clients)))
+        _report("offloaded", *asyncio.run(_run_clients(_offloaded_call, args.clients)))
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Benchmark `build_agent_state` for a 5-player late-game position.
+
+Every player has `--tableau` played cards, we hold `--hand` cards, and the
+prompt is an `or` offering the hand, blue-card actions and selling
+patents. Times one full-detail auto-response with:
+
+- per call: the `card_info` cache cleared first, so every card's static
+  details are rebuilt as before memoization
+- memoized: static card details and `_compact_card` templates computed once
+  and shared
+
+and the same for `compact_cards` over every tableau and hand card alone.
+
+Uses the real card database when `submodules/tm-oss-server` is checked out,
+otherwise a synthetic one of the same shape.
+
+Usage:
+
+    uv run python scripts/bench_card_info.py --tableau 40 --hand 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from terraforming_mars_mcp import _cache_store, game_state
+from terraforming_mars_mcp import card_info as card_info_mod
+from terraforming_mars_mcp._card_db import compile_cards
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+
+_COLORS = ("red", "blue", "green", "yellow", "black")
+
+
+def _synthetic_cards(count: int) -> list[dict[str, Any]]:
+    tags = ("building", "space", "science", "power", "earth", "jovian", "plant")
+    return [
+        {
+            "name": f"Card {index}",
+            "tags": [tags[index % len(tags)], tags[(index * 3) % len(tags)]],
+            "cost": index % 35,
+            "victoryPoints": index % 3,
+            "requirements": [{"oxygen": index % 14}] if index % 4 == 0 else [],
+            "metadata": {
+                "description": f"Requires {index % 14}% oxygen. Gain {index} MC.",
+                "renderData": {
+                    "rows": [
+                        [f"Action: Spend 1 MC to add a resource to card {index}."]
+                        if index % 5 == 0
+                        else [],
+                        [f"Effect: When you play a tag, gain {index % 3} MC."]
+                        if index % 7 == 0
+                        else [],
+                        {"decorations": [{"size": "small"}] * 4},
+                    ]
+                },
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def _player_view(names: list[str], tableau: int, hand: int) -> PlayerViewModel:
+    def player(index: int) -> dict[str, Any]:
+        start = index * tableau
+        return {
+            "name": f"Player {index}",
+            "color": _COLORS[index],
+            "isActive": index == 0,
+            "terraformRating": 40 + index,
+            "megaCredits": 30,
+            "tableau": [
+                {"name": names[(start + offset) % len(names)], "resources": 2}
+                for offset in range(tableau)
+            ],
+        }
+
+    players = [player(index) for index in range(len(_COLORS))]
+    hand_cards = [
+        {"name": names[-1 - offset], "calculatedCost": 10 + offset % 20}
+        for offset in range(hand)
+    ]
+    blue_cards = [{"name": card["name"]} for card in players[0]["tableau"][:10]]
+    return PlayerViewModel.model_validate(
+        {
+            "id": "player-0",
+            "game": {
+                "id": "game-bench",
+                "phase": "action",
+                "generation": 11,
+                "temperature": 4,
+                "oxygenLevel": 12,
+                "oceans": 8,
+                "venusScaleLevel": 0,
+                "isTerraformed": False,
+                "gameAge": 900,
+                "undoCount": 0,
+            },
+            "players": players,
+            "thisPlayer": players[0],
+            "cardsInHand": hand_cards,
+            "waitingFor": {
+                "type": "or",
+                "title": "Take your first action",
+                "buttonLabel": "Take action",
+                "options": [
+                    {
+                        "type": "projectCard",
+                        "title": "Play project card",
+                        "buttonLabel": "Play card",
+                        "cards": hand_cards,
+                    },
+                    {
+                        "type": "card",
+                        "title": "Perform an action from a played card",
+                        "buttonLabel": "Take action",
+                        "selectBlueCardAction": True,
+                        "min": 1,
+                        "max": 1,
+                        "cards": blue_cards,
+                    },
+                    {
+                        "type": "card",
+                        "title": "Sell patents",
+                        "buttonLabel": "Sell",
+                        "min": 1,
+                        "max": hand,
+                        "cards": hand_cards,
+                    },
+                    {
+                        "type": "option",
+                        "title": "Pass for this generation",
+                        "buttonLabel": "Pass",
+                    },
+                ],
+            },
+        }
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tableau", type=int, default=40)
+    parser.add_argument("--hand", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    _cache_store.SNAPSHOT_DIR = None
+
+    index = card_info_mod._load_card_info_index()
+    source = "real cards.json"
+    if not index:
+        index = card_info_mod._CARD_INFO_INDEX = compile_cards(_synthetic_cards(600))
+        source = "synthetic card database"
+    names = sorted(index)
+    view = _player_view(names, args.tableau, args.hand)
+
+    def build() -> None:
+        # A fresh session cache each call, so every call renders full detail.
+        game_state._SESSION_CACHES.clear()
+        game_state.build_agent_state(view, auto_response=True)
+
+    def build_per_call() -> None:
+        card_info_mod._CARD_INFO_CACHE.clear()
+        build()
+
+    all_cards = [card for player in view.players for card in player.tableau]
+    all_cards += view.cardsInHand
+
+    def compact() -> None:
+        card_info_mod.compact_cards(all_cards)
+
+    def compact_per_call() -> None:
+        card_info_mod._CARD_INFO_CACHE.clear()
+        compact()
+
+    print(f"5 players x {args.tableau} tableau cards, {args.hand} in hand ({source})")
+    for label, func, what in (
+        ("per call", build_per_call, "build_agent_state"),
+        ("memoized", build, "build_agent_state"),
+        ("per call", compact_per_call, f"compact_cards({len(all_cards)})"),
+        ("memoized", compact, f"compact_cards({len(all_cards)})"),
+    ):
+        func()
+        seconds = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        print(f"{label:>9}: {seconds * 1000:7.3f} ms / {what}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark finding new game-log entries: JSON signatures vs. anchored diff.
+
+Builds a synthetic log page of `--entries` entries and times, per turn, going
+from the raw page the server returns to the new entries as models:
+
+- signatures: the old approach, validating the whole page and comparing one
+  sorted `json.dumps` per earlier and current entry
+- anchored: `entries_after` from the `LogAnchor` taken at the end of the
+  earlier read, validating only the new entries
+
+for an append-only turn and for an undo that replaced the last entry read.
+
+Usage:
+
+    uv run python scripts/bench_log_diff.py --entries 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from terraforming_mars_mcp._log_diff import LogAnchor, entries_after
+from terraforming_mars_mcp.api_response_models import (
+    GameLogEntryModel,
+    response_adapter,
+)
+
+_LOG_ADAPTER = response_adapter(list[GameLogEntryModel])
+
+
+def _entry(index: int, timestamp: int | None = None) -> dict[str, Any]:
+    if timestamp is None:
+        timestamp = 1_700_000_000_000 + index * 250
+    return {
+        "timestamp": timestamp,
+        "message": "${0} played ${1}",
+        "data": [
+            {"type": 2, "value": ("red", "blue", "green")[index % 3]},
+            {"type": 3, "value": f"Card {index}"},
+        ],
+    }
+
+
+def _signature(entry: GameLogEntryModel) -> str:
+    return json.dumps(
+        {
+            "timestamp": entry.timestamp,
+            "message": entry.message,
+            "data": [datum.model_dump(exclude_none=True) for datum in entry.data],
+            "type": entry.type,
+            "playerId": entry.playerId,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _signature_diff(
+    initial: Sequence[GameLogEntryModel], page: list[dict[str, Any]]
+) -> list[GameLogEntryModel]:
+    seen = {_signature(entry) for entry in initial}
+    final = _LOG_ADAPTER.validate_python(page)
+    return [entry for entry in final if _signature(entry) not in seen]
+
+
+def _anchored_diff(
+    anchor: LogAnchor, page: list[dict[str, Any]]
+) -> list[GameLogEntryModel]:
+    return _LOG_ADAPTER.validate_python(entries_after(page, anchor))
+
+
+def _time(diff: Callable[[], list[GameLogEntryModel]], repeat: int) -> float:
+    return min(timeit.repeat(diff, number=1, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--new", type=int, default=20, help="entries added per turn")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    log = [_entry(i) for i in range(args.entries + args.new)]
+    read = log[: args.entries]
+    initial = _LOG_ADAPTER.validate_python(read)
+    anchor = LogAnchor.at_end_of(read)
+    # Undo replaced the last entry read before the new ones were added.
+    redo = _entry(10**6, timestamp=read[-1]["timestamp"] + 1)
+    cases = {
+        "append": log,
+        "undo": [*read[:-1], redo, *log[args.entries :]],
+    }
+    print(f"{args.entries} entries read, {args.new} new per turn")
+    for name, page in cases.items():
+        assert _signature_diff(initial, page) == _anchored_diff(anchor, page)
+        old = _time(lambda page=page: _signature_diff(initial, page), args.repeat)
+        new = _time(lambda page=page: _anchored_diff(anchor, page), args.repeat)
+        print(
+            f"{name:>7}: signatures {old * 1000:7.2f} ms | "
+            f"anchored {new * 1000:7.2f} ms | {old / new:5.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
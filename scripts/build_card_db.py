@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Compile cards.json into the card-database artifact and time cold loads.
+
+Writes the artifact `card_info` loads on first use (``TM_CARD_DB_PATH`` or
+`--output`), then reports how long a cold start takes parsing cards.json
+versus loading the artifact, and the size of each.
+
+Usage:
+
+    uv run python scripts/build_card_db.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from terraforming_mars_mcp import _card_db
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards-file", type=Path, default=_card_db.CARDS_FILE)
+    parser.add_argument("--output", type=Path, default=_card_db.ARTIFACT_PATH)
+    args = parser.parse_args()
+
+    if not args.cards_file.exists():
+        print(f"{args.cards_file} not found; check out submodules/tm-oss-server")
+        return 1
+    if args.output is None:
+        print("No artifact path: set TM_CARD_DB_PATH or pass --output")
+        return 1
+    args.output.unlink(missing_ok=True)
+
+    started = time.perf_counter()
+    raw = json.loads(args.cards_file.read_text(encoding="utf-8"))
+    parse_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    cards = _card_db.load_card_db(args.cards_file, args.output)
+    compile_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    reloaded = _card_db.load_card_db(args.cards_file, args.output)
+    load_seconds = time.perf_counter() - started
+
+    assert reloaded == cards
+    print(f"{len(cards)} cards ({len(raw)} in source) -> {args.output}")
+    print(
+        f"cards.json: {args.cards_file.stat().st_size / 1e6:.1f} MB, "
+        f"json.loads {parse_seconds * 1000:.0f} ms"
+    )
+    print(
+        f"artifact:   {args.output.stat().st_size / 1e6:.1f} MB, "
+        f"load {load_seconds * 1000:.0f} ms (compile {compile_seconds * 1000:.0f} ms)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
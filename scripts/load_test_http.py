@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Load-test one MCP server process over streamable HTTP with many agents.
+
+Starts the stub game server in-process and `terraforming_mars_mcp.server
+--transport streamable-http` as a subprocess, then connects `--clients` MCP
+clients at once. Each configures its own player ID and plays `--rounds`
+rounds of get_game_state / get_my_hand_cards / choose_or_option("End Turn").
+Reports per-call latency, errors, and whether every client only ever saw its
+own player.
+
+Usage:
+
+    uv run python scripts/load_test_http.py --clients 50 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from stub_game_server import start_stub_server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"MCP server did not open port {port}")
+
+
+def _payload(result: Any) -> dict[str, Any]:
+    if result.isError:
+        raise RuntimeError(result.content[0].text if result.content else "tool error")
+    if result.structuredContent is not None:
+        return dict(result.structuredContent)
+    return json.loads(result.content[0].text)
+
+
+async def _client(
+    url: str, index: int, rounds: int, latencies: list[float]
+) -> tuple[int, bool]:
+    """Run one agent; returns (errors, saw only its own player)."""
+    player_id = f"p-load-{index}"
+    errors = 0
+    isolated = True
+    calls: list[tuple[str, dict[str, Any]]] = [
+        ("get_game_state", {}),
+        ("get_my_hand_cards", {}),
+        ("choose_or_option", {"option_name": "End Turn"}),
+    ]
+    async with (
+        streamablehttp_client(url) as (read, write, _),
+        ClientSession(read, write) as session,
+    ):
+        await session.initialize()
+        configured = _payload(
+            await session.call_tool("configure_session", {"player_id": player_id})
+        )
+        isolated &= configured["player_id"] == player_id
+        for _ in range(rounds):
+            for name, arguments in calls:
+                started = time.perf_counter()
+                try:
+                    payload = _payload(await session.call_tool(name, arguments))
+                except RuntimeError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+                seen = payload.get("session", {}).get("player_id")
+                if seen is not None:
+                    isolated &= seen == player_id
+    return errors, isolated
+
+
+async def _run(url: str, clients: int, rounds: int) -> int:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(url, i, rounds, latencies) for i in range(clients)),
+        return_exceptions=True,
+    )
+    wall = time.perf_counter() - started
+    failed_clients = [r for r in results if isinstance(r, BaseException)]
+    outcomes = [r for r in results if not isinstance(r, BaseException)]
+    errors = sum(errors for errors, _ in outcomes)
+    leaked = sum(1 for _, isolated in outcomes if not isolated)
+    ordered = sorted(latencies)
+    print(
+        f"{clients} clients x {rounds} rounds: {len(latencies)} calls in "
+        f"{wall:.2f}s ({len(latencies) / wall:.0f} calls/s)"
+    )
+    if ordered:
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(
+            f"latency: median {statistics.median(ordered) * 1000:.1f} ms | "
+            f"p95 {p95 * 1000:.1f} ms | max {ordered[-1] * 1000:.1f} ms"
+        )
+    print(
+        f"tool errors {errors} | failed clients {len(failed_clients)} | "
+        f"clients that saw another player {leaked}"
+    )
+    for failure in failed_clients[:3]:
+        print(f"  {type(failure).__name__}: {failure}")
+    return 0 if not (errors or failed_clients or leaked) else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    stub, base_url = start_stub_server(latency_ms=args.latency_ms)
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "terraforming_mars_mcp.server",
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+            "--base-url",
+            base_url,
+            "--log-level",
+            "WARNING",
+        ],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_port(port)
+        return asyncio.run(
+            _run(f"http://127.0.0.1:{port}/mcp", args.clients, args.rounds)
+        )
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        stub.shutdown()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Minimal stand-in for the TM OSS HTTP API, for benchmarks and load tests.
+
+Serves `/api/player`, `/api/waitingfor`, `/api/game/logs` and `/player/input`
+for any player ID with a fixed two-player action-phase game. Every response
+is delayed by `--latency-ms` to emulate the real server's work.
+
+Run standalone:
+
+    python scripts/stub_game_server.py --port 8080 --latency-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+
+def player_view(player_id: str, game_age: int = 10) -> dict[str, Any]:
+    game = {
+        "id": "g-stub",
+        "phase": "action",
+        "generation": 3,
+        "temperature": -24,
+        "oxygenLevel": 2,
+        "oceans": 1,
+        "venusScaleLevel": 0,
+        "isTerraformed": False,
+        "gameAge": game_age,
+        "undoCount": 0,
+        "passedPlayers": [],
+        "spaces": [
+            {
+                "id": f"{i:02d}",
+                "x": i % 9,
+                "y": i // 9,
+                "spaceType": "land",
+                "bonus": [1],
+            }
+            for i in range(1, 62)
+        ],
+        "milestones": [],
+        "awards": [],
+    }
+    me = {
+        "name": "Me",
+        "color": "red",
+        "isActive": True,
+        "megacredits": 30,
+        "tableau": [{"name": "Sponsors"}],
+    }
+    other = {"name": "Opponent", "color": "blue", "isActive": False}
+    return {
+        "id": player_id,
+        "game": game,
+        "players": [me, other],
+        "thisPlayer": me,
+        "cardsInHand": [{"name": "Comet", "calculatedCost": 21}],
+        "waitingFor": {
+            "type": "or",
+            "title": "Take your first action",
+            "buttonLabel": "OK",
+            "options": [
+                {"type": "option", "title": "End Turn", "buttonLabel": "OK"},
+                {
+                    "type": "option",
+                    "title": "Pass for this generation",
+                    "buttonLabel": "Pass",
+                    "warnings": ["pass"],
+                },
+            ],
+        },
+    }
+
+
+class StubGameHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency_seconds = 0.0
+
+    def _reply(self, payload: Any) -> None:
+        time.sleep(self.latency_seconds)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        player_id = parse_qs(url.query).get("id", ["p-stub"])[0]
+        if url.path == "/api/player":
+            self._reply(player_view(player_id))
+        elif url.path == "/api/waitingfor":
+            self._reply({"result": "GO", "waitingFor": []})
+        elif url.path == "/api/game/logs":
+            self._reply([])
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        player_id = parse_qs(url.query).get("id", ["p-stub"])[0]
+        if url.path == "/player/input":
+            self._reply(player_view(player_id, game_age=11))
+        else:
+            self.send_error(404)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+def start_stub_server(
+    port: int = 0, latency_ms: float = 0.0
+) -> tuple[ThreadingHTTPServer, str]:
+    """Start the stub in a daemon thread; returns the server and its base URL."""
+    handler = type(
+        "ConfiguredStubGameHandler",
+        (StubGameHandler,),
+        {"latency_seconds": latency_ms / 1000.0},
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stub TM OSS game server")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    server, base_url = start_stub_server(args.port, args.latency_ms)
+    print(f"Stub game server on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+"""Size- and idle-bounded caches for per-game state in a long-running server.
+
+Module-level per-game dicts (`game_state`'s session caches, `observed_cards`'
+draft state, named sessions) would otherwise grow by one entry per game
+played. `BoundedCache` keeps the dict interface they already use, evicts the
+least recently used entry past ``max_entries`` and anything idle for longer
+than ``idle_ttl`` seconds, and counts hits, misses and evictions;
+`cache_stats()` reports every live cache by name.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import Generic, TypeVar
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("TM_CACHE_MAX_ENTRIES", "512"))
+DEFAULT_IDLE_TTL_SECONDS = float(os.environ.get("TM_CACHE_IDLE_SECONDS", "21600"))
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+_CACHES: weakref.WeakValueDictionary[str, BoundedCache[object, object]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class BoundedCache(MutableMapping[_K, _V], Generic[_K, _V]):
+    """A thread-safe LRU mapping whose entries also expire after idling."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.name = name
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (value, last access); least recently used first.
+        self._entries: OrderedDict[_K, tuple[_V, float]] = OrderedDict()
+        self._lock = threading.RLock()
+        _CACHES[name] = self  # type: ignore[assignment]
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            key, (_, last_access) = next(iter(self._entries.items()))
+            if now - last_access <= self.idle_ttl:
+                return
+            del self._entries[key]
+            self.evictions += 1
+
+    def _lookup(self, key: _K, now: float) -> tuple[_V, float] | None:
+        self._expire(now)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries[key] = (entry[0], now)
+        self._entries.move_to_end(key)
+        return entry
+
+    def __getitem__(self, key: _K) -> _V:
+        with self._lock:
+            entry = self._lookup(key, time.monotonic())
+            if entry is None:
+                raise KeyError(key)
+            return entry[0]
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._entries[key] = (value, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __delitem__(self, key: _K) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[_K]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def setdefault(self, key: _K, default: _V) -> _V:  # type: ignore[override]
+        with self._lock:
+            entry = self._lookup(key, time.monotonic())
+            if entry is not None:
+                return entry[0]
+            self[key] = default
+            return default
+
+    def evict(self, key: _K) -> None:
+        """Drop ``key`` if present, counting it as an eviction."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            self._expire(time.monotonic())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Counters of every live `BoundedCache`, keyed by cache name."""
+    return {name: cache.stats() for name, cache in sorted(_CACHES.items())}
@@ -0,0 +1,127 @@
+"""On-disk snapshots of per-(game, player) caches, for warm restarts.
+
+`game_state` remembers what it already sent each agent (game constants,
+milestone snapshot, opponent tableaux, card-detail tracker). A restarted
+server would otherwise resend all of it, so each of those caches is also
+written to ``<dir>/<game_id>/<player_id>.json`` and read back the first time
+that game and player are seen again.
+
+Writes go to a temporary file that then replaces the snapshot, so a crash
+never leaves a torn file; unreadable or foreign snapshots are ignored.
+``TM_CACHE_SNAPSHOT_DIR`` picks the directory (empty disables snapshots), and
+snapshots untouched for ``TM_CACHE_SNAPSHOT_MAX_AGE_SECONDS`` are pruned the
+first time the store is used. Within a generation `game_state` rewrites a
+snapshot at most every ``TM_CACHE_SNAPSHOT_INTERVAL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from . import _json
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+
+_DEFAULT_DIR = str(
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "terraforming-mars-mcp"
+    / "session-caches"
+)
+_configured_dir = os.environ.get("TM_CACHE_SNAPSHOT_DIR", _DEFAULT_DIR)
+SNAPSHOT_DIR: Path | None = Path(_configured_dir) if _configured_dir else None
+MAX_AGE_SECONDS = float(
+    os.environ.get("TM_CACHE_SNAPSHOT_MAX_AGE_SECONDS", str(7 * 24 * 3600))
+)
+SAVE_INTERVAL_SECONDS = float(
+    os.environ.get("TM_CACHE_SNAPSHOT_INTERVAL_SECONDS", "30")
+)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+_prune_lock = threading.Lock()
+_pruned_dirs: set[Path] = set()
+
+
+def _path_part(value: str) -> str:
+    return _UNSAFE_CHARS.sub("_", value) or "_"
+
+
+def snapshot_path(game_id: str, player_id: str) -> Path | None:
+    if SNAPSHOT_DIR is None:
+        return None
+    return SNAPSHOT_DIR / _path_part(game_id) / f"{_path_part(player_id)}.json"
+
+
+def _prune_once(root: Path) -> None:
+    with _prune_lock:
+        if root in _pruned_dirs:
+            return
+        _pruned_dirs.add(root)
+    cutoff = time.time() - MAX_AGE_SECONDS
+    for path in root.glob("*/*.json"):
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                with contextlib.suppress(OSError):
+                    path.parent.rmdir()
+
+
+def load_snapshot(game_id: str, player_id: str) -> dict[str, Any] | None:
+    """The data last saved for this game and player, if there is a usable one."""
+    path = snapshot_path(game_id, player_id)
+    if path is None:
+        return None
+    _prune_once(path.parents[1])
+    try:
+        raw = _json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.info("Ignoring unreadable cache snapshot %s: %s", path, exc)
+        return None
+    if not isinstance(raw, dict) or raw.get("format") != SNAPSHOT_FORMAT:
+        return None
+    data = raw.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def save_snapshot(game_id: str, player_id: str, data: dict[str, Any]) -> None:
+    """Atomically replace the snapshot for this game and player with ``data``."""
+    path = snapshot_path(game_id, player_id)
+    if path is None:
+        return
+    payload = _json.dumps({"format": SNAPSHOT_FORMAT, "data": data}, sort_keys=True)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError as exc:
+        logger.warning("Could not write cache snapshot %s: %s", path, exc)
+
+
+def discard_snapshot(game_id: str, player_id: str) -> None:
+    path = snapshot_path(game_id, player_id)
+    if path is None:
+        return
+    with contextlib.suppress(OSError):
+        path.unlink(missing_ok=True)
+        # Only succeeds once the game's last player snapshot is gone.
+        path.parent.rmdir()
@@ -0,0 +1,196 @@
+"""Compiled card database: only the fields `card_info` reads from cards.json.
+
+`submodules/tm-oss-server/src/genfiles/cards.json` is several megabytes,
+mostly `renderData` trees that are only ever searched for their "Action:" /
+"Effect:" strings. `load_card_db()` compiles it into one `CardRecord` per card
+with those strings pre-extracted, and caches the result as a pickle
+(``TM_CARD_DB_PATH``; by default ``terraforming-mars-mcp/card-db.pickle``
+under ``$XDG_CACHE_HOME`` or ``~/.cache``; empty disables it). The artifact
+records its format version and the source's path, size and mtime and is
+rebuilt when any of them changes, or when it cannot be read, so later cold
+starts are a single `pickle.loads`. `scripts/build_card_db.py` compiles it ahead of time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+CARD_DB_FORMAT = 2
+
+CARDS_FILE = (
+    Path(__file__).resolve().parents[1]
+    / "submodules"
+    / "tm-oss-server"
+    / "src"
+    / "genfiles"
+    / "cards.json"
+)
+_configured_path = os.environ.get(
+    "TM_CARD_DB_PATH",
+    str(
+        Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        / "terraforming-mars-mcp"
+        / "card-db.pickle"
+    ),
+)
+ARTIFACT_PATH: Path | None = Path(_configured_path) if _configured_path else None
+
+
+class CardRecord(NamedTuple):
+    name: str
+    tags: tuple[str, ...]
+    cost: int | None
+    # Raw `victoryPoints` value; `card_info.format_vp` renders it.
+    victory_points: Any
+    description: str | None
+    requirements: tuple[dict[str, Any], ...]
+    effects: tuple[str, ...]
+    actions: tuple[str, ...]
+    # e.g. "event", "automated", "active", "corporation", "prelude".
+    card_type: str | None = None
+    # Expansion the card belongs to, e.g. "base", "venus", "colonies".
+    module: str | None = None
+
+
+def _render_texts(render_data: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """The "Effect:" and "Action:" strings of a renderData tree, in BFS order."""
+    effects: list[str] = []
+    actions: list[str] = []
+    queue: deque[Any] = deque([render_data])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, str):
+            if node.startswith("Action:"):
+                actions.append(node)
+            elif node.startswith("Effect:"):
+                effects.append(node)
+        elif isinstance(node, list):
+            queue.extend(node)
+        elif isinstance(node, dict):
+            queue.extend(node.values())
+    return tuple(effects), tuple(actions)
+
+
+def compile_card(card: dict[str, Any]) -> CardRecord:
+    raw_tags = card.get("tags")
+    raw_metadata = card.get("metadata")
+    metadata = raw_metadata if isinstance(raw_metadata, dict) else {}
+    raw_description = metadata.get("description")
+    if isinstance(raw_description, dict):
+        raw_description = raw_description.get("text")
+    render_data = metadata.get("renderData")
+    effects, actions = (
+        _render_texts(render_data) if render_data is not None else ((), ())
+    )
+    requirements = card.get("requirements")
+    card_type = card.get("type")
+    module = card.get("module")
+    return CardRecord(
+        name=card["name"],
+        tags=tuple(raw_tags) if isinstance(raw_tags, list) else (),
+        cost=card.get("cost"),
+        victory_points=card.get("victoryPoints"),
+        description=raw_description if isinstance(raw_description, str) else None,
+        requirements=tuple(requirements) if isinstance(requirements, list) else (),
+        effects=effects,
+        actions=actions,
+        card_type=card_type if isinstance(card_type, str) else None,
+        module=module if isinstance(module, str) else None,
+    )
+
+
+def compile_cards(raw: object) -> dict[str, CardRecord]:
+    """Compile the parsed cards.json list into records keyed by card name."""
+    if not isinstance(raw, list):
+        return {}
+    return {
+        item["name"]: compile_card(item)
+        for item in raw
+        if isinstance(item, dict) and isinstance(item.get("name"), str)
+    }
+
+
+def _read_artifact(
+    path: Path, source: tuple[str, int, int]
+) -> dict[str, CardRecord] | None:
+    try:
+        with path.open("rb") as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ValueError,
+    ) as exc:
+        # A truncated or foreign pickle: rebuild it.
+        logger.info("Rebuilding unreadable card database %s: %s", path, exc)
+        return None
+    if (
+        not isinstance(artifact, dict)
+        or artifact.get("format") != CARD_DB_FORMAT
+        or artifact.get("source") != source
+    ):
+        return None
+    return artifact["cards"]
+
+
+def _write_artifact(
+    path: Path, source: tuple[str, int, int], cards: dict[str, CardRecord]
+) -> None:
+    payload = pickle.dumps(
+        {"format": CARD_DB_FORMAT, "source": source, "cards": cards},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError as exc:
+        logger.warning("Could not write card database %s: %s", path, exc)
+
+
+def load_card_db(
+    cards_file: Path = CARDS_FILE, artifact_path: Path | None = None
+) -> dict[str, CardRecord]:
+    """Card records by name, from the compiled artifact when it is current.
+
+    Returns an empty database when ``cards_file`` does not exist (submodule
+    not checked out). ``artifact_path`` defaults to `ARTIFACT_PATH`.
+    """
+    if artifact_path is None:
+        artifact_path = ARTIFACT_PATH
+    try:
+        stat = cards_file.stat()
+    except FileNotFoundError:
+        return {}
+    source = (str(cards_file.resolve()), stat.st_size, stat.st_mtime_ns)
+    if artifact_path is not None:
+        cards = _read_artifact(artifact_path, source)
+        if cards is not None:
+            return cards
+    cards = compile_cards(json.loads(cards_file.read_text(encoding="utf-8")))
+    if artifact_path is not None:
+        _write_artifact(artifact_path, source, cards)
+    return cards
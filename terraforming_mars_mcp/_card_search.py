@@ -0,0 +1,157 @@
+"""Inverted indexes over the card database for `search_cards`.
+
+Each index maps a value (a tag, a cost bucket, a requirement kind, a VP kind,
+a card type, an effect keyword) to a posting set of card IDs from
+`_card_table.CardTable`, stored as one Python int with bit ``i`` set for card
+``i``. A query ANDs the posting sets of its filters, so it never visits cards
+that cannot match; set bits come out in ID order, which is name order.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping, Sequence
+
+from ._card_db import CardRecord
+from ._card_table import NO_COST, CardTable, requirement_kind
+
+COST_BUCKET = 5
+_WORD = re.compile(r"[a-z0-9]+")
+# Too common in card texts to narrow a search.
+_STOP_WORDS = frozenset(
+    {"a", "an", "and", "any", "for", "from", "in", "of", "on", "or", "the", "to"}
+)
+
+
+def keyword_tokens(text: str) -> list[str]:
+    """Lowercased words of ``text``, with a plural "s" dropped ("tags" -> "tag")."""
+    tokens: list[str] = []
+    for word in _WORD.findall(text.lower()):
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def _add(index: dict[str, int], key: str, bit: int) -> None:
+    index[key] = index.get(key, 0) | bit
+
+
+def iter_ids(posting: int) -> Iterator[int]:
+    """Card IDs of a posting set, ascending."""
+    while posting:
+        low = posting & -posting
+        yield low.bit_length() - 1
+        posting ^= low
+
+
+class CardSearchIndex:
+    """Posting sets of card IDs for every searchable card attribute."""
+
+    def __init__(self, table: CardTable, records: Mapping[str, CardRecord]) -> None:
+        self.table = table
+        self.all = (1 << len(table)) - 1
+        self.by_tag: dict[str, int] = {}
+        self.by_cost_bucket: dict[int, int] = {}
+        self.by_requirement: dict[str, int] = {}
+        self.by_vp_kind: dict[str, int] = {}
+        self.by_card_type: dict[str, int] = {}
+        self.by_keyword: dict[str, int] = {}
+        for card_id, name in enumerate(table.names):
+            bit = 1 << card_id
+            record = records[name]
+            for tag in record.tags:
+                _add(self.by_tag, tag, bit)
+            cost = table.cost[card_id]
+            if cost != NO_COST:
+                bucket = cost // COST_BUCKET
+                self.by_cost_bucket[bucket] = self.by_cost_bucket.get(bucket, 0) | bit
+            for descriptor in record.requirements:
+                if isinstance(descriptor, Mapping):
+                    kind = requirement_kind(descriptor)[0]
+                    _add(self.by_requirement, kind, bit)
+                    if kind.startswith("tag:"):
+                        _add(self.by_requirement, "tag", bit)
+            vp_kind = table.vp_kinds[table.vp_kind[card_id]]
+            if vp_kind:
+                _add(self.by_vp_kind, vp_kind, bit)
+            card_type = table.card_types[table.card_type[card_id]]
+            if card_type:
+                _add(self.by_card_type, card_type, bit)
+            texts = (record.description or "", *record.effects, *record.actions)
+            for token in set(keyword_tokens(" ".join(texts))):
+                _add(self.by_keyword, token, bit)
+
+    def _cost_range(self, min_cost: int | None, max_cost: int | None) -> int:
+        low = 0 if min_cost is None else max(min_cost, 0)
+        high = max(self.by_cost_bucket, default=0) * COST_BUCKET + COST_BUCKET - 1
+        if max_cost is not None:
+            high = min(high, max_cost)
+        posting = 0
+        cost = self.table.cost
+        for bucket in range(low // COST_BUCKET, high // COST_BUCKET + 1):
+            members = self.by_cost_bucket.get(bucket, 0)
+            start = bucket * COST_BUCKET
+            if start < low or start + COST_BUCKET - 1 > high:
+                # A bucket straddling a bound: check its cards one by one.
+                for card_id in iter_ids(members):
+                    if not low <= cost[card_id] <= high:
+                        members &= ~(1 << card_id)
+            posting |= members
+        return posting
+
+    def search(
+        self,
+        tags: Sequence[str] = (),
+        min_cost: int | None = None,
+        max_cost: int | None = None,
+        requirement: str | None = None,
+        vp_kind: str | None = None,
+        card_type: str | None = None,
+        keywords: str | None = None,
+    ) -> int:
+        """The posting set of cards matching every given filter.
+
+        ``tags`` must all be on the card; ``keywords`` must all appear in its
+        description, effects or actions. Raises `ValueError` for a tag,
+        requirement, VP kind or card type no card has.
+        """
+        posting = self.all
+        if not posting:
+            return 0
+        for tag in tags:
+            posting &= _lookup(self.by_tag, tag, "tag")
+        if min_cost is not None or max_cost is not None:
+            posting &= self._cost_range(min_cost, max_cost)
+        if requirement is not None:
+            posting &= _lookup(self.by_requirement, requirement, "requirement")
+        if vp_kind is not None:
+            posting &= _lookup(self.by_vp_kind, vp_kind, "vp_kind")
+        if card_type is not None:
+            posting &= _lookup(self.by_card_type, card_type, "card_type")
+        if keywords:
+            for token in keyword_tokens(keywords):
+                posting &= self.by_keyword.get(token, 0)
+        return posting
+
+    def names(
+        self, posting: int, offset: int = 0, limit: int | None = None
+    ) -> list[str]:
+        """Names of the cards in ``posting``, in name order, paged."""
+        names: list[str] = []
+        for position, card_id in enumerate(iter_ids(posting)):
+            if limit is not None and len(names) >= limit:
+                break
+            if position >= offset:
+                names.append(self.table.names[card_id])
+        return names
+
+
+def _lookup(index: Mapping[str, int], value: str, what: str) -> int:
+    posting = index.get(value)
+    if posting is None:
+        known = ", ".join(sorted(index))
+        raise ValueError(f"Unknown {what} {value!r}; expected one of: {known}")
+    return posting
@@ -0,0 +1,91 @@
+"""Dense integer card IDs and one array per card attribute.
+
+`CardTable` interns every card of the `_card_db` records to an ID (its row)
+and stores base cost, card type and VP kind as `array` columns, plus each
+card's compiled `_requirements.Requirement`s. `_card_search` builds its
+posting sets over these IDs and `_requirements.evaluate_hand` checks a hand
+by ID, instead of per-card dict lookups and string comparisons.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from ._card_db import CardRecord
+from ._requirements import Requirement, compile_requirement, compile_requirements
+
+NO_COST = -1
+
+
+class _Interner:
+    """Assigns small integer codes to strings; code 0 is reserved for None."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = [""]
+
+    def __call__(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def vp_kind(victory_points: Any) -> str | None:
+    """How a card scores: "fixed", "special", or what it counts per VP."""
+    if isinstance(victory_points, bool) or victory_points in (None, 0):
+        return None
+    if isinstance(victory_points, (int, float)):
+        return "fixed"
+    if isinstance(victory_points, str):
+        return victory_points
+    if isinstance(victory_points, dict):
+        for kind in ("resourcesHere", "tag", "cities", "colonies", "moon"):
+            if kind in victory_points:
+                return kind
+    return "other"
+
+
+def requirement_kind(descriptor: Mapping[str, Any]) -> tuple[str, int, bool]:
+    """A requirement's kind, threshold and whether it is a maximum.
+
+    Tag requirements are qualified by tag (``"tag:science"``); requirements
+    without a numeric value (a ruling party, a production) have threshold 1.
+    """
+    requirement = compile_requirement(descriptor)
+    kind = requirement.kind
+    if kind == "tag" and requirement.subject is not None:
+        kind = f"tag:{requirement.subject}"
+    return kind, requirement.threshold, requirement.is_max
+
+
+class CardTable:
+    """The card database as columns indexed by card ID."""
+
+    def __init__(self, records: Iterable[CardRecord]) -> None:
+        rows = sorted(records, key=lambda record: record.name)
+        self.names: tuple[str, ...] = tuple(record.name for record in rows)
+        self.ids: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+        card_types, vp_kinds = _Interner(), _Interner()
+        self.cost = array("h")
+        self.card_type = array("B")
+        self.vp_kind = array("B")
+        # Every play requirement of each card, compiled for `_requirements`.
+        self.requirements: list[tuple[Requirement, ...]] = []
+        for record in rows:
+            self.cost.append(record.cost if isinstance(record.cost, int) else NO_COST)
+            self.card_type.append(card_types(record.card_type))
+            self.vp_kind.append(vp_kinds(vp_kind(record.victory_points)))
+            self.requirements.append(compile_requirements(record.requirements))
+        # Code -> value for each interned column; index 0 means none.
+        self.card_types = tuple(card_types.values)
+        self.vp_kinds = tuple(vp_kinds.values)
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -0,0 +1,43 @@
+"""Keyed state diffs for delta-mode agent responses.
+
+A delta is a JSON merge patch (RFC 7396) between two states: a key with a
+changed scalar or list holds its new value, a key whose dict changed holds a
+patch of that dict, and a key that disappeared holds ``null``. Lists are
+replaced whole, so `game_state` keys the sections where one entry changes at
+a time (opponents) by a stable identity instead of position. Agent states
+never contain ``null`` values themselves (`omit_empty` drops them), so
+``null`` is unambiguous.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_MISSING = object()
+
+
+def merge_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """The patch turning ``old`` into ``new``; empty when they are equal."""
+    patch: dict[str, Any] = {key: None for key in old if key not in new}
+    for key, value in new.items():
+        previous = old.get(key, _MISSING)
+        if previous == value:
+            continue
+        if isinstance(value, dict) and isinstance(previous, dict):
+            patch[key] = merge_patch(previous, value)
+        else:
+            patch[key] = value
+    return patch
+
+
+def apply_merge_patch(target: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """A copy of ``target`` with ``patch`` applied, as a client would."""
+    result = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = apply_merge_patch(result[key], value)
+        else:
+            result[key] = value
+    return result
@@ -81,11 +81,23 @@ def action_tools_for_input_type(input_type: str | None) -> list[str]:
     return [tool.value, ToolName.SUBMIT_RAW_ENTITY.value]
 
 
+def omit_empty(fields: dict[str, Any]) -> dict[str, Any]:
+    """``fields`` without None values and empty lists, one level deep.
+
+    Response payloads are built from parts that are already free of empty
+    values, so each dict is filtered once as it is constructed rather than
+    re-walking finished subtrees. Other falsy values are kept, as in
+    `strip_empty`.
+    """
+    return {k: v for k, v in fields.items() if v is not None and v != []}
+
+
 def strip_empty(obj: Any) -> Any:
     """Recursively strip None values and empty lists from dicts.
 
     Leaves other falsy values (0, False, empty strings) untouched since they
-    carry semantic meaning in game state payloads.
+    carry semantic meaning in game state payloads. For raw server payloads;
+    payloads built here use `omit_empty` as they are constructed.
     """
     if isinstance(obj, dict):
         return {k: strip_empty(v) for k, v in obj.items() if v is not None and v != []}
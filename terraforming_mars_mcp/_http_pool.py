@@ -0,0 +1,201 @@
+"""Keep-alive HTTP/1.1 connection pooling for the game-server client."""
+
+from __future__ import annotations
+
+import http.client
+import os
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from urllib import parse
+
+# Node's default server keepAliveTimeout is 5s; evicting a little earlier keeps
+# us from reusing a socket the game server is about to close.
+DEFAULT_POOL_SIZE = int(os.environ.get("TM_HTTP_POOL_SIZE", "4"))
+DEFAULT_IDLE_TIMEOUT_SECONDS = float(os.environ.get("TM_HTTP_POOL_IDLE_SECONDS", "4"))
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+
+# Errors that mean a pooled socket was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class _StaleConnection(Exception):
+    def __init__(self, error: OSError, sent: bool) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.sent = sent
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    body: bytes
+
+
+@dataclass
+class _IdleConnection:
+    conn: http.client.HTTPConnection
+    released_at: float
+
+
+class HttpConnectionPool:
+    """Persistent connections to a single server origin.
+
+    Up to ``max_size`` idle connections are kept for reuse; connections idle
+    longer than ``idle_timeout`` are closed instead of reused. Thread-safe, so
+    requests offloaded to worker threads can share one pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    ) -> None:
+        parsed = parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Unsupported server URL: {base_url}")
+        self.base_url = base_url
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path_prefix = parsed.path.rstrip("/")
+        self.max_size = max(0, max_size)
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: list[_IdleConnection] = []
+        self._lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=self.timeout
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection plus whether it was reused from the idle list."""
+        now = time.monotonic()
+        expired: list[http.client.HTTPConnection] = []
+        reused: http.client.HTTPConnection | None = None
+        with self._lock:
+            while self._idle:
+                # Most recently released first: the warmest socket.
+                idle = self._idle.pop()
+                if now - idle.released_at > self.idle_timeout:
+                    expired.append(idle.conn)
+                    continue
+                reused = idle.conn
+                break
+        for conn in expired:
+            conn.close()
+        if reused is not None:
+            return reused, True
+        return self._new_connection(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(_IdleConnection(conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _send(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[HttpResponse, bool]:
+        """Send a request and read the whole body; also report ``will_close``."""
+        sent = False
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            sent = True
+            resp = conn.getresponse()
+            return HttpResponse(resp.status, resp.read()), resp.will_close
+        except _STALE_CONNECTION_ERRORS as exc:
+            raise _StaleConnection(exc, sent) from exc
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> HttpResponse:
+        """Send one request over a pooled connection.
+
+        A request that fails on a reused connection is retried once on a fresh
+        one, since the server may have closed the socket while it sat idle.
+        Non-GET requests are only retried when the failure happened before the
+        request was sent, so a submitted action is never applied twice.
+        """
+        target = self._path_prefix + path
+        request_headers = {"Connection": "keep-alive", **(headers or {})}
+        conn, reused = self._acquire()
+        try:
+            try:
+                response, will_close = self._send(
+                    conn, method, target, body, request_headers
+                )
+            except _StaleConnection as stale:
+                conn.close()
+                if not reused or (stale.sent and method.upper() != "GET"):
+                    raise stale.error from None
+                conn = self._new_connection()
+                try:
+                    response, will_close = self._send(
+                        conn, method, target, body, request_headers
+                    )
+                except _StaleConnection as retry_stale:
+                    raise retry_stale.error from None
+        except BaseException:
+            conn.close()
+            raise
+        if will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return response
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            entry.conn.close()
+
+
+_POOLS: dict[str, HttpConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def pool_for(base_url: str) -> HttpConnectionPool:
+    """Return the shared pool for ``base_url``, creating it on first use."""
+    key = base_url.rstrip("/")
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = HttpConnectionPool(key)
+            _POOLS[key] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,30 @@
+"""JSON encoding for payloads this package writes itself.
+
+Uses orjson when it is installed (the ``fast-json`` extra) and the stdlib
+encoder otherwise; both produce compact output.
+"""
+
+from __future__ import annotations
+
+import json
+from types import ModuleType
+from typing import Any
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,74 @@
+"""Find the game-log entries logged after a point already read.
+
+A read is anchored by its last timestamp and the entries stamped with it,
+compared by content: the server caps a generation's log page at its latest
+entries, so positions shift between reads, and one action logs several
+entries in the same millisecond, so the timestamp alone is not enough.
+Entries removed by an undo simply no longer appear. Entries are the raw
+`/api/game/logs` dicts, so nothing before the anchor is validated.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value  # type: ignore[return-value]
+
+
+def entry_key(entry: Mapping[str, Any]) -> Hashable:
+    """Everything in a raw log entry, as a hashable value."""
+    return _freeze(dict(entry))
+
+
+def _timestamp(entry: Mapping[str, Any]) -> int | None:
+    timestamp = entry.get("timestamp")
+    return timestamp if isinstance(timestamp, int) else None
+
+
+class LogAnchor(NamedTuple):
+    """The end of a log read: its last timestamp and the entries stamped with it."""
+
+    last_timestamp: int | None = None
+    last_entries: tuple[Hashable, ...] = ()
+
+    @classmethod
+    def at_end_of(cls, page: Sequence[Mapping[str, Any]]) -> LogAnchor:
+        if not page:
+            return cls()
+        last_timestamp = _timestamp(page[-1])
+        last_entries: list[Hashable] = []
+        for entry in reversed(page):
+            if _timestamp(entry) != last_timestamp:
+                break
+            last_entries.append(entry_key(entry))
+        return cls(last_timestamp, tuple(last_entries))
+
+
+def entries_after(
+    page: Sequence[Mapping[str, Any]], anchor: LogAnchor
+) -> list[Mapping[str, Any]]:
+    """Entries of ``page`` logged after ``anchor``, in order."""
+    last_timestamp = anchor.last_timestamp
+    if last_timestamp is None:
+        return list(page)
+    consumed = Counter(anchor.last_entries)
+    new_entries: list[Mapping[str, Any]] = []
+    for entry in page:
+        timestamp = _timestamp(entry)
+        if timestamp is None or timestamp < last_timestamp:
+            continue
+        if timestamp == last_timestamp:
+            key = entry_key(entry)
+            if consumed[key]:
+                consumed[key] -= 1
+                continue
+        new_entries.append(entry)
+    return new_entries
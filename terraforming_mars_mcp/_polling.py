@@ -0,0 +1,124 @@
+"""Adaptive `/api/waitingfor` polling schedule and per-turn poll metrics."""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+from dataclasses import dataclass, field, replace
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """How often to poll `/api/waitingfor` while waiting for a turn.
+
+    The interval starts at ``min_interval`` and is multiplied by ``backoff``
+    after every ``WAIT`` up to ``max_interval``; a ``REFRESH`` (the game moved
+    but it is not our turn yet) drops it back to ``min_interval``. Each sleep is
+    spread by ``±jitter`` (a fraction) so many waiters don't poll in lockstep.
+    """
+
+    min_interval: float = 1.0
+    max_interval: float = 15.0
+    backoff: float = 1.5
+    jitter: float = 0.2
+
+    def __post_init__(self) -> None:
+        if self.min_interval <= 0:
+            raise ValueError("min_interval must be positive")
+        if self.max_interval < self.min_interval:
+            raise ValueError("max_interval must be >= min_interval")
+        if self.backoff < 1:
+            raise ValueError("backoff must be >= 1")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+
+    @classmethod
+    def from_env(cls) -> PollingPolicy:
+        defaults = cls()
+        return cls(
+            min_interval=float(
+                os.environ.get("TM_POLL_MIN_SECONDS", defaults.min_interval)
+            ),
+            max_interval=float(
+                os.environ.get("TM_POLL_MAX_SECONDS", defaults.max_interval)
+            ),
+            backoff=float(os.environ.get("TM_POLL_BACKOFF", defaults.backoff)),
+            jitter=float(os.environ.get("TM_POLL_JITTER", defaults.jitter)),
+        )
+
+    def with_overrides(
+        self, min_interval: float | None = None, max_interval: float | None = None
+    ) -> PollingPolicy:
+        new_min = self.min_interval if min_interval is None else min_interval
+        new_max = self.max_interval if max_interval is None else max_interval
+        # Raising only the floor should not trip the max >= min check.
+        if min_interval is not None and max_interval is None:
+            new_max = max(new_max, new_min)
+        return replace(self, min_interval=new_min, max_interval=new_max)
+
+    def schedule(self, rng: random.Random | None = None) -> PollSchedule:
+        return PollSchedule(self, rng or random.Random())
+
+
+@dataclass
+class PollSchedule:
+    """The evolving interval for one wait; feed it each poll's status."""
+
+    policy: PollingPolicy
+    rng: random.Random
+    interval: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.interval = self.policy.min_interval
+
+    def next_delay(self, status: str) -> float:
+        """Seconds to sleep after a poll that returned ``status``."""
+        if status == "WAIT":
+            delay = self.interval
+            self.interval = min(
+                self.interval * self.policy.backoff, self.policy.max_interval
+            )
+        else:
+            self.interval = self.policy.min_interval
+            delay = self.interval
+        spread = self.policy.jitter
+        return delay * (1 + self.rng.uniform(-spread, spread))
+
+
+@dataclass
+class PollMetrics:
+    """Running totals of `/api/waitingfor` polls across completed waits."""
+
+    waits: int = 0
+    polls: int = 0
+    max_polls_per_wait: int = 0
+    last_wait_polls: int = 0
+    # Polls answered from another seat's poll of the same game state.
+    shared_polls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_wait(self, polls: int) -> None:
+        with self._lock:
+            self.waits += 1
+            self.polls += polls
+            self.last_wait_polls = polls
+            self.max_polls_per_wait = max(self.max_polls_per_wait, polls)
+
+    def record_shared_poll(self) -> None:
+        with self._lock:
+            self.shared_polls += 1
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "waits": self.waits,
+                "polls": self.polls,
+                "polls_per_wait": self.polls / self.waits if self.waits else 0.0,
+                "max_polls_per_wait": self.max_polls_per_wait,
+                "last_wait_polls": self.last_wait_polls,
+                "shared_polls": self.shared_polls,
+            }
+
+
+POLL_METRICS = PollMetrics()
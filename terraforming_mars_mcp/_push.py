@@ -0,0 +1,168 @@
+"""Server-sent-events push channel that wakes turn waits early.
+
+The stock TM OSS server has no push endpoint, so this is opt-in: point
+``TM_PUSH_URL`` (or ``configure_session(push_url=...)``) at an SSE endpoint,
+with an optional ``{player_id}`` placeholder. Every event is treated as "the
+game may have moved"; events whose JSON ``data`` carries a ``gameAge`` no
+newer than the one being waited on are ignored. Turn waits still confirm
+through ``/api/waitingfor``, and fall back to plain polling whenever the
+channel cannot be opened or drops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import ssl
+from urllib import parse
+
+PUSH_CONNECT_TIMEOUT_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+class PushChannel:
+    """One open SSE stream; `wait` returns early when it signals a change."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._changed = asyncio.Event()
+        self._latest_age: int | None = None
+        # Highest age already reported by `wait`, so one event wakes one poll.
+        self._consumed_age: int | None = None
+        # Events without a gameAge, counted until `wait` reports them.
+        self._ageless_events = 0
+        self._consumed_ageless = 0
+        self.connected = True
+        self._task = asyncio.create_task(self._read_events())
+
+    @classmethod
+    async def connect(
+        cls, url: str, timeout: float = PUSH_CONNECT_TIMEOUT_SECONDS
+    ) -> PushChannel | None:
+        """Open the stream, or return None if the endpoint is unavailable."""
+        parsed = parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            logger.warning("Ignoring unsupported push URL %s", url)
+            return None
+        secure = parsed.scheme == "https"
+        port = parsed.port or (443 if secure else 80)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += "?" + parsed.query
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    parsed.hostname,
+                    port,
+                    ssl=ssl.create_default_context() if secure else None,
+                ),
+                timeout,
+            )
+        except (OSError, TimeoutError) as exc:
+            logger.info("Push endpoint %s unavailable: %s", url, exc)
+            return None
+        opened = False
+        try:
+            # HTTP/1.0 keeps the stream unchunked: the body is the raw event text.
+            writer.write(
+                (
+                    f"GET {target} HTTP/1.0\r\n"
+                    f"Host: {parsed.netloc}\r\n"
+                    "Accept: text/event-stream\r\n"
+                    "Cache-Control: no-cache\r\n\r\n"
+                ).encode("ascii")
+            )
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout)
+            parts = status_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[1] != "200":
+                logger.info("Push endpoint %s answered %r", url, status_line)
+                return None
+            while (await asyncio.wait_for(reader.readline(), timeout)).strip():
+                pass
+            opened = True
+        except (OSError, TimeoutError) as exc:
+            logger.info("Push endpoint %s unavailable: %s", url, exc)
+            return None
+        finally:
+            if not opened:
+                writer.close()
+        return cls(reader, writer)
+
+    def _dispatch(self, data: str) -> None:
+        age: int | None = None
+        try:
+            payload = json.loads(data) if data else None
+        except json.JSONDecodeError:
+            payload = None
+        if isinstance(payload, dict) and isinstance(payload.get("gameAge"), int):
+            age = payload["gameAge"]
+        if age is None:
+            self._ageless_events += 1
+        else:
+            self._latest_age = max(age, self._latest_age or age)
+        self._changed.set()
+
+    async def _read_events(self) -> None:
+        data_lines: list[str] = []
+        try:
+            while True:
+                raw = await self._reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8").rstrip("\r\n")
+                if not line:
+                    if data_lines:
+                        self._dispatch("\n".join(data_lines))
+                        data_lines = []
+                elif line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.info("Push channel dropped: %s", exc)
+        finally:
+            self.connected = False
+            # Wake any waiter so it falls back to polling right away.
+            self._changed.set()
+
+    async def wait(self, timeout: float, game_age: int) -> bool:
+        """Sleep up to ``timeout`` seconds; True if a push event cut it short.
+
+        Returns False on timeout, or as soon as the stream drops so the caller
+        can go back to polling.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self.connected:
+            if self._latest_age is not None and self._latest_age > max(
+                game_age, self._consumed_age or game_age
+            ):
+                self._consumed_age = self._latest_age
+                return True
+            # Ageless events that arrived since the last report, even between
+            # waits, wake one poll between them.
+            if self._ageless_events != self._consumed_ageless:
+                self._consumed_ageless = self._ageless_events
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except TimeoutError:
+                return False
+        return False
+
+    async def close(self) -> None:
+        self._task.cancel()
+        self.connected = False
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
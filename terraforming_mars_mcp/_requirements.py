@@ -0,0 +1,176 @@
+"""Play requirements compiled to typed predicates, and a batch hand evaluator.
+
+`compile_requirements` turns a card's cards.json ``requirements`` descriptors
+into `Requirement` tuples once, when `_card_table.CardTable` is built.
+`play_context` reads every value those predicates can test from the game
+and player models (tags as the server counts them) in one go, and `evaluate_hand` then checks a whole hand
+against it: each card is playable now, some number of steps away, blocked
+(a maximum already passed), or has requirements this module cannot check
+(Turmoil parties, colonies, resources on cards, ...).
+
+Requirement bonuses from cards such as Adaptation Technology are not
+applied; the server's own card warnings remain authoritative.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .api_response_models import GameModel, PublicPlayerModel
+
+if TYPE_CHECKING:
+    from ._card_table import CardTable
+
+# Amount one step of each global parameter raises it by.
+GLOBAL_STEPS = {"temperature": 2, "oxygen": 1, "oceans": 1, "venus": 2}
+_TILE_TYPES = {
+    "greeneries": frozenset({0}),
+    # city, capital, ocean city, red city
+    "cities": frozenset({2, 3, 20, 37}),
+}
+_PRODUCTION_FIELDS = {
+    "megacredits": "megacreditProduction",
+    "steel": "steelProduction",
+    "titanium": "titaniumProduction",
+    "plants": "plantProduction",
+    "energy": "energyProduction",
+    "heat": "heatProduction",
+}
+_CHECKED_KINDS = frozenset({*GLOBAL_STEPS, *_TILE_TYPES, "tr", "tag", "production"})
+_MODIFIERS = frozenset({"count", "max", "all", "nextTo", "text"})
+
+
+class Requirement(NamedTuple):
+    kind: str
+    threshold: int
+    is_max: bool = False
+    # The tag of a "tag" requirement, the resource of a "production" one.
+    subject: str | None = None
+    # Counts every player's tiles, not just the card owner's.
+    all_players: bool = False
+
+
+def compile_requirement(descriptor: Mapping[str, Any]) -> Requirement:
+    count = descriptor.get("count")
+    threshold = count if isinstance(count, int) else 1
+    kind, subject = "other", None
+    for key, value in descriptor.items():
+        if key in _MODIFIERS:
+            continue
+        kind = key
+        if isinstance(value, str):
+            subject = value
+        elif isinstance(value, int) and not isinstance(value, bool):
+            threshold = value
+        break
+    return Requirement(
+        kind=kind,
+        threshold=threshold,
+        is_max=bool(descriptor.get("max")),
+        subject=subject,
+        all_players=bool(descriptor.get("all")),
+    )
+
+
+def compile_requirements(descriptors: Iterable[object]) -> tuple[Requirement, ...]:
+    return tuple(
+        compile_requirement(descriptor)
+        for descriptor in descriptors
+        if isinstance(descriptor, Mapping)
+    )
+
+
+def play_context(
+    game: GameModel, player: PublicPlayerModel, tags: Mapping[str, int]
+) -> dict[tuple[str, str | None], int]:
+    """Current values keyed by (requirement kind, subject or all players)."""
+    context: dict[tuple[str, str | None], int] = {
+        ("temperature", None): game.temperature,
+        ("oxygen", None): game.oxygenLevel,
+        ("oceans", None): game.oceans,
+        ("venus", None): game.venusScaleLevel,
+        ("tr", None): player.terraformRating,
+    }
+    wild = tags.get("wild", 0)
+    for tag, count in tags.items():
+        context["tag", tag] = count + (wild if tag != "wild" else 0)
+    context["tag", None] = wild
+    for resource, field in _PRODUCTION_FIELDS.items():
+        context["production", resource] = getattr(player, field)
+    for kind, tile_types in _TILE_TYPES.items():
+        mine = everyone = 0
+        for space in game.spaces:
+            if space.tileType in tile_types:
+                everyone += 1
+                mine += space.color == player.color
+        context[kind, None] = mine
+        context[kind, "all"] = everyone
+    return context
+
+
+def _steps(
+    requirement: Requirement, context: Mapping[tuple[str, str | None], int]
+) -> int | None:
+    """Steps until ``requirement`` holds; None once a maximum is passed."""
+    kind = requirement.kind
+    if kind == "tag" or kind == "production":
+        current = context.get((kind, requirement.subject), context.get((kind, None), 0))
+    elif kind in _TILE_TYPES:
+        current = context[kind, "all" if requirement.all_players else None]
+    else:
+        current = context[kind, None]
+    step = GLOBAL_STEPS.get(kind, 1)
+    if requirement.is_max:
+        return 0 if current <= requirement.threshold else None
+    missing = requirement.threshold - current
+    return -(-missing // step) if missing > 0 else 0
+
+
+def evaluate_hand(
+    table: CardTable,
+    names: Sequence[str],
+    context: Mapping[tuple[str, str | None], int],
+) -> dict[str, Any]:
+    """Sort ``names`` by whether their requirements are met in ``context``.
+
+    Returns ``playable_now``, ``steps_away`` (name -> the largest number of
+    steps any one requirement still needs), ``blocked`` and ``unchecked``
+    (name -> requirement kinds not evaluated). Cards outside the database
+    are left out.
+    """
+    playable: list[str] = []
+    steps_away: dict[str, int] = {}
+    blocked: list[str] = []
+    unchecked: dict[str, list[str]] = {}
+    ids = table.ids
+    requirements = table.requirements
+    for name in names:
+        card_id = ids.get(name)
+        if card_id is None:
+            continue
+        most = 0
+        skipped: list[str] = []
+        for requirement in requirements[card_id]:
+            if requirement.kind not in _CHECKED_KINDS:
+                skipped.append(requirement.kind)
+                continue
+            steps = _steps(requirement, context)
+            if steps is None:
+                most = -1
+                break
+            most = max(most, steps)
+        if most < 0:
+            blocked.append(name)
+        elif most:
+            steps_away[name] = most
+        elif skipped:
+            unchecked[name] = skipped
+        else:
+            playable.append(name)
+    return {
+        "playable_now": playable,
+        "steps_away": steps_away,
+        "blocked": blocked,
+        "unchecked": unchecked,
+    }
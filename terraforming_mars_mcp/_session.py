@@ -0,0 +1,121 @@
+"""Per-agent session settings, so one server process can host many agents.
+
+Each MCP client session gets its own `SessionConfig` the first time it calls
+`configure_session`; until then, and outside any MCP request, tools use the
+process-wide default `CFG` (set from `TM_*` env vars and the CLI). A client
+may instead attach to a named session handle, and in-process callers such as
+self-play harnesses can bind one with `use_session`.
+
+Caches keyed by server URL and player or game ID (`turn_flow`'s player cache
+and log cursors, `game_state`'s session caches and the card-detail trackers
+they hold) are already isolated between sessions and stay module-level.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import weakref
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from mcp.server.lowlevel.server import request_ctx
+
+from ._bounded_cache import BoundedCache
+from ._polling import PollingPolicy
+
+
+@dataclass
+class SessionConfig:
+    base_url: str = os.environ.get("TM_SERVER_URL", "http://localhost:8080")
+    player_id: str | None = os.environ.get("TM_PLAYER_ID")
+    polling: PollingPolicy = field(default_factory=PollingPolicy.from_env)
+    push_url: str | None = os.environ.get("TM_PUSH_URL") or None
+    # Auto-responses as patches against the previous state (`game_state`).
+    delta_responses: bool = os.environ.get("TM_DELTA_RESPONSES", "") not in ("", "0")
+
+    def fork(self) -> SessionConfig:
+        """A new session starting from this one's settings."""
+        return SessionConfig(
+            base_url=self.base_url,
+            player_id=self.player_id,
+            polling=self.polling,
+            push_url=self.push_url,
+            delta_responses=self.delta_responses,
+        )
+
+
+CFG = SessionConfig()
+
+# Sessions of connected MCP clients; entries go away with the client session.
+_CLIENT_SESSIONS: weakref.WeakKeyDictionary[object, SessionConfig] = (
+    weakref.WeakKeyDictionary()
+)
+_NAMED_SESSIONS: BoundedCache[str, SessionConfig] = BoundedCache("named_sessions")
+_BOUND_SESSION: ContextVar[SessionConfig | None] = ContextVar(
+    "tm_bound_session", default=None
+)
+
+
+def _client_session() -> object | None:
+    context = request_ctx.get(None)
+    return None if context is None else context.session
+
+
+def current_session() -> SessionConfig:
+    """The session the running tool call acts for."""
+    bound = _BOUND_SESSION.get()
+    if bound is not None:
+        return bound
+    client = _client_session()
+    if client is not None:
+        session = _CLIENT_SESSIONS.get(client)
+        if session is not None:
+            return session
+    return CFG
+
+
+def named_session(handle: str) -> SessionConfig:
+    """The session registered under ``handle``, created from `CFG` if new."""
+    session = _NAMED_SESSIONS.get(handle)
+    if session is None:
+        session = _NAMED_SESSIONS[handle] = CFG.fork()
+    return session
+
+
+def session_to_configure(handle: str | None = None) -> SessionConfig:
+    """The session `configure_session` should update for the running call.
+
+    With ``handle`` the calling MCP client is attached to that named session.
+    Otherwise the client gets its own session on first configuration, and a
+    call outside any MCP request configures whatever `current_session` is.
+    """
+    client = _client_session()
+    if handle:
+        session = named_session(handle)
+        if client is not None:
+            _CLIENT_SESSIONS[client] = session
+        return session
+    bound = _BOUND_SESSION.get()
+    if bound is not None or client is None:
+        return current_session()
+    session = _CLIENT_SESSIONS.get(client)
+    if session is None:
+        session = _CLIENT_SESSIONS[client] = CFG.fork()
+    return session
+
+
+@contextlib.contextmanager
+def use_session(handle: str) -> Iterator[SessionConfig]:
+    """Run tool functions in-process on behalf of the named session ``handle``."""
+    session = named_session(handle)
+    token = _BOUND_SESSION.set(session)
+    try:
+        yield session
+    finally:
+        _BOUND_SESSION.reset(token)
+
+
+def close_session(handle: str) -> None:
+    _NAMED_SESSIONS.pop(handle, None)
@@ -14,10 +14,12 @@ from .api_response_models import JsonValue
 from .card_info import extract_played_cards
 from .game_state import build_agent_state, full_board_state
 from .turn_flow import (
-    CFG,
     _post_input,
+    current_session,
     get_player,
+    get_player_cached,
     is_revisable_selection_prompt,
+    run_blocking,
     state_after_submission,
     submit_and_return_state,
     wait_for_turn_from_player_model,
@@ -26,9 +28,9 @@ from .waiting_for import prepare_action
 
 
 @mcp.tool()
-def get_opponents_played_cards() -> dict[str, object]:
+async def get_opponents_played_cards() -> dict[str, object]:
     """Return all cards currently in each opponent's tableau (played cards)."""
-    player_model = get_player()
+    player_model = await run_blocking(get_player_cached)
     this_color = player_model.thisPlayer.color
 
     opponents: list[dict[str, object]] = []
@@ -54,9 +56,9 @@ def get_opponents_played_cards() -> dict[str, object]:
 
 
 @mcp.tool()
-def get_my_played_cards() -> dict[str, object]:
+async def get_my_played_cards() -> dict[str, object]:
     """Return all cards currently in your tableau (played cards)."""
-    player_model = get_player()
+    player_model = await run_blocking(get_player_cached)
     this_player = player_model.thisPlayer
     cards = extract_played_cards(this_player)
     game = player_model.game
@@ -71,9 +73,9 @@ def get_my_played_cards() -> dict[str, object]:
 
 
 @mcp.tool()
-def get_mars_board_state(include_empty_spaces: bool = False) -> dict[str, object]:
+async def get_mars_board_state(include_empty_spaces: bool = False) -> dict[str, object]:
     """Return detailed Mars board state. This is the explicit board-inspection tool."""
-    player_model = get_player()
+    player_model = await run_blocking(get_player_cached)
     return full_board_state(
         player_model.game, include_empty_spaces=include_empty_spaces
     )
@@ -82,22 +84,27 @@ def get_mars_board_state(include_empty_spaces: bool = False) -> dict[str, object
 @mcp.tool()
 async def wait_for_turn() -> dict[str, Any]:
     """Poll /api/waitingfor until it's your turn using fixed server defaults."""
-    player_model = get_player()
+    session = current_session()
+    player_model = await run_blocking(get_player)
     if player_model.waitingFor is not None and not is_revisable_selection_prompt(
         player_model
     ):
         return {
             "status": "GO",
             "state": build_agent_state(
-                player_model, base_url=CFG.base_url, player_id_fallback=CFG.player_id
+                player_model,
+                base_url=session.base_url,
+                player_id_fallback=session.player_id,
+                delta=session.delta_responses,
             ),
         }
     refreshed, opponent_actions = await wait_for_turn_from_player_model(player_model)
     state = build_agent_state(
         refreshed,
-        base_url=CFG.base_url,
-        player_id_fallback=CFG.player_id,
+        base_url=session.base_url,
+        player_id_fallback=session.player_id,
         between_turns_actions=opponent_actions,
+        delta=session.delta_responses,
     )
     return {"status": "GO", "state": state}
 
@@ -158,7 +165,7 @@ async def submit_multi_actions(
     if len(actions) == 0:
         raise ValueError("actions must contain at least one action")
 
-    player_model = get_player()
+    player_model = await run_blocking(get_player)
     actions_executed = 0
     error_info: dict[str, object] | None = None
     for i, action in enumerate(actions):
@@ -167,14 +174,16 @@ async def submit_multi_actions(
 
         try:
             normalized = prepare_action(action, player_model.waitingFor)
-            player_model = _post_input(cast(dict[str, JsonValue], normalized))
+            player_model = await run_blocking(
+                _post_input, cast(dict[str, JsonValue], normalized)
+            )
         except RuntimeError as exc:
             error_info = {
                 "message": str(exc),
                 "failed_action_index": i,
                 "failed_action": action,
             }
-            player_model = get_player()
+            player_model = await run_blocking(get_player)
             break
         actions_executed += 1
 
@@ -248,7 +257,7 @@ async def select_initial_cards(
     request: InitialCardsSelectionModel,
 ) -> dict[str, object]:
     """Respond to `type: initialCards` using current waiting-for option order."""
-    player_model = get_player()
+    player_model = await run_blocking(get_player)
     waiting_for = player_model.waitingFor
     options = waiting_for.options if waiting_for is not None else None
     if not isinstance(options, list):
@@ -296,7 +305,7 @@ async def select_resources(
     the selected field determines the resource type and the amount is ignored.
     For a `resources` prompt, the full units payload is submitted.
     """
-    waiting_for = get_player().waitingFor
+    waiting_for = (await run_blocking(get_player)).waitingFor
     waiting_for_type = waiting_for.type if waiting_for is not None else None
     payload = (units or UnitsPayloadModel()).model_dump()
 
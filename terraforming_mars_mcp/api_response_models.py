@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Literal, TypeAlias
+from typing import Any, Literal, TypeAlias, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, JsonValue as PydanticJsonValue
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from pydantic import JsonValue as PydanticJsonValue
 
 
 class TMBaseModel(BaseModel):
@@ -302,10 +303,16 @@ class PlayerViewModel(TMBaseModel):
     draftedCards: list[CardModel] = Field(default_factory=list)
     dealtProjectCards: list[CardModel] = Field(default_factory=list)
 
+    # The server response body this model was validated from, if any, so the
+    # raw model can be thinned without a `model_dump` round trip.
+    _raw_json: bytes | None = PrivateAttr(default=None)
+
 
 class WaitingForStatusModel(TMBaseModel):
     result: Literal["GO", "REFRESH", "WAIT"]
     waitingFor: list[str]
+    gameAge: int | None = None
+    undoCount: int | None = None
 
 
 class GameLogEntryModel(TMBaseModel):
@@ -314,3 +321,21 @@ class GameLogEntryModel(TMBaseModel):
     data: list[LogMessageDataModel]
     type: LogMessageTypeLiteral | None = None
     playerId: str | None = None
+
+
+_ResponseT = TypeVar("_ResponseT")
+
+# One adapter per response type, built on first use.
+_RESPONSE_ADAPTERS: dict[object, TypeAdapter[Any]] = {}
+
+
+def response_adapter(response_type: type[_ResponseT]) -> TypeAdapter[_ResponseT]:
+    """Shared validator for a server response type.
+
+    Validating raw response bytes through the adapter parses JSON straight into
+    the models, skipping the intermediate ``json.loads`` dict tree.
+    """
+    adapter = _RESPONSE_ADAPTERS.get(response_type)
+    if adapter is None:
+        adapter = _RESPONSE_ADAPTERS[response_type] = TypeAdapter(response_type)
+    return adapter
@@ -1,46 +1,57 @@
 from __future__ import annotations
 
-import json
 import re
-from pathlib import Path
-from typing import Any, Sequence
-
-from ._enums import DetailLevel, strip_empty
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, Sequence
+
+from ._card_db import CardRecord, load_card_db
+from ._card_search import CardSearchIndex
+from ._card_table import CardTable
+from ._enums import DetailLevel
+from ._requirements import evaluate_hand, play_context
 from .api_response_models import (
     CardModel as ApiCardModel,
+    GameModel as ApiGameModel,
     PublicPlayerModel as ApiPublicPlayerModel,
 )
 
-_CARD_INFO_INDEX: dict[str, dict[str, object]] | None = None
+_CARD_INFO_INDEX: dict[str, CardRecord] | None = None
+# card_info() results by (card name, include_play_details); static per process.
+_CARD_INFO_CACHE: dict[tuple[str, bool], Mapping[str, Any]] = {}
+_NO_CARD_INFO: Mapping[str, Any] = MappingProxyType({})
+_CARD_TABLE: CardTable | None = None
+_CARD_SEARCH_INDEX: CardSearchIndex | None = None
 
 
 class _CardDetailTracker:
-    """Tracks per-card detail tier for auto-returned responses within a generation.
+    """Tracks per-card detail tier for auto-returned responses.
 
     Only applies to auto-returned data (after submitting an action). Proactive
     requests always get full detail regardless of this tracker.
 
     For auto-returned responses:
-      1st appearance in generation → full detail (tags, requirements, effect_text, etc.)
+      1st appearance → full detail (tags, requirements, effect_text, etc.)
       2nd+ appearance → name only, unless dynamic fields (warnings) changed
-    Resets when generation changes or on explicit reset.
+    Resets only on explicit reset. Each reset bumps `version`, so an agent
+    can tell that name-only cards now refer to details sent after the reset.
+
+    `game_state` keeps one per (game, player) in its session cache;
+    `_CARD_TRACKER` serves callers that do not pass one.
     """
 
     def __init__(self) -> None:
-        self._generation: int | None = None
         self._seen: dict[str, dict[str, object]] = {}
+        self.version = 0
 
     def should_send_details(
-        self, card_name: str, generation: int, dynamic_fields: dict[str, object]
+        self, card_name: str, dynamic_fields: dict[str, object]
     ) -> bool:
         """Return True if this card should include details beyond just the name.
 
-        Tracks cards by generation. Returns True on first appearance, and on
+        Returns True on first appearance since the last reset, and on
         subsequent appearances only if dynamic fields (warnings, etc.) changed.
         """
-        if self._generation != generation:
-            self._generation = generation
-            self._seen.clear()
         prev = self._seen.get(card_name)
         self._seen[card_name] = dynamic_fields
         if prev is None:
@@ -48,42 +59,79 @@ class _CardDetailTracker:
         return prev != dynamic_fields
 
     def reset(self) -> None:
-        self._generation = None
+        """Forget every card sent so far; the next appearances get full detail."""
         self._seen.clear()
+        self.version += 1
+
+    def to_snapshot(self) -> dict[str, Any]:
+        return {
+            "seen": {name: dict(fields) for name, fields in self._seen.items()},
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> _CardDetailTracker:
+        tracker = cls()
+        tracker.version = int(data["version"])
+        # JSON turns the tuples in dynamic fields into lists; compare as before.
+        tracker._seen = {
+            str(name): {
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in fields.items()
+            }
+            for name, fields in data["seen"].items()
+        }
+        return tracker
 
 
 _CARD_TRACKER = _CardDetailTracker()
 
 
-def _load_card_info_index() -> dict[str, dict[str, object]]:
+def _load_card_info_index() -> dict[str, CardRecord]:
     global _CARD_INFO_INDEX
-    if _CARD_INFO_INDEX is not None:
-        return _CARD_INFO_INDEX
-
-    cards_file = (
-        Path(__file__).resolve().parents[1]
-        / "submodules"
-        / "tm-oss-server"
-        / "src"
-        / "genfiles"
-        / "cards.json"
-    )
-    if not cards_file.exists():
-        _CARD_INFO_INDEX = {}
-        return _CARD_INFO_INDEX
-
-    raw = json.loads(cards_file.read_text(encoding="utf-8"))
-    index: dict[str, dict[str, object]] = {}
-    if isinstance(raw, list):
-        for item in raw:
-            if isinstance(item, dict):
-                name = item.get("name")
-                if isinstance(name, str):
-                    index[name] = item
-    _CARD_INFO_INDEX = index
+    if _CARD_INFO_INDEX is None:
+        _CARD_INFO_INDEX = load_card_db()
     return _CARD_INFO_INDEX
 
 
+def card_table() -> CardTable:
+    """The card database as integer IDs and attribute columns."""
+    global _CARD_TABLE
+    if _CARD_TABLE is None:
+        _CARD_TABLE = CardTable(_load_card_info_index().values())
+    return _CARD_TABLE
+
+
+def card_search_index() -> CardSearchIndex:
+    """Inverted indexes over the card table, for `search_cards`."""
+    global _CARD_SEARCH_INDEX
+    if _CARD_SEARCH_INDEX is None:
+        _CARD_SEARCH_INDEX = CardSearchIndex(card_table(), _load_card_info_index())
+    return _CARD_SEARCH_INDEX
+
+
+def reported_tag_counts(player: ApiPublicPlayerModel) -> dict[str, int]:
+    """``player``'s tag counts as the server reports them (its ``tags`` field)."""
+    tags = (player.model_extra or {}).get("tags")
+    if not isinstance(tags, dict):
+        return {}
+    return {tag: count for tag, count in tags.items() if isinstance(count, int)}
+
+
+def hand_playability(
+    game: ApiGameModel,
+    player: ApiPublicPlayerModel,
+    cards: Sequence[ApiCardModel | str],
+) -> dict[str, Any]:
+    """Which of ``cards`` meet their play requirements for ``player`` right now.
+
+    See `_requirements.evaluate_hand` for the result.
+    """
+    context = play_context(game, player, reported_tag_counts(player))
+    names = [card if isinstance(card, str) else card.name for card in cards]
+    return evaluate_hand(card_table(), names, context)
+
+
 def _split_requirement_and_effect(
     description: str | None,
 ) -> tuple[str | None, str | None]:
@@ -140,71 +188,46 @@ def format_vp(vp: object | None) -> int | str | None:
     return None
 
 
-def card_info(card_name: str, include_play_details: bool = False) -> dict[str, object]:
-    card = _load_card_info_index().get(card_name)
-    if not isinstance(card, dict):
-        return {}
-
-    raw_tags = card.get("tags")
-    tags = raw_tags if isinstance(raw_tags, list) else []
-    raw_metadata = card.get("metadata")
-    metadata = raw_metadata if isinstance(raw_metadata, dict) else None
-    render_data = metadata.get("renderData") if isinstance(metadata, dict) else None
-    raw_description = (
-        metadata.get("description") if isinstance(metadata, dict) else None
-    )
-    if isinstance(raw_description, str):
-        description: str | None = raw_description
-    elif isinstance(raw_description, dict):
-        text = raw_description.get("text")
-        description = text if isinstance(text, str) else None
-    else:
-        description = None
-    actions: list[str] = []
-    effects: list[str] = []
-    if render_data is not None:
-        queue: list[Any] = [render_data]
-        while queue:
-            node = queue.pop(0)
-            if isinstance(node, str):
-                if node.startswith("Action:"):
-                    actions.append(node)
-                elif node.startswith("Effect:"):
-                    effects.append(node)
-            elif isinstance(node, list):
-                queue.extend(node)
-            elif isinstance(node, dict):
-                queue.extend(node.values())
-    vp = format_vp(card.get("victoryPoints"))
-
+def _build_card_info(card: CardRecord, include_play_details: bool) -> Mapping[str, Any]:
     info: dict[str, object] = {
-        "name": card_name,
-        "tags": tags,
-        "ongoing_effects": effects,
-        "activated_actions": actions,
-        "description_text": description,
-        "vp": vp,
+        "name": card.name,
+        "tags": card.tags,
+        "ongoing_effects": card.effects,
+        "activated_actions": card.actions,
+        "description_text": card.description,
+        "vp": format_vp(card.victory_points),
     }
 
     if include_play_details:
-        req_text, on_play = _split_requirement_and_effect(description)
-        requirements = (
-            card.get("requirements")
-            if isinstance(card.get("requirements"), list)
-            else []
-        )
+        req_text, on_play = _split_requirement_and_effect(card.description)
         info.update(
             {
-                "base_cost": card.get("cost"),
-                "play_requirements": requirements,
+                "base_cost": card.cost,
+                "play_requirements": card.requirements,
                 "play_requirements_text": req_text,
                 "on_play_effect_text": on_play,
             }
         )
+    return MappingProxyType(info)
+
+
+def card_info(card_name: str, include_play_details: bool = False) -> Mapping[str, Any]:
+    """Static details of a card; empty for cards not in the database.
+
+    Computed once per card and shared between callers, so the result is
+    read-only and its list-like fields are tuples.
+    """
+    key = (card_name, include_play_details)
+    info = _CARD_INFO_CACHE.get(key)
+    if info is None:
+        card = _load_card_info_index().get(card_name)
+        if card is None:
+            return _NO_CARD_INFO
+        info = _CARD_INFO_CACHE[key] = _build_card_info(card, include_play_details)
     return info
 
 
-def _all_effect_texts(info: dict[str, object]) -> list[str]:
+def _all_effect_texts(info: Mapping[str, Any]) -> list[str]:
     seen: set[str] = set()
     effect_texts: list[str] = []
 
@@ -224,7 +247,7 @@ def _all_effect_texts(info: dict[str, object]) -> list[str]:
 
     for key in ("ongoing_effects", "activated_actions"):
         values = info.get(key)
-        if not isinstance(values, list):
+        if not isinstance(values, (list, tuple)):
             continue
         for value in values:
             add(value)
@@ -232,11 +255,77 @@ def _all_effect_texts(info: dict[str, object]) -> list[str]:
     return effect_texts
 
 
+class _CardTemplate(NamedTuple):
+    """The static part of a card's `_compact_card` payload at one detail level."""
+
+    base_cost: Any
+    show_cost: bool
+    vp: Any
+    # Detail fields appended after the dynamic ones, in payload order.
+    details: tuple[tuple[str, Any], ...]
+
+
+# Templates by (card name, detail level), for cards in the database only.
+_CARD_TEMPLATES: dict[tuple[str, DetailLevel], _CardTemplate] = {}
+
+
+def _build_card_template(
+    info: Mapping[str, Any], detail_level: DetailLevel
+) -> _CardTemplate:
+    details: list[tuple[str, Any]] = []
+    # Full detail: include tags, requirements, and effect text.
+    if detail_level == DetailLevel.FULL:
+        tags = info.get("tags")
+        if isinstance(tags, (list, tuple)) and tags:
+            details.append(("tags", tuple(tags)))
+
+        play_requirements_text = info.get("play_requirements_text")
+        if isinstance(play_requirements_text, str) and play_requirements_text.strip():
+            details.append(("play_requirements_text", play_requirements_text))
+
+        effect_texts = _all_effect_texts(info)
+        # Strip duplicate requirement text from effect_texts[0].
+        if (
+            isinstance(play_requirements_text, str)
+            and play_requirements_text.strip()
+            and effect_texts
+        ):
+            req = play_requirements_text.strip()
+            first = effect_texts[0]
+            if first.startswith(req):
+                stripped = first[len(req) :].strip()
+                if stripped:
+                    effect_texts[0] = stripped
+                else:
+                    effect_texts = effect_texts[1:]
+        if effect_texts:
+            details.append(("effect_texts", tuple(effect_texts)))
+    return _CardTemplate(
+        base_cost=info.get("base_cost"),
+        # Cost is irrelevant for already-played cards selected for their actions.
+        show_cost=detail_level != DetailLevel.MINIMAL,
+        vp=info.get("vp"),
+        details=tuple(details),
+    )
+
+
+def _card_template(card_name: str, detail_level: DetailLevel) -> _CardTemplate:
+    key = (card_name, detail_level)
+    template = _CARD_TEMPLATES.get(key)
+    if template is None:
+        info = card_info(card_name, include_play_details=True)
+        template = _build_card_template(info, detail_level)
+        if info:
+            _CARD_TEMPLATES[key] = template
+    return template
+
+
 def _compact_card(
     card: str | ApiCardModel,
     detail_level: DetailLevel = DetailLevel.FULL,
     generation: int | None = None,
     auto_response: bool = False,
+    card_tracker: _CardDetailTracker | None = None,
 ) -> dict[str, object]:
     card_model: ApiCardModel | None = None
     if isinstance(card, str):
@@ -251,8 +340,8 @@ def _compact_card(
     if disabled and auto_response:
         return {"name": card_name, "disabled": True}
 
-    info = card_info(card_name, include_play_details=True)
-    base_cost = info.get("base_cost")
+    template = _card_template(card_name, detail_level)
+    base_cost = template.base_cost
     discounted_cost = (
         card_model.calculatedCost
         if card_model and card_model.calculatedCost is not None
@@ -274,66 +363,33 @@ def _compact_card(
     if resources is not None:
         dynamic_fields["resources"] = resources
 
-    # Auto-response caching: after first appearance in a generation,
+    # Auto-response caching: after first appearance in this tracker version,
     # return name-only unless dynamic fields changed.
     if auto_response and generation is not None:
-        if not _CARD_TRACKER.should_send_details(card_name, generation, dynamic_fields):
+        tracker = _CARD_TRACKER if card_tracker is None else card_tracker
+        if not tracker.should_send_details(card_name, dynamic_fields):
             return {"name": card_name}
 
-    # Build the payload with cost and dynamic fields.
-    cost = base_cost if base_cost is not None else discounted_cost
-    payload: dict[str, object] = strip_empty(
-        {
-            "name": card_name,
-            "disabled": True if disabled else None,
-            "cost": cost,
-            "discounted_cost": discounted_cost
-            if discounted_cost is not None and discounted_cost != cost
-            else None,
-            "warning": warning if has_warning else None,
-            "warnings": warnings if has_warnings else None,
-            "resources": resources
-            if resources is not None and resources != 0
-            else None,
-            "vp": info.get("vp"),
-        }
-    )
-
-    # Minimal detail (e.g. blue card actions): name + dynamic fields only.
-    # Cost is irrelevant for already-played cards being selected for their actions.
-    if detail_level == DetailLevel.MINIMAL:
-        payload.pop("cost", None)
-        payload.pop("discounted_cost", None)
-        return payload
-
-    # Full detail: include tags, requirements, and effect text.
-    if detail_level == DetailLevel.FULL:
-        tags = info.get("tags")
-        if isinstance(tags, list) and tags:
-            payload["tags"] = tags
-
-        play_requirements_text = info.get("play_requirements_text")
-        if isinstance(play_requirements_text, str) and play_requirements_text.strip():
-            payload["play_requirements_text"] = play_requirements_text
-
-        effect_texts = _all_effect_texts(info)
-        # Strip duplicate requirement text from effect_texts[0].
-        if (
-            isinstance(play_requirements_text, str)
-            and play_requirements_text.strip()
-            and effect_texts
-        ):
-            req = play_requirements_text.strip()
-            first = effect_texts[0]
-            if first.startswith(req):
-                stripped = first[len(req) :].strip()
-                if stripped:
-                    effect_texts[0] = stripped
-                else:
-                    effect_texts = effect_texts[1:]
-        if effect_texts:
-            payload["effect_texts"] = effect_texts
-
+    # Overlay the dynamic fields on the template, skipping empty values.
+    payload: dict[str, object] = {"name": card_name}
+    if disabled:
+        payload["disabled"] = True
+    if template.show_cost:
+        cost = base_cost if base_cost is not None else discounted_cost
+        if cost is not None:
+            payload["cost"] = cost
+        if discounted_cost is not None and discounted_cost != cost:
+            payload["discounted_cost"] = discounted_cost
+    if has_warning:
+        payload["warning"] = warning
+    if has_warnings and isinstance(warnings, list):
+        payload["warnings"] = list(warnings)
+    if resources is not None and resources != 0:
+        payload["resources"] = resources
+    if template.vp is not None:
+        payload["vp"] = template.vp
+    for key, value in template.details:
+        payload[key] = list(value) if isinstance(value, tuple) else value
     return payload
 
 
@@ -342,6 +398,7 @@ def compact_cards(
     detail_level: DetailLevel = DetailLevel.FULL,
     generation: int | None = None,
     auto_response: bool = False,
+    card_tracker: _CardDetailTracker | None = None,
 ) -> list[dict[str, object]]:
     """Compact a list of cards with detail level appropriate to the call context.
 
@@ -350,12 +407,15 @@ def compact_cards(
 
     Auto-returned responses (auto_response=True): after submitting an action,
     the server returns game state automatically. To reduce noise:
-      - 1st appearance of a card in a generation → full detail
+      - 1st appearance of a card per tracker version → full detail
       - 2nd+ appearance → name only (e.g. {"name": "Aquifer Pumping"}),
         unless dynamic fields (warnings, resources) changed since last seen
 
     Disabled cards in auto-responses return just {"name": ..., "disabled": True}.
     In proactive requests, disabled cards return full details with disabled flag.
+
+    ``card_tracker`` remembers what was already sent; it defaults to the
+    process-wide `_CARD_TRACKER`.
     """
     return [
         _compact_card(
@@ -363,6 +423,7 @@ def compact_cards(
             detail_level=detail_level,
             generation=generation,
             auto_response=auto_response,
+            card_tracker=card_tracker,
         )
         for card in cards
     ]
@@ -383,7 +444,7 @@ def extract_played_card_effects_and_actions(
     summaries: list[dict[str, object]] = []
 
     def _normalized_texts(values: object) -> list[str]:
-        if not isinstance(values, list):
+        if not isinstance(values, (list, tuple)):
             return []
         texts: list[str] = []
         for value in values:
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import time
 from collections import Counter
 from dataclasses import asdict, dataclass, field
+from collections.abc import Collection
 from typing import Any, Literal, NotRequired, TypedDict
 
+from . import _cache_store, _json
+from ._bounded_cache import BoundedCache
+from ._delta import merge_patch
 from ._enums import (
     DetailLevel,
     InputType,
     ToolName,
     action_tools_for_input_type,
+    omit_empty,
     strip_empty,
 )
 from .api_response_models import (
@@ -18,6 +24,7 @@ from .api_response_models import (
     WaitingForInputModel as ApiWaitingForInputModel,
 )
 from .card_info import (
+    _CardDetailTracker,
     card_info,
     compact_cards,
     extract_played_card_effects_and_actions,
@@ -52,23 +59,122 @@ class _SessionCache:
     """Per-(game, player) memory of what was already sent to the agent.
 
     Used to avoid re-sending unchanged data (constants, milestones, player
-    summaries) on every auto-response.
+    summaries, card details) on every auto-response. Snapshotted to disk by
+    `_cache_store` so a restarted server picks up where it left off.
     """
 
     opponent_tableau: dict[str, Counter[str]] = field(default_factory=dict)
     last_generation: int | None = None
     last_game_constants: dict[str, Any] | None = None
     # Responses since full player state was last included, keyed by detail level.
+    # Not snapshotted: it changes on nearly every response, and after a
+    # restart the next response simply carries the full state.
     responses_since_full_state: dict[str, int] = field(default_factory=dict)
     last_session: dict[str, Any] | None = None
     last_ma_snapshot: _MilestonesAwardsSnapshot | None = None
+    card_tracker: _CardDetailTracker = field(default_factory=_CardDetailTracker)
+    # Delta mode: the state last sent and its sequence number. Not snapshotted;
+    # after a restart the first delta-mode response is a full one.
+    delta_sequence: int = field(default=0, compare=False)
+    last_sent_state: dict[str, Any] | None = field(
+        default=None, compare=False, repr=False
+    )
+    # What was last written to disk and when, to skip rewriting an unchanged
+    # snapshot and to space out rewrites within a generation.
+    saved_snapshot: dict[str, Any] | None = field(
+        default=None, compare=False, repr=False
+    )
+    saved_at: float = field(default=float("-inf"), compare=False, repr=False)
+
+    def to_snapshot(self) -> dict[str, Any]:
+        ma = self.last_ma_snapshot
+        return {
+            "opponent_tableau": {
+                color: dict(counts) for color, counts in self.opponent_tableau.items()
+            },
+            "last_generation": self.last_generation,
+            "last_game_constants": self.last_game_constants,
+            "last_session": self.last_session,
+            "last_ma_snapshot": None
+            if ma is None
+            else {
+                "generation": ma.generation,
+                "claimed": sorted(ma.claimed),
+                "funded": sorted(ma.funded),
+                "claimable": sorted(ma.claimable),
+            },
+            "card_tracker": self.card_tracker.to_snapshot(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> _SessionCache:
+        ma = data["last_ma_snapshot"]
+        snapshot = cls(
+            opponent_tableau={
+                color: Counter(counts)
+                for color, counts in data["opponent_tableau"].items()
+            },
+            last_generation=data["last_generation"],
+            last_game_constants=data["last_game_constants"],
+            last_session=data["last_session"],
+            last_ma_snapshot=None
+            if ma is None
+            else _MilestonesAwardsSnapshot(
+                generation=ma["generation"],
+                claimed=frozenset(ma["claimed"]),
+                funded=frozenset(ma["funded"]),
+                claimable=frozenset((name, color) for name, color in ma["claimable"]),
+            ),
+            card_tracker=_CardDetailTracker.from_snapshot(data["card_tracker"]),
+        )
+        snapshot.saved_snapshot = data
+        return snapshot
+
+
+_SESSION_CACHES: BoundedCache[str, _SessionCache] = BoundedCache("session_caches")
+
 
+def _session_cache_key(game_id: str, player_id: str) -> str:
+    return f"{game_id}:{player_id}"
 
-_SESSION_CACHES: dict[str, _SessionCache] = {}
+
+def _restored_session_cache(game_id: str, player_id: str) -> _SessionCache:
+    data = _cache_store.load_snapshot(game_id, player_id)
+    if data is not None:
+        try:
+            return _SessionCache.from_snapshot(data)
+        except (KeyError, TypeError, ValueError):
+            pass
+    return _SessionCache()
 
 
 def _session_cache(game_id: str, player_id: str) -> _SessionCache:
-    return _SESSION_CACHES.setdefault(f"{game_id}:{player_id}", _SessionCache())
+    key = _session_cache_key(game_id, player_id)
+    cache = _SESSION_CACHES.get(key)
+    if cache is None:
+        # First use since startup (or since eviction): pick up the snapshot.
+        cache = _SESSION_CACHES.setdefault(
+            key, _restored_session_cache(game_id, player_id)
+        )
+    return cache
+
+
+def _save_session_cache(cache: _SessionCache, game_id: str, player_id: str) -> None:
+    """Write the snapshot if it changed: right away on a new generation, else
+    at most every `_cache_store.SAVE_INTERVAL_SECONDS`."""
+    snapshot = cache.to_snapshot()
+    saved = cache.saved_snapshot
+    if snapshot == saved:
+        return
+    now = time.monotonic()
+    new_generation = saved is None or snapshot["last_generation"] != saved.get(
+        "last_generation"
+    )
+    if not new_generation and now - cache.saved_at < _cache_store.SAVE_INTERVAL_SECONDS:
+        return
+    _cache_store.save_snapshot(game_id, player_id, snapshot)
+    cache.saved_snapshot = snapshot
+    cache.saved_at = now
 
 
 @dataclass(frozen=True)
@@ -98,7 +204,7 @@ class _PlayerSummary:
     actions_this_generation: list[str]
 
     def to_full_payload(self) -> dict[str, Any]:
-        payload = asdict(self)
+        payload = omit_empty(asdict(self))
         payload.pop("active", None)
         if self.active:
             payload["active"] = True
@@ -407,7 +513,7 @@ def full_board_state(
     for space in game.spaces:
         if not include_empty_spaces and space.tileType is None:
             continue
-        space_data: dict[str, Any] = strip_empty(
+        space_data: dict[str, Any] = omit_empty(
             {
                 "id": space.id,
                 "x": space.x,
@@ -472,18 +578,20 @@ def _new_opponent_cards_from_counts(
         for card_name, count in delta.items():
             for _ in range(count):
                 info = card_info(card_name, include_play_details=True)
-                event: dict[str, Any] = {
-                    "player_name": player.name,
-                    "player_color": color,
-                    "card_name": card_name,
-                    "tags": info.get("tags", []),
-                    "ongoing_effects": info.get("ongoing_effects", []),
-                    "activated_actions": info.get("activated_actions", []),
-                    "play_requirements_text": info.get("play_requirements_text"),
-                    "on_play_effect_text": info.get("on_play_effect_text"),
-                    "cost": info.get("base_cost"),
-                    "vp": info.get("vp"),
-                }
+                event: dict[str, Any] = omit_empty(
+                    {
+                        "player_name": player.name,
+                        "player_color": color,
+                        "card_name": card_name,
+                        "tags": list(info.get("tags", ())),
+                        "ongoing_effects": list(info.get("ongoing_effects", ())),
+                        "activated_actions": list(info.get("activated_actions", ())),
+                        "play_requirements_text": info.get("play_requirements_text"),
+                        "on_play_effect_text": info.get("on_play_effect_text"),
+                        "cost": info.get("base_cost"),
+                        "vp": info.get("vp"),
+                    }
+                )
                 events.append(event)
     return events, current
 
@@ -557,7 +665,7 @@ def _strip_expansion_fields(
 
 
 def thin_raw_player_model(raw: dict[str, Any]) -> dict[str, Any]:
-    """Apply all thinning passes to a raw ``model_dump`` of the player model."""
+    """Apply all thinning passes to a raw player model dict, in place."""
 
     # Drop `thisPlayer` — it duplicates one entry in `players`.
     raw.pop("thisPlayer", None)
@@ -650,6 +758,21 @@ def thin_raw_player_model(raw: dict[str, Any]) -> dict[str, Any]:
     return raw
 
 
+def _raw_player_model(player_model: ApiPlayerViewModel) -> dict[str, Any]:
+    """The thinned raw player model, decoded afresh from the server response.
+
+    Thinning the decoded body skips dumping the validated model back to dicts.
+    Models not built from a response (tests, harnesses) are dumped instead.
+    """
+    raw_json = player_model._raw_json
+    raw = (
+        _json.loads(raw_json)
+        if raw_json is not None
+        else player_model.model_dump(exclude_none=True)
+    )
+    return strip_empty(thin_raw_player_model(raw))
+
+
 def _build_game_constants(game: ApiGameModel) -> dict[str, Any]:
     """Core game constants that rarely change mid-turn."""
     terraforming: dict[str, Any] = {
@@ -677,8 +800,13 @@ def _build_game_state_section(
     cache: _SessionCache,
     detail_level: DetailLevel,
     show_board: bool,
+    complete: bool = False,
 ) -> tuple[dict[str, Any], bool]:
-    """Build the `game` payload; returns it plus whether a new generation started."""
+    """Build the `game` payload; returns it plus whether a new generation started.
+
+    ``complete`` always includes the constants and milestones/awards rather
+    than only when they changed (delta mode diffs them instead).
+    """
     generation = game.generation
     game_constants = _build_game_constants(game)
 
@@ -698,16 +826,20 @@ def _build_game_state_section(
     if game.passedPlayers:
         game_state["passed_players"] = game.passedPlayers
 
-    if constants_changed:
+    if constants_changed or complete:
         game_state.update(game_constants)
     else:
         # Only include generation (always useful context) when constants unchanged.
         game_state["generation"] = generation
 
     if detail_level == DetailLevel.FULL:
-        if _should_include_milestones_awards(game, generation, cache):
-            game_state["milestones"] = _summarize_milestones(game)
-            game_state["awards"] = _summarize_awards(game)
+        if _should_include_milestones_awards(game, generation, cache) or complete:
+            milestones = _summarize_milestones(game)
+            if milestones:
+                game_state["milestones"] = milestones
+            awards = _summarize_awards(game)
+            if awards:
+                game_state["awards"] = awards
         else:
             game_state["milestones_changed"] = False
     if show_board:
@@ -737,13 +869,15 @@ def _build_generation_start(
         generation=generation,
         auto_response=False,
     )
-    return {
-        "cards_in_hand_count": len(gen_start_cards),
-        "cards_in_hand": gen_start_cards,
-        "played_card_effects_and_actions": extract_played_card_effects_and_actions(
-            player_model.thisPlayer
-        ),
-    }
+    return omit_empty(
+        {
+            "cards_in_hand_count": len(gen_start_cards),
+            "cards_in_hand": gen_start_cards,
+            "played_card_effects_and_actions": (
+                extract_played_card_effects_and_actions(player_model.thisPlayer)
+            ),
+        }
+    )
 
 
 def _suggested_tools(
@@ -757,6 +891,79 @@ def _suggested_tools(
     return suggested
 
 
+# What `build_agent_state(sections=...)` can select. `waiting_for` brings
+# `suggested_tools` and `card_details_version` with it; `game` includes the
+# board summary and milestones/awards.
+AGENT_STATE_SECTIONS = (
+    "session",
+    "game",
+    "you",
+    "opponents",
+    "waiting_for",
+    "generation_start",
+    "opponent_new_cards",
+    "raw_player_model",
+)
+
+
+# Top-level response keys each section produces.
+_SECTION_KEYS = {section: (section,) for section in AGENT_STATE_SECTIONS} | {
+    "waiting_for": ("waiting_for", "suggested_tools", "card_details_version")
+}
+
+
+def _wanted_sections(sections: Collection[str] | None) -> frozenset[str]:
+    if sections is None:
+        return frozenset(AGENT_STATE_SECTIONS)
+    unknown = set(sections).difference(AGENT_STATE_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown sections {sorted(unknown)}; "
+            f"expected some of: {', '.join(AGENT_STATE_SECTIONS)}"
+        )
+    return frozenset(sections)
+
+
+# One-off events rather than state: sent as they are, never diffed.
+_DELTA_EVENT_KEYS = (
+    "generation_start",
+    "opponent_new_cards",
+    "opponent_actions_between_turns",
+    "raw_player_model",
+)
+
+
+def _delta_response(
+    cache: _SessionCache,
+    state: dict[str, Any],
+    held_sequence: int | None,
+    sections: Collection[str] = AGENT_STATE_SECTIONS,
+) -> dict[str, Any]:
+    """The delta-mode response for ``state``, numbered with the next sequence.
+
+    When the client holds the last state sent (``held_sequence``) the response
+    carries ``base_sequence`` and a ``delta`` patching that state; otherwise it
+    is the full state. Events are sent alongside either way. Top-level keys
+    outside ``sections`` keep their last sent value.
+    """
+    events = {key: state.pop(key) for key in _DELTA_EVENT_KEYS if key in state}
+    previous = cache.last_sent_state
+    if previous is not None and len(sections) < len(AGENT_STATE_SECTIONS):
+        owned = {key for section in sections for key in _SECTION_KEYS[section]}
+        state = {k: v for k, v in previous.items() if k not in owned} | state
+    base_sequence = cache.delta_sequence
+    cache.delta_sequence += 1
+    cache.last_sent_state = state
+    response: dict[str, Any] = {"sequence": cache.delta_sequence}
+    if previous is not None and held_sequence == base_sequence:
+        response["base_sequence"] = base_sequence
+        response["delta"] = merge_patch(previous, state)
+    else:
+        response.update(state)
+    response.update(events)
+    return response
+
+
 def build_agent_state(
     player_model: ApiPlayerViewModel,
     include_full_model: bool = False,
@@ -766,11 +973,31 @@ def build_agent_state(
     player_id_fallback: str | None = None,
     auto_response: bool = False,
     between_turns_actions: list[str] | None = None,
+    resync_card_details: bool = False,
+    card_details_version: int | None = None,
+    delta: bool = False,
+    since_sequence: int | None = None,
+    sections: Collection[str] | None = None,
 ) -> dict[str, Any]:
+    """Shape ``player_model`` into the compact state every tool returns.
+
+    ``sections`` limits the response to those `AGENT_STATE_SECTIONS`; the
+    others are not computed at all, and what they track for deduplication
+    (new opponent cards, constants, milestones) waits for a response that
+    includes them. Requested ``you`` / ``opponents`` are always sent.
+
+    Auto-responses carry ``card_details_version``: card details are sent in
+    full once per version and by name only after that. ``resync_card_details``
+    starts a new version, for an agent that lost the earlier details, as does
+    a ``card_details_version`` other than the current one.
+
+    With ``delta`` every section is built in full and the response is a
+    `_delta.merge_patch` against the state last sent instead (see
+    `_delta_response`); the per-section suppression above is not applied.
+    """
+    wanted = _wanted_sections(sections)
     game = player_model.game
     waiting_for = player_model.waitingFor
-    input_type = input_type_name(waiting_for)
-    you, opponents = _summarize_players(player_model)
 
     show_board = include_board_state or (
         detail_level == DetailLevel.FULL and game.phase in END_OF_GENERATION_PHASES
@@ -779,47 +1006,100 @@ def build_agent_state(
     generation = game.generation
     player_id = player_model.id or player_id_fallback or ""
     cache = _session_cache(game.id or "", player_id)
-
-    session: dict[str, Any] = {"player_id": player_id}
-    if detail_level == DetailLevel.FULL and base_url is not None:
-        session["base_url"] = base_url
-
-    game_state, is_gen_start = _build_game_state_section(
-        game, cache, detail_level, show_board
+    resync_card_details = resync_card_details or (
+        card_details_version is not None
+        and card_details_version != cache.card_tracker.version
     )
-
-    if detail_level == DetailLevel.FULL:
-        you_state = you.to_full_payload()
-        opponents_state = [summary.to_full_payload() for summary in opponents]
-        opponent_new_cards = _detect_new_opponent_cards(player_model, cache)
-    else:
-        you_state = you.to_minimal_payload()
-        opponents_state = [summary.to_minimal_payload() for summary in opponents]
-        opponent_new_cards = []
+    if resync_card_details:
+        cache.card_tracker.reset()
 
     result: dict[str, Any] = {}
-    if cache.last_session != session:
-        cache.last_session = session
-        result["session"] = session
-    result["game"] = game_state
-    if _should_include_player_state(cache, detail_level, is_gen_start):
-        result["you"] = you_state
-        result["opponents"] = opponents_state
-    result["waiting_for"] = normalize_waiting_for(
-        waiting_for,
-        detail_level=detail_level,
-        generation=generation,
-        auto_response=auto_response,
-    )
-    if auto_response and detail_level == DetailLevel.FULL and is_gen_start:
+    if "session" in wanted:
+        session: dict[str, Any] = {"player_id": player_id}
+        if detail_level == DetailLevel.FULL and base_url is not None:
+            session["base_url"] = base_url
+        if cache.last_session != session or delta:
+            cache.last_session = session
+            result["session"] = session
+
+    if "game" in wanted:
+        result["game"], is_gen_start = _build_game_state_section(
+            game, cache, detail_level, show_board, complete=delta
+        )
+    else:
+        # Left for the next response that includes `game` to record.
+        is_gen_start = cache.last_generation != generation
+
+    if "you" in wanted or "opponents" in wanted:
+        you, opponents = _summarize_players(player_model)
+        if detail_level == DetailLevel.FULL:
+            you_state = you.to_full_payload()
+            opponents_state = [summary.to_full_payload() for summary in opponents]
+        else:
+            you_state = you.to_minimal_payload()
+            opponents_state = [summary.to_minimal_payload() for summary in opponents]
+        if delta:
+            result["you"] = you_state
+            # Keyed by color, so a patch touches only the opponents that changed.
+            result["opponents"] = {
+                summary.color: payload
+                for summary, payload in zip(opponents, opponents_state, strict=True)
+            }
+        elif sections is not None or _should_include_player_state(
+            cache, detail_level, is_gen_start
+        ):
+            # Explicitly requested player sections are always sent.
+            result["you"] = you_state
+            if opponents_state:
+                result["opponents"] = opponents_state
+        if "you" not in wanted:
+            result.pop("you", None)
+        if "opponents" not in wanted:
+            result.pop("opponents", None)
+
+    if "waiting_for" in wanted:
+        normalized_waiting_for = normalize_waiting_for(
+            waiting_for,
+            detail_level=detail_level,
+            generation=generation,
+            # Delta mode deduplicates unchanged cards by diffing instead.
+            auto_response=auto_response and not delta,
+            card_tracker=cache.card_tracker,
+        )
+        if normalized_waiting_for is not None:
+            # A card list emptied by filtering is dropped with the other empties.
+            result["waiting_for"] = omit_empty(normalized_waiting_for)
+        if (auto_response or resync_card_details) and not delta:
+            result["card_details_version"] = cache.card_tracker.version
+    # Sent unasked with the first auto-response of a generation; a proactive
+    # call gets it only by naming the section.
+    if (
+        "generation_start" in wanted
+        and detail_level == DetailLevel.FULL
+        and (is_gen_start if auto_response else sections is not None)
+    ):
         result["generation_start"] = _build_generation_start(player_model, generation)
-    result["suggested_tools"] = _suggested_tools(input_type, waiting_for)
-    result["opponent_new_cards"] = opponent_new_cards
+    if "waiting_for" in wanted:
+        suggested_tools = _suggested_tools(input_type_name(waiting_for), waiting_for)
+        if suggested_tools:
+            result["suggested_tools"] = suggested_tools
+    if "opponent_new_cards" in wanted and detail_level == DetailLevel.FULL:
+        opponent_new_cards = _detect_new_opponent_cards(player_model, cache)
+        if opponent_new_cards:
+            result["opponent_new_cards"] = opponent_new_cards
     if between_turns_actions:
         result["opponent_actions_between_turns"] = between_turns_actions
 
-    if include_full_model:
-        result["raw_player_model"] = thin_raw_player_model(
-            player_model.model_dump(exclude_none=True)
-        )
-    return strip_empty(result)
+    if include_full_model and "raw_player_model" in wanted:
+        result["raw_player_model"] = _raw_player_model(player_model)
+    if game.phase == "end":
+        # Nothing more to deduplicate once the game is over.
+        _SESSION_CACHES.evict(_session_cache_key(game.id or "", player_id))
+        _cache_store.discard_snapshot(game.id or "", player_id)
+    elif game.id and player_id:
+        _save_session_cache(cache, game.id, player_id)
+    # Every part above omits its empty values as it is built (`omit_empty`).
+    if delta:
+        held = cache.delta_sequence if auto_response else since_sequence
+        return _delta_response(cache, result, held, sections=wanted)
+    return result
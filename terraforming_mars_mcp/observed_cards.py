@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from ._bounded_cache import BoundedCache
 from .api_response_models import CardModel, PlayerViewModel
 from .waiting_for import title_to_text
 
 _REPO_OUTPUT_ROOT = Path("agent-prompts/agent_game_notes")
-_IN_MEMORY_STATE: dict[str, dict[str, Any]] = {}
+_IN_MEMORY_STATE: BoundedCache[str, dict[str, Any]] = BoundedCache("observed_cards")
+# Player models are observed from worker threads, many at once on HTTP
+# transports; updates to one game's state must not interleave.
+_STATE_LOCK = threading.Lock()
 
 _DRAFT_TITLE_PATTERNS = (
     re.compile(r"select (?:a|two) card", re.IGNORECASE),
@@ -36,6 +41,11 @@ def _append_unique(values: list[str], additions: list[str]) -> bool:
 
 
 def observe_player_model(player_model: PlayerViewModel) -> None:
+    with _STATE_LOCK:
+        _observe_player_model(player_model)
+
+
+def _observe_player_model(player_model: PlayerViewModel) -> None:
     game_id = player_model.game.id
     player_id = player_model.id
     if not game_id or not player_id:
@@ -141,4 +151,5 @@ def observe_player_model(player_model: PlayerViewModel) -> None:
         with final_path.open("w", encoding="utf-8") as f:
             json.dump(final_state, f, indent=2, ensure_ascii=True, sort_keys=True)
             f.write("\n")
-        state["finalized"] = True
+        # Keep only the marker, so later end-phase fetches don't flush again.
+        _IN_MEMORY_STATE[tracker_key] = {"finalized": True}
@@ -14,23 +14,52 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+from collections.abc import Sequence
 from pathlib import Path
 
+from mcp.server.transport_security import TransportSecuritySettings
+
 from ._app import mcp
+from ._bounded_cache import cache_stats
 from ._enums import DetailLevel
 from ._models import PaymentPayloadModel
-from .card_info import compact_cards
+from ._polling import POLL_METRICS
+from ._session import session_to_configure
+from .card_info import (
+    card_info,
+    card_search_index,
+    compact_cards,
+    hand_playability,
+)
 from .game_state import build_agent_state
 from .turn_flow import (
     CFG,
-    get_player,
+    current_session,
+    get_player_cached,
     is_revisable_selection_prompt,
+    run_blocking,
     submit_and_return_state,
     wait_for_turn_from_player_model,
 )
 from .waiting_for import normalize_or_sub_response
 
+logger = logging.getLogger(__name__)
+
 LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+TRANSPORTS = ("stdio", "streamable-http", "sse")
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+DEFAULT_TRANSPORT = os.environ.get("TM_MCP_TRANSPORT", "stdio")
+DEFAULT_HOST = os.environ.get("TM_MCP_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("TM_MCP_PORT", "8000"))
+# Extra Host header values (e.g. "mcp.example.com:8000" or "10.0.0.5:*") the
+# DNS-rebinding guard admits besides loopback, for non-loopback binds.
+DEFAULT_ALLOWED_HOSTS = [
+    value.strip()
+    for value in os.environ.get("TM_MCP_ALLOWED_HOSTS", "").split(",")
+    if value.strip()
+]
+_LOOPBACK_ALLOWED_HOSTS = ("127.0.0.1:*", "localhost:*", "[::1]:*")
 
 DEFAULT_LOG_LEVEL = os.environ.get("TM_MCP_LOG_LEVEL", "DEBUG").upper()
 DEFAULT_LOG_FILE = os.environ.get(
@@ -62,16 +91,81 @@ def _configure_server_logging(log_level: str, log_file: str) -> Path:
     return log_path
 
 
+def _configure_http_transport(
+    host: str, port: int, allowed_hosts: Sequence[str] = ()
+) -> None:
+    mcp.settings.host = host
+    mcp.settings.port = port
+    if host in LOOPBACK_HOSTS and not allowed_hosts:
+        # FastMCP's own loopback-only DNS-rebinding guard already applies.
+        return
+    if host not in LOOPBACK_HOSTS and not allowed_hosts:
+        logger.warning(
+            "Bound to %s but only loopback Host headers are allowed; "
+            "pass --allowed-host for the names clients connect with",
+            host,
+        )
+    hosts = [*_LOOPBACK_ALLOWED_HOSTS, *allowed_hosts]
+    mcp.settings.transport_security = TransportSecuritySettings(
+        enable_dns_rebinding_protection=True,
+        allowed_hosts=hosts,
+        allowed_origins=[
+            f"{scheme}://{allowed}" for allowed in hosts for scheme in ("http", "https")
+        ],
+    )
+
+
 @mcp.tool()
 def configure_session(
-    base_url: str | None = None, player_id: str | None = None
+    base_url: str | None = None,
+    player_id: str | None = None,
+    poll_min_seconds: float | None = None,
+    poll_max_seconds: float | None = None,
+    push_url: str | None = None,
+    session_handle: str | None = None,
+    delta_responses: bool | None = None,
 ) -> dict[str, object]:
-    """Set or update Terraforming Mars server URL and player ID for later tools."""
+    """Set or update Terraforming Mars server URL and player ID for later tools.
+
+    Settings apply to this MCP client session only, starting from the server's
+    defaults, so one server can drive many agents. `session_handle` attaches
+    this client to a named session instead, e.g. to resume it after a
+    reconnect. `poll_min_seconds` / `poll_max_seconds` bound how often turn
+    waits poll the server: polling backs off toward the max while opponents
+    are thinking. `push_url` is an optional server-sent-events endpoint
+    (`{player_id}` is substituted) that wakes turn waits as soon as the game
+    advances; pass an empty string to turn it off. `delta_responses` makes
+    state responses numbered patches against the previous one (see
+    `get_game_state`).
+    """
+    session = session_to_configure(session_handle)
     if base_url:
-        CFG.base_url = base_url.rstrip("/")
+        session.base_url = base_url.rstrip("/")
     if player_id:
-        CFG.player_id = player_id
-    return {"base_url": CFG.base_url, "player_id": CFG.player_id}
+        session.player_id = player_id
+    if poll_min_seconds is not None or poll_max_seconds is not None:
+        session.polling = session.polling.with_overrides(
+            poll_min_seconds, poll_max_seconds
+        )
+    if push_url is not None:
+        session.push_url = push_url or None
+    if delta_responses is not None:
+        session.delta_responses = delta_responses
+    result: dict[str, object] = {
+        "base_url": session.base_url,
+        "player_id": session.player_id,
+        "push_url": session.push_url,
+        "delta_responses": session.delta_responses,
+        "polling": {
+            "min_seconds": session.polling.min_interval,
+            "max_seconds": session.polling.max_interval,
+            **POLL_METRICS.snapshot(),
+        },
+        "caches": cache_stats(),
+    }
+    if session_handle:
+        result["session_handle"] = session_handle
+    return result
 
 
 @mcp.tool()
@@ -79,9 +173,39 @@ async def get_game_state(
     include_full_model: bool = False,
     include_board_state: bool = False,
     detail_level: DetailLevel = DetailLevel.FULL,
+    resync_card_details: bool = False,
+    card_details_version: int | None = None,
+    since_sequence: int | None = None,
+    sections: list[str] | None = None,
 ) -> dict[str, object]:
-    """Fetch current player state plus compact, agent-friendly action/game summary."""
-    player_model = get_player()
+    """Fetch current player state plus compact, agent-friendly action/game summary.
+
+    `sections` returns only those parts, skipping the work for the rest:
+    any of "session", "game", "you", "opponents", "waiting_for" (with
+    `suggested_tools`), "generation_start", "opponent_new_cards" and
+    "raw_player_model". E.g. `["waiting_for"]` to just read the prompt.
+    "generation_start" (your hand in full plus your played cards' effects
+    and actions, as sent when a generation begins) is only returned when
+    named here.
+
+    After an action, repeated cards come back by name only, referring to the
+    details sent under the same `card_details_version`. Set
+    `resync_card_details` if you no longer have their details (e.g. after
+    losing context), or pass the `card_details_version` you hold: if it is
+    not the current one, the next responses send them in full again under a
+    new version.
+
+    With `delta_responses` on (`configure_session`), every state response has
+    a `sequence`. Responses after an action carry `base_sequence` and a
+    `delta` instead of the state: a JSON merge patch (`null` removes a key,
+    objects merge, lists are replaced; `opponents` is keyed by color) to
+    apply to the state of `base_sequence`. This tool returns the full state
+    unless `since_sequence` is the sequence you last received, then a delta.
+    If a delta's `base_sequence` is not what you hold, call this tool again
+    without `since_sequence`.
+    """
+    session = current_session()
+    player_model = await run_blocking(get_player_cached)
     between_turns_actions: list[str] | None = None
     if is_revisable_selection_prompt(player_model):
         # A submitted draft pick is still revisable until the opponent picks;
@@ -97,19 +221,34 @@ async def get_game_state(
         include_full_model=include_full_model,
         include_board_state=include_board_state,
         detail_level=detail_level,
-        base_url=CFG.base_url,
-        player_id_fallback=CFG.player_id,
+        base_url=session.base_url,
+        player_id_fallback=session.player_id,
         between_turns_actions=between_turns_actions,
+        resync_card_details=resync_card_details,
+        card_details_version=card_details_version,
+        delta=session.delta_responses,
+        since_sequence=since_sequence,
+        sections=sections,
     )
 
 
 @mcp.tool()
-def get_my_hand_cards() -> dict[str, object]:
-    """Return all cards currently in your hand."""
-    player_model = get_player()
+async def get_my_hand_cards() -> dict[str, object]:
+    """Return all cards currently in your hand.
+
+    `playability` sorts them by play requirements (global parameters, tags,
+    production, TR, tiles): `playable_now`, `steps_away` (name -> steps still
+    needed), `blocked` (a maximum already passed) and `unchecked` (name ->
+    requirement kinds not evaluated). Costs are not considered.
+    """
+    player_model = await run_blocking(get_player_cached)
     this_player = player_model.thisPlayer
     game = player_model.game
     cards = compact_cards(player_model.cardsInHand, generation=game.generation)
+    # The first call builds the card table.
+    playability = await run_blocking(
+        hand_playability, game, this_player, player_model.cardsInHand
+    )
     return {
         "generation": game.generation,
         "phase": game.phase,
@@ -117,6 +256,81 @@ def get_my_hand_cards() -> dict[str, object]:
         "color": this_player.color,
         "cards_in_hand_count": len(cards),
         "cards_in_hand": cards,
+        "playability": {key: value for key, value in playability.items() if value},
+    }
+
+
+def _card_details(names: list[str], detail_level: DetailLevel) -> dict[str, object]:
+    unique = list(dict.fromkeys(names))
+    known = [name for name in unique if card_info(name)]
+    result: dict[str, object] = {
+        "cards": {
+            card.pop("name"): card
+            for card in compact_cards(known, detail_level=detail_level)
+        }
+    }
+    if len(known) < len(unique):
+        result["unknown"] = [name for name in unique if not card_info(name)]
+    return result
+
+
+@mcp.tool()
+async def get_card_details(
+    names: list[str], detail_level: DetailLevel = DetailLevel.FULL
+) -> dict[str, object]:
+    """Look up any number of cards by name in one call.
+
+    Returns `cards`, each card's details keyed by its name (repeated names are
+    looked up once), and `unknown`, the names not in the card database.
+    """
+    # The first lookup loads the card database; keep that off the event loop.
+    return await run_blocking(_card_details, names, detail_level)
+
+
+@mcp.tool()
+async def search_cards(
+    tags: list[str] | None = None,
+    min_cost: int | None = None,
+    max_cost: int | None = None,
+    requirement: str | None = None,
+    vp_kind: str | None = None,
+    card_type: str | None = None,
+    keywords: str | None = None,
+    page: int = 1,
+    page_size: int = 20,
+    detail_level: DetailLevel = DetailLevel.FULL,
+) -> dict[str, object]:
+    """Search the whole card database; every given filter must match.
+
+    `tags` must all be on the card (e.g. ["space"]); costs bound the base
+    cost. `requirement` is a play-requirement kind such as "oxygen",
+    "temperature", "oceans", "tag" or "tag:science"; `vp_kind` is "fixed" or
+    what the card scores per VP (e.g. "resourcesHere", "tag"); `card_type`
+    is e.g. "automated", "active" or "event". `keywords` must all appear in
+    the card's description, effects or actions (e.g. "plant tag"). Results
+    are in name order, `page_size` per page.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be at least 1")
+    # The first search builds the card table and indexes; keep that off the
+    # event loop.
+    index = await run_blocking(card_search_index)
+    matches = index.search(
+        tags=tags or (),
+        min_cost=min_cost,
+        max_cost=max_cost,
+        requirement=requirement,
+        vp_kind=vp_kind,
+        card_type=card_type,
+        keywords=keywords,
+    )
+    total = matches.bit_count()
+    names = index.names(matches, offset=(page - 1) * page_size, limit=page_size)
+    return {
+        "total": total,
+        "page": page,
+        "pages": -(-total // page_size),
+        "cards": compact_cards(names, detail_level=detail_level),
     }
 
 
@@ -201,6 +415,38 @@ def main() -> None:
         default=None,
         help="Player ID to use at startup (overrides TM_PLAYER_ID)",
     )
+    parser.add_argument(
+        "--transport",
+        default=DEFAULT_TRANSPORT,
+        choices=list(TRANSPORTS),
+        help=(
+            "MCP transport; the HTTP ones let many agents share one server "
+            "process (overrides TM_MCP_TRANSPORT)"
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help="Bind address for HTTP transports (overrides TM_MCP_HOST)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="Port for HTTP transports (overrides TM_MCP_PORT)",
+    )
+    parser.add_argument(
+        "--allowed-host",
+        dest="allowed_hosts",
+        metavar="HOST",
+        action="append",
+        default=None,
+        help=(
+            "Host header value HTTP clients may use besides loopback, e.g. "
+            "mcp.example.com:8000 or 10.0.0.5:*; repeatable (overrides "
+            "TM_MCP_ALLOWED_HOSTS, comma-separated)"
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default=DEFAULT_LOG_LEVEL,
@@ -221,7 +467,15 @@ def main() -> None:
     if args.player_id:
         CFG.player_id = args.player_id
 
-    mcp.run()
+    if args.transport != "stdio":
+        _configure_http_transport(
+            args.host,
+            args.port,
+            args.allowed_hosts
+            if args.allowed_hosts is not None
+            else DEFAULT_ALLOWED_HOSTS,
+        )
+    mcp.run(transport=args.transport)
 
 
 if __name__ == "__main__":
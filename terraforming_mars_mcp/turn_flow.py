@@ -1,20 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import http.client
 import json
+import logging
 import os
 import re
 import time
-from dataclasses import dataclass
-from typing import Any, Mapping, Sequence, cast
-from urllib import error, parse, request
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, cast
+from urllib import parse
+
+from pydantic import ValidationError
 
 from ._app import mcp
+from ._bounded_cache import BoundedCache
+from ._http_pool import pool_for
+from ._log_diff import LogAnchor, entries_after, entry_key
+from ._polling import POLL_METRICS
+from ._push import PushChannel
+
+# CFG is the default session; tools and tests still reach it as turn_flow.CFG.
+from ._session import CFG, SessionConfig, current_session  # noqa: F401
 from .api_response_models import (
     GameLogEntryModel as ApiGameLogEntryModel,
 )
 from .api_response_models import (
     JsonValue,
+    response_adapter,
 )
 from .api_response_models import (
     PlayerViewModel as ApiPlayerViewModel,
@@ -27,53 +42,61 @@ from .observed_cards import observe_player_model
 from .waiting_for import prepare_action, title_to_text
 
 TURN_WAIT_TIMEOUT_SECONDS = 2 * 60 * 60
-TURN_WAIT_POLL_INTERVAL_SECONDS = 2
 TURN_WAIT_PROGRESS_INTERVAL_SECONDS = 30
+# Within this window a cached player model is reused without asking the server.
+PLAYER_CACHE_TTL_SECONDS = float(os.environ.get("TM_PLAYER_CACHE_TTL_SECONDS", "2"))
 # TM-OSS serializes LogMessageDataType.PLAYER as numeric enum value 2.
 PLAYER_LOG_DATA_TYPE_NUMERIC = 2
+# ...and LogMessageType.NEW_GENERATION ("Generation N" markers) as 1.
+LOG_MESSAGE_TYPE_NEW_GENERATION = 1
 
+logger = logging.getLogger(__name__)
 
-@dataclass
-class SessionConfig:
-    base_url: str = os.environ.get("TM_SERVER_URL", "http://localhost:8080")
-    player_id: str | None = os.environ.get("TM_PLAYER_ID")
+
+_T = TypeVar("_T")
 
 
-CFG = SessionConfig()
+async def run_blocking(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking HTTP helper on a worker thread.
+
+    Async tools must await game-server requests through this so the MCP event
+    loop keeps serving progress notifications and other tool calls meanwhile.
+    """
+    return await asyncio.to_thread(func, *args)
 
 
 def _ensure_player_id(player_id: str | None = None) -> str:
-    pid = player_id or CFG.player_id
+    pid = player_id or current_session().player_id
     if not pid:
         raise ValueError("player_id is not set. Call configure_session first.")
     return pid
 
 
-def _http_json(
+def _http_request(
     method: str,
     path: str,
     query: Mapping[str, str] | None = None,
     body: JsonValue | None = None,
-) -> JsonValue:
-    url = CFG.base_url.rstrip("/") + path
+) -> bytes:
+    """Send a request to the game server and return the raw response body."""
+    target = path
     if query:
-        url += "?" + parse.urlencode(query)
+        target += "?" + parse.urlencode(query)
 
     payload = None
-    headers: dict[str, str] = {}
+    headers: dict[str, str] = {"Accept": "application/json"}
     if body is not None:
         payload = json.dumps(body).encode("utf-8")
         headers["Content-Type"] = "application/json"
 
-    req = request.Request(url=url, data=payload, headers=headers, method=method)
+    base_url = current_session().base_url
     try:
-        with request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8")
-            if not raw:
-                return {}
-            return cast(JsonValue, json.loads(raw))
-    except error.HTTPError as exc:
-        raw_error = exc.read().decode("utf-8", errors="replace")
+        resp = pool_for(base_url).request(method, target, body=payload, headers=headers)
+    except (OSError, http.client.HTTPException, ValueError) as exc:
+        raise RuntimeError(f"Cannot reach server at {base_url}: {exc}") from exc
+
+    if resp.status >= 400:
+        raw_error = resp.body.decode("utf-8", errors="replace")
         message = raw_error
         try:
             parsed_json = json.loads(raw_error)
@@ -81,30 +104,112 @@ def _http_json(
                 message = str(parsed_json["message"])
         except json.JSONDecodeError:
             pass
-        raise RuntimeError(f"HTTP {exc.code} {method} {path}: {message}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Cannot reach server at {CFG.base_url}: {exc}") from exc
+        raise RuntimeError(f"HTTP {resp.status} {method} {path}: {message}")
+    return resp.body
+
+
+def _http_json(
+    method: str,
+    path: str,
+    query: Mapping[str, str] | None = None,
+    body: JsonValue | None = None,
+) -> JsonValue:
+    raw = _http_request(method, path, query, body)
+    if not raw:
+        return {}
+    return cast(JsonValue, json.loads(raw))
+
+
+def _http_model(
+    response_type: type[_T],
+    method: str,
+    path: str,
+    query: Mapping[str, str] | None = None,
+    body: JsonValue | None = None,
+) -> _T:
+    """Request ``path`` and validate the body bytes directly into ``response_type``."""
+    raw = _http_request(method, path, query, body)
+    try:
+        model = response_adapter(response_type).validate_json(raw)
+    except ValidationError as exc:
+        # A root-level error means the body was not the expected JSON object
+        # at all, as opposed to an object with bad fields.
+        if any(not err["loc"] for err in exc.errors()):
+            raise RuntimeError(f"Unexpected {path} response") from exc
+        raise
+    if isinstance(model, ApiPlayerViewModel):
+        # Kept so `include_full_model` can thin the body as decoded.
+        model._raw_json = raw
+    return model
+
+
+@dataclass
+class _CachedPlayerModel:
+    model: ApiPlayerViewModel
+    validated_at: float
+
+
+# Last player model seen per (base_url, player_id), from any fetch or submit.
+_PLAYER_CACHE: BoundedCache[tuple[str, str], _CachedPlayerModel] = BoundedCache(
+    "player_models"
+)
+
+
+def _remember_player_model(pid: str, player_model: ApiPlayerViewModel) -> None:
+    _PLAYER_CACHE[(current_session().base_url, pid)] = _CachedPlayerModel(
+        player_model, time.monotonic()
+    )
 
 
 def get_player(player_id: str | None = None) -> ApiPlayerViewModel:
     pid = _ensure_player_id(player_id)
-    result = _http_json("GET", "/api/player", {"id": pid})
-    if not isinstance(result, dict):
-        raise RuntimeError("Unexpected /api/player response")
-    player_model = ApiPlayerViewModel.model_validate(result)
+    player_model = _http_model(ApiPlayerViewModel, "GET", "/api/player", {"id": pid})
     observe_player_model(player_model)
+    _remember_player_model(pid, player_model)
     return player_model
 
 
+def get_player_cached(player_id: str | None = None) -> ApiPlayerViewModel:
+    """Player model for read-only tools, reusing the last one while still current.
+
+    Within ``PLAYER_CACHE_TTL_SECONDS`` of the last fetch the cached model is
+    returned as is. After that it is revalidated with the cheap
+    ``/api/waitingfor`` call at the cached ``(gameAge, undoCount)``. ``WAIT``
+    means nothing has happened since. ``GO`` is the answer all through this
+    player's own turn, even after an undo or another player's simultaneous
+    choice changed the prompt, so it only counts as current when the cached
+    model holds a prompt and waitingfor reports the same
+    ``(gameAge, undoCount)``. Anything else refetches ``/api/player``.
+    """
+    pid = _ensure_player_id(player_id)
+    cached = _PLAYER_CACHE.get((current_session().base_url, pid))
+    if cached is None:
+        return get_player(pid)
+    now = time.monotonic()
+    if now - cached.validated_at <= PLAYER_CACHE_TTL_SECONDS:
+        return cached.model
+    game = cached.model.game
+    waiting = _get_waiting_for_state(int(game.gameAge), int(game.undoCount), pid)
+    still_current = waiting.result == "WAIT" or (
+        waiting.result == "GO"
+        and cached.model.waitingFor is not None
+        and (waiting.gameAge, waiting.undoCount) == (game.gameAge, game.undoCount)
+    )
+    if not still_current:
+        return get_player(pid)
+    cached.validated_at = now
+    return cached.model
+
+
 def _post_input(
     response: dict[str, JsonValue], player_id: str | None = None
 ) -> ApiPlayerViewModel:
     pid = _ensure_player_id(player_id)
-    result = _http_json("POST", "/player/input", {"id": pid}, response)
-    if not isinstance(result, dict):
-        raise RuntimeError("Unexpected /player/input response")
-    player_model = ApiPlayerViewModel.model_validate(result)
+    player_model = _http_model(
+        ApiPlayerViewModel, "POST", "/player/input", {"id": pid}, response
+    )
     observe_player_model(player_model)
+    _remember_player_model(pid, player_model)
     return player_model
 
 
@@ -112,43 +217,240 @@ def _get_waiting_for_state(
     game_age: int, undo_count: int, player_id: str | None = None
 ) -> ApiWaitingForStatusModel:
     pid = _ensure_player_id(player_id)
-    result = _http_json(
+    return _http_model(
+        ApiWaitingForStatusModel,
         "GET",
         "/api/waitingfor",
         {"id": pid, "gameAge": str(game_age), "undoCount": str(undo_count)},
     )
-    if not isinstance(result, dict):
-        raise RuntimeError("Unexpected /api/waitingfor response")
-    return ApiWaitingForStatusModel.model_validate(result)
 
 
-def _get_game_logs(player_id: str | None = None) -> list[ApiGameLogEntryModel]:
+@dataclass
+class _GameStateWatch:
+    """What is known about one game at one (gameAge, undoCount)."""
+
+    # Seats whose own poll answered WAIT here. Prompts only appear when the
+    # game advances, so these stay WAIT until the state changes.
+    waiting_seats: set[str] = field(default_factory=set)
+    last_wait_at: float | None = None
+    # Set once a waiting seat sees anything but WAIT: the game has moved on.
+    moved: bool = False
+    in_flight: asyncio.Future[ApiWaitingForStatusModel] | None = None
+    last_polled_at: dict[str, float] = field(default_factory=dict)
+
+
+class TurnWaiter:
+    """Shares `/api/waitingfor` polls between concurrent turn waits.
+
+    Waits on seats of the same game at the same ``(gameAge, undoCount)`` are
+    deduplicated: while a waiting seat's poll is in flight the others await
+    its answer instead of sending their own, a WAIT newer than a seat's last
+    poll and younger than ``fresh_for`` answers for it too, and once any of
+    them sees the game move every other one is told REFRESH. Polls are only
+    ever driven by a waiting tool call, so polling stops with the last one.
+    """
+
+    def __init__(self) -> None:
+        self._watches: dict[tuple[str, str, int, int], _GameStateWatch] = {}
+        self._seat_keys: dict[tuple[str, str], tuple[str, str, int, int]] = {}
+
+    def _watch_for(self, seat: str, key: tuple[str, str, int, int]) -> _GameStateWatch:
+        seat_key = (key[0], seat)
+        previous = self._seat_keys.get(seat_key)
+        if previous != key:
+            if previous is not None:
+                self._forget(seat, previous)
+            self._seat_keys[seat_key] = key
+        return self._watches.setdefault(key, _GameStateWatch())
+
+    def _forget(self, seat: str, key: tuple[str, str, int, int]) -> None:
+        watch = self._watches.get(key)
+        if watch is None:
+            return
+        watch.waiting_seats.discard(seat)
+        watch.last_polled_at.pop(seat, None)
+        if not watch.last_polled_at and watch.in_flight is None:
+            del self._watches[key]
+
+    def leave(self, seat: str) -> None:
+        """Drop ``seat``'s interest; call when its turn wait returns."""
+        key = self._seat_keys.pop((current_session().base_url, seat), None)
+        if key is not None:
+            self._forget(seat, key)
+
+    def watched_states(self) -> int:
+        return len(self._watches)
+
+    async def poll(
+        self,
+        seat: str,
+        game: str,
+        game_age: int,
+        undo_count: int,
+        fetch: Callable[[], Awaitable[ApiWaitingForStatusModel]],
+        fresh_for: float,
+    ) -> ApiWaitingForStatusModel:
+        """The waitingfor status of ``seat``, polled with ``fetch`` if needed."""
+        key = (current_session().base_url, game, game_age, undo_count)
+        watch = self._watch_for(seat, key)
+        now = time.monotonic()
+        last_polled_at = watch.last_polled_at.get(seat)
+        watch.last_polled_at[seat] = now
+        if seat in watch.waiting_seats:
+            if watch.moved:
+                POLL_METRICS.record_shared_poll()
+                return ApiWaitingForStatusModel(result="REFRESH", waitingFor=[])
+            if (
+                watch.last_wait_at is not None
+                and last_polled_at is not None
+                and watch.last_wait_at > last_polled_at
+                and now - watch.last_wait_at < fresh_for
+            ):
+                POLL_METRICS.record_shared_poll()
+                return ApiWaitingForStatusModel(result="WAIT", waitingFor=[])
+            if watch.in_flight is not None:
+                shared = await self._join(watch.in_flight)
+                if shared is not None:
+                    POLL_METRICS.record_shared_poll()
+                    if shared.result == "GO":
+                        # Another seat's prompt: for this one the game moved.
+                        return ApiWaitingForStatusModel(result="REFRESH", waitingFor=[])
+                    return shared
+            return await self._poll_shared(seat, watch, fetch)
+        waiting = await fetch()
+        self._record(seat, watch, waiting, confirmed=False)
+        return waiting
+
+    @staticmethod
+    async def _join(
+        in_flight: asyncio.Future[ApiWaitingForStatusModel],
+    ) -> ApiWaitingForStatusModel | None:
+        try:
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            if not in_flight.cancelled():
+                raise
+            # The polling call was cancelled; poll for ourselves instead.
+            return None
+
+    async def _poll_shared(
+        self,
+        seat: str,
+        watch: _GameStateWatch,
+        fetch: Callable[[], Awaitable[ApiWaitingForStatusModel]],
+    ) -> ApiWaitingForStatusModel:
+        in_flight: asyncio.Future[ApiWaitingForStatusModel] = (
+            asyncio.get_running_loop().create_future()
+        )
+        watch.in_flight = in_flight
+        try:
+            waiting = await fetch()
+        except Exception as exc:
+            in_flight.set_exception(exc)
+            # Mark it retrieved: sharers re-raise it, but there may be none.
+            in_flight.exception()
+            raise
+        except BaseException:
+            in_flight.cancel()
+            raise
+        finally:
+            watch.in_flight = None
+        in_flight.set_result(waiting)
+        self._record(seat, watch, waiting, confirmed=True)
+        return waiting
+
+    @staticmethod
+    def _record(
+        seat: str,
+        watch: _GameStateWatch,
+        waiting: ApiWaitingForStatusModel,
+        confirmed: bool,
+    ) -> None:
+        # Stamp the seat's own look at the same instant, so its own WAIT is
+        # never mistaken for a newer one from another seat.
+        now = time.monotonic()
+        watch.last_polled_at[seat] = now
+        if waiting.result == "WAIT":
+            watch.waiting_seats.add(seat)
+            watch.last_wait_at = now
+        elif confirmed:
+            watch.moved = True
+
+
+TURN_WAITER = TurnWaiter()
+
+
+@dataclass(frozen=True)
+class LogCursor:
+    """How far into the game log a session has read: up to ``anchor`` in
+    generation ``generation``'s log page."""
+
+    generation: int
+    anchor: LogAnchor = field(default_factory=LogAnchor)
+
+
+# Where each (base_url, player_id) last stopped reading the game log.
+_LOG_CURSORS: BoundedCache[tuple[str, str], LogCursor] = BoundedCache("log_cursors")
+
+
+def _get_game_log_page(
+    generation: int, player_id: str | None = None
+) -> list[dict[str, JsonValue]]:
+    """Raw, unvalidated log entries for one generation.
+
+    TM-OSS scopes `/api/game/logs` to a single generation when asked; a server
+    that ignores ``generation`` returns the whole log instead, which
+    `_get_game_logs_since` detects and trims locally.
+    """
     pid = _ensure_player_id(player_id)
-    result = _http_json("GET", "/api/game/logs", {"id": pid})
+    result = _http_json(
+        "GET", "/api/game/logs", {"id": pid, "generation": str(generation)}
+    )
     if not isinstance(result, list):
         raise RuntimeError("Unexpected /api/game/logs response")
-    normalized_logs: list[ApiGameLogEntryModel] = []
-    for item in result:
-        if not isinstance(item, dict):
-            continue
-        normalized_logs.append(ApiGameLogEntryModel.model_validate(item))
-    return normalized_logs
-
-
-def _log_signature(entry: ApiGameLogEntryModel) -> str:
-    return json.dumps(
-        {
-            "timestamp": entry.timestamp,
-            "message": entry.message,
-            "data": [datum.model_dump(exclude_none=True) for datum in entry.data],
-            "type": entry.type,
-            "playerId": entry.playerId,
-        },
-        sort_keys=True,
-        separators=(",", ":"),
+    return [item for item in result if isinstance(item, dict)]
+
+
+def _cursor_at_end(generation: int, page: Sequence[dict[str, JsonValue]]) -> LogCursor:
+    return LogCursor(generation, LogAnchor.at_end_of(page))
+
+
+def _get_game_log_cursor(generation: int, player_id: str | None = None) -> LogCursor:
+    """A cursor at the current end of the log, without validating any entry."""
+    return _cursor_at_end(generation, _get_game_log_page(generation, player_id))
+
+
+def _is_generation_scoped(page: Sequence[dict[str, JsonValue]]) -> bool:
+    # A scoped page opens with at most its own "Generation N" marker; the
+    # whole log carries one marker per generation after the first.
+    return not any(
+        entry.get("type") == LOG_MESSAGE_TYPE_NEW_GENERATION for entry in page[1:]
     )
 
 
+def _get_game_logs_since(
+    cursor: LogCursor, generation: int, player_id: str | None = None
+) -> tuple[list[ApiGameLogEntryModel], LogCursor]:
+    """Log entries appended after ``cursor``, plus the cursor past them.
+
+    Only the pages from ``cursor.generation`` through ``generation`` are
+    fetched, and only the entries past the cursor are validated.
+    """
+    page = _get_game_log_page(cursor.generation, player_id)
+    new_entries = entries_after(page, cursor.anchor)
+    end = _cursor_at_end(cursor.generation, page)
+    if _is_generation_scoped(page):
+        for later in range(cursor.generation + 1, generation + 1):
+            page = _get_game_log_page(later, player_id)
+            new_entries.extend(page)
+            end = _cursor_at_end(later, page)
+    else:
+        # The server sent the whole log; later "pages" would repeat it.
+        end = _cursor_at_end(max(generation, cursor.generation), page)
+    logs = response_adapter(list[ApiGameLogEntryModel]).validate_python(new_entries)
+    return logs, end
+
+
 def _format_log_entry(
     entry: ApiGameLogEntryModel, color_to_name: dict[str, str]
 ) -> str:
@@ -177,11 +479,10 @@ def extract_opponent_actions(
     opponent_colors: set[str],
     color_to_name: dict[str, str],
 ) -> list[str]:
-    seen = {_log_signature(entry) for entry in initial_logs}
+    seen = {entry_key(entry.model_dump()) for entry in initial_logs}
     actions: list[str] = []
     for entry in final_logs:
-        signature = _log_signature(entry)
-        if signature in seen:
+        if seen and entry_key(entry.model_dump()) in seen:
             continue
         data = entry.data
         has_opponent = False
@@ -217,9 +518,17 @@ def is_revisable_selection_prompt(player_model: ApiPlayerViewModel) -> bool:
     return "change your selection" in title_to_text(waiting_for.title).lower()
 
 
+async def _open_push_channel() -> PushChannel | None:
+    push_url = current_session().push_url
+    if not push_url:
+        return None
+    url = push_url.replace("{player_id}", parse.quote(_ensure_player_id()))
+    return await PushChannel.connect(url)
+
+
 async def wait_for_turn_from_player_model(
     player_model: ApiPlayerViewModel,
-    initial_logs: Sequence[ApiGameLogEntryModel] | None = None,
+    log_cursor: LogCursor | None = None,
     committed_summary: str = (
         "No game state input was submitted in this call, so nothing changed on the server. "
     ),
@@ -231,7 +540,14 @@ async def wait_for_turn_from_player_model(
         p.color: p.name for p in player_model.players if p.color and p.name
     }
     opponent_colors = {color for color in color_to_name if color != this_color}
-    start_logs = list(initial_logs) if initial_logs is not None else _get_game_logs()
+    # Opponent actions are the log entries appended past this cursor: the
+    # given one, else where this session last stopped reading, else the
+    # current end of the log.
+    session = current_session()
+    log_key = (session.base_url, player_model.id)
+    start_cursor = log_cursor or _LOG_CURSORS.get(log_key)
+    if start_cursor is None:
+        start_cursor = await run_blocking(_get_game_log_cursor, int(game.generation))
 
     game_age = int(game.gameAge)
     undo_count = int(game.undoCount)
@@ -240,71 +556,124 @@ async def wait_for_turn_from_player_model(
     next_progress_report_at = wait_started_at + TURN_WAIT_PROGRESS_INTERVAL_SECONDS
     last_waitingfor: dict[str, JsonValue] | None = None
     context = mcp.get_context()
+    schedule = session.polling.schedule()
+    polls = 0
+    # Seats of one game share polls through TURN_WAITER.
+    seat = player_model.id
+    game_key = game.id or seat
+    # With a push channel the poll schedule is only a safety net: a push event
+    # ends the sleep early and the next poll confirms the turn.
+    push = await _open_push_channel()
 
-    while True:
-        waiting = _get_waiting_for_state(game_age, undo_count)
-        last_waitingfor = waiting.model_dump(exclude_none=True)
-        status = waiting.result
-        if status in ("GO", "REFRESH"):
-            refreshed = get_player()
-            if is_revisable_selection_prompt(refreshed):
+    try:
+        while True:
+            waiting = await TURN_WAITER.poll(
+                seat,
+                game_key,
+                game_age,
+                undo_count,
+                functools.partial(
+                    run_blocking, _get_waiting_for_state, game_age, undo_count
+                ),
+                fresh_for=session.polling.min_interval,
+            )
+            polls += 1
+            last_waitingfor = waiting.model_dump(exclude_none=True)
+            status = waiting.result
+            if status in ("GO", "REFRESH"):
+                refreshed = await run_blocking(get_player)
+                if is_revisable_selection_prompt(refreshed):
+                    refreshed_game = refreshed.game
+                    # The same revisable prompt at the same age: nothing moved,
+                    # so back off as after a WAIT.
+                    if (
+                        int(refreshed_game.gameAge),
+                        int(refreshed_game.undoCount),
+                    ) == (game_age, undo_count):
+                        status = "WAIT"
+                    game_age = int(refreshed_game.gameAge)
+                    undo_count = int(refreshed_game.undoCount)
+                elif status == "GO" or refreshed.waitingFor is not None:
+                    new_logs, _LOG_CURSORS[log_key] = await run_blocking(
+                        _get_game_logs_since,
+                        start_cursor,
+                        int(refreshed.game.generation),
+                    )
+                    opponent_actions = extract_opponent_actions(
+                        [],
+                        new_logs,
+                        opponent_colors,
+                        color_to_name,
+                    )
+                    POLL_METRICS.record_wait(polls)
+                    logger.info(
+                        "Turn wait finished after %d waitingfor polls in %.1fs",
+                        polls,
+                        time.monotonic() - wait_started_at,
+                    )
+                    return refreshed, opponent_actions
                 refreshed_game = refreshed.game
                 game_age = int(refreshed_game.gameAge)
                 undo_count = int(refreshed_game.undoCount)
-            elif status == "GO" or refreshed.waitingFor is not None:
-                final_logs = _get_game_logs()
-                opponent_actions = extract_opponent_actions(
-                    start_logs,
-                    final_logs,
-                    opponent_colors,
-                    color_to_name,
-                )
-                return refreshed, opponent_actions
-            refreshed_game = refreshed.game
-            game_age = int(refreshed_game.gameAge)
-            undo_count = int(refreshed_game.undoCount)
-
-        now = time.monotonic()
-        while now >= next_progress_report_at:
-            elapsed_seconds = int(now - wait_started_at)
-            await context.report_progress(
-                progress=float(elapsed_seconds),
-                total=float(TURN_WAIT_TIMEOUT_SECONDS),
-                message=(
-                    "Waiting for opponent actions to complete "
-                    f"({elapsed_seconds}s elapsed)"
-                ),
-            )
-            next_progress_report_at += TURN_WAIT_PROGRESS_INTERVAL_SECONDS
 
-        if now >= deadline:
-            raise TimeoutError(
-                f"Timed out after {TURN_WAIT_TIMEOUT_SECONDS} seconds while polling for "
-                "your turn. {committed_summary} "
-                f"Current server state: last waitingfor={last_waitingfor}"
-            )
-        await asyncio.sleep(TURN_WAIT_POLL_INTERVAL_SECONDS)
+            now = time.monotonic()
+            while now >= next_progress_report_at:
+                elapsed_seconds = int(now - wait_started_at)
+                await context.report_progress(
+                    progress=float(elapsed_seconds),
+                    total=float(TURN_WAIT_TIMEOUT_SECONDS),
+                    message=(
+                        "Waiting for opponent actions to complete "
+                        f"({elapsed_seconds}s elapsed)"
+                    ),
+                )
+                next_progress_report_at += TURN_WAIT_PROGRESS_INTERVAL_SECONDS
+
+            if now >= deadline:
+                POLL_METRICS.record_wait(polls)
+                raise TimeoutError(
+                    f"Timed out after {TURN_WAIT_TIMEOUT_SECONDS} seconds while polling for "
+                    "your turn. {committed_summary} "
+                    f"Current server state: last waitingfor={last_waitingfor}"
+                )
+            # Never sleep past the next progress report, however far we backed off.
+            delay = min(schedule.next_delay(status), next_progress_report_at - now)
+            if push is not None and push.connected:
+                await push.wait(delay, game_age)
+            else:
+                await asyncio.sleep(delay)
+    finally:
+        TURN_WAITER.leave(seat)
+        if push is not None:
+            await push.close()
 
 
 async def state_after_submission(player_model: ApiPlayerViewModel) -> dict[str, Any]:
     """Build the auto-response agent state, waiting out opponents if the turn ended."""
     between_turns_actions: list[str] | None = None
     if player_model.waitingFor is None or is_revisable_selection_prompt(player_model):
-        initial_logs = _get_game_logs()
+        # Read opponent actions from the end of our own turn, so entries of
+        # that turn naming an opponent ("removed 3 plants from Blue") are
+        # not reported as theirs.
+        log_cursor = await run_blocking(
+            _get_game_log_cursor, int(player_model.game.generation)
+        )
         player_model, between_turns_actions = await wait_for_turn_from_player_model(
             player_model,
-            initial_logs=initial_logs,
+            log_cursor,
             committed_summary=(
                 "The input you submitted this call was accepted by the server and is "
                 "committed; do not resubmit it."
             ),
         )
+    session = current_session()
     return build_agent_state(
         player_model,
-        base_url=CFG.base_url,
-        player_id_fallback=CFG.player_id,
+        base_url=session.base_url,
+        player_id_fallback=session.player_id,
         auto_response=True,
         between_turns_actions=between_turns_actions,
+        delta=session.delta_responses,
     )
 
 
@@ -316,15 +685,20 @@ async def submit_and_return_state(response: Mapping[str, object]) -> dict[str, A
     gets identical behavior.
     """
     try:
-        prepared = prepare_action(dict(response), get_player().waitingFor)
-        player_model = _post_input(cast(dict[str, JsonValue], prepared))
+        current = await run_blocking(get_player)
+        prepared = prepare_action(dict(response), current.waitingFor)
+        player_model = await run_blocking(
+            _post_input, cast(dict[str, JsonValue], prepared)
+        )
     except RuntimeError as exc:
-        refreshed = get_player()
+        refreshed = await run_blocking(get_player)
+        session = current_session()
         state = build_agent_state(
             refreshed,
-            base_url=CFG.base_url,
-            player_id_fallback=CFG.player_id,
+            base_url=session.base_url,
+            player_id_fallback=session.player_id,
             auto_response=True,
+            delta=session.delta_responses,
         )
         state["error"] = str(exc)
         return state
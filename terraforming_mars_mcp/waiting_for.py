@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import cast
 
-from ._enums import DetailLevel, InputType, strip_empty
+from ._enums import DetailLevel, InputType, omit_empty, strip_empty
 from ._models import normalize_raw_input_entity
 from .api_response_models import (
     JsonValue,
@@ -12,7 +12,7 @@ from .api_response_models import (
 from .api_response_models import (
     WaitingForInputModel as ApiWaitingForInputModel,
 )
-from .card_info import compact_cards
+from .card_info import _CardDetailTracker, compact_cards
 
 
 def input_type_name(waiting_for: ApiWaitingForInputModel | None) -> str | None:
@@ -249,13 +249,14 @@ def normalize_waiting_for(
     detail_level: DetailLevel = DetailLevel.FULL,
     generation: int | None = None,
     auto_response: bool = False,
+    card_tracker: _CardDetailTracker | None = None,
 ) -> dict[str, object] | None:
     if waiting_for is None:
         return None
 
     wf = waiting_for
 
-    normalized: dict[str, object] = strip_empty(
+    normalized: dict[str, object] = omit_empty(
         {
             "input_type": input_type_name(wf),
             "title": title_to_text(wf.title),
@@ -278,11 +279,12 @@ def normalize_waiting_for(
             detail_level=DetailLevel.MINIMAL if is_blue_action else detail_level,
             generation=generation,
             auto_response=auto_response,
+            card_tracker=card_tracker,
         )
         # Filter out disabled cards; only include ones the player can use.
         cards_list = [c for c in cards_list if not c.get("disabled")]
         normalized["cards"] = cards_list
-        card_selection: dict[str, object] = strip_empty(
+        card_selection: dict[str, object] = omit_empty(
             {
                 "min": wf.min,
                 "max": wf.max,
@@ -299,7 +301,7 @@ def normalize_waiting_for(
         if _is_sell_patents(wf.title):
             normalized.pop("cards", None)
     elif wf.min is not None or wf.max is not None:
-        normalized["amount_range"] = strip_empty(
+        normalized["amount_range"] = omit_empty(
             {
                 "min": wf.min,
                 "max": wf.max,
@@ -309,22 +311,24 @@ def normalize_waiting_for(
 
     if wf.tokens:
         normalized["tokens"] = [
-            token.model_dump(exclude_none=True) for token in wf.tokens
+            strip_empty(token.model_dump(exclude_none=True)) for token in wf.tokens
         ]
 
-    if wf.coloniesModel is not None:
+    if wf.coloniesModel:
         normalized["colonies"] = [colony.name for colony in wf.coloniesModel]
 
     if wf.payProduction is not None:
-        normalized["pay_production"] = wf.payProduction.model_dump(exclude_none=True)
+        normalized["pay_production"] = strip_empty(
+            wf.payProduction.model_dump(exclude_none=True)
+        )
 
     if wf.paymentOptions is not None:
-        payment_options = wf.paymentOptions.model_dump(exclude_none=True)
+        payment_options = strip_empty(wf.paymentOptions.model_dump(exclude_none=True))
         if any(payment_options.values()):
             normalized["payment_options"] = payment_options
 
     if wf.aresData is not None:
-        ares_data = wf.aresData.model_dump(exclude_none=True)
+        ares_data = strip_empty(wf.aresData.model_dump(exclude_none=True))
         normalized["ares_data"] = ares_data.get("hazardData", ares_data)
 
     if wf.options is not None:
@@ -339,6 +343,7 @@ def normalize_waiting_for(
                     detail_level=detail_level,
                     generation=generation,
                     auto_response=auto_response,
+                    card_tracker=card_tracker,
                 )
                 input_type = input_type_name(option)
                 option_payload: dict[str, object] = {
@@ -347,7 +352,7 @@ def normalize_waiting_for(
                 }
                 if option_detail is not None:
                     for key, value in option_detail.items():
-                        if key in ("input_type", "title"):
+                        if key in ("input_type", "title") or value == []:
                             continue
                         option_payload[key] = value
 
@@ -359,6 +364,7 @@ def normalize_waiting_for(
 
                 normalized_options.append(option_payload)
 
-            normalized["options"] = normalized_options
+            if normalized_options:
+                normalized["options"] = normalized_options
 
     return normalized
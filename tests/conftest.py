@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -8,3 +9,7 @@ from pathlib import Path
 # installed into the venv.  Inserting the repo root here lets every test
 # file use plain `import terraforming_mars_mcp.*` statements.
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Tests must neither read nor leave behind session-cache snapshots in the
+# developer's cache directory; tests of the snapshot store set their own.
+os.environ["TM_CACHE_SNAPSHOT_DIR"] = ""
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import terraforming_mars_mcp._bounded_cache as bounded_cache_mod
+from terraforming_mars_mcp._bounded_cache import BoundedCache, cache_stats
+
+
+def test_least_recently_used_entry_is_evicted_past_max_entries() -> None:
+    cache: BoundedCache[str, int] = BoundedCache("test_lru", max_entries=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # "b" is now least recently used
+    cache["c"] = 3
+
+    assert sorted(cache) == ["a", "c"]
+    assert cache.stats() == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 1,
+        "misses": 0,
+        "evictions": 1,
+    }
+
+
+def test_idle_entries_expire_and_count_as_evictions(monkeypatch) -> None:
+    clock = {"now": 0.0}
+    monkeypatch.setattr(bounded_cache_mod.time, "monotonic", lambda: clock["now"])
+    cache: BoundedCache[str, int] = BoundedCache("test_ttl", idle_ttl=10)
+    cache["old"] = 1
+    clock["now"] = 6
+    cache["fresh"] = 2
+    clock["now"] = 12
+
+    assert cache.get("old") is None
+    assert cache.setdefault("fresh", 99) == 2
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_explicit_eviction_and_stats_registry() -> None:
+    cache: BoundedCache[str, int] = BoundedCache("test_registry")
+    cache["game-1:p1"] = 1
+    cache.evict("game-1:p1")
+    cache.evict("missing")
+
+    assert "game-1:p1" not in cache
+    assert cache_stats()["test_registry"]["evictions"] == 1
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any
+
+import terraforming_mars_mcp._cache_store as cache_store
+import terraforming_mars_mcp.game_state as game_state_mod
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+
+
+def _player_view(
+    game_age: int,
+    phase: str = "action",
+    generation: int = 4,
+    opponent_tableau: tuple[str, ...] = ("Point Luna",),
+) -> PlayerViewModel:
+    me = {"name": "Alice", "color": "red", "isActive": True}
+    opponent: dict[str, Any] = {
+        "name": "Bob",
+        "color": "blue",
+        "isActive": False,
+        "tableau": [{"name": name} for name in opponent_tableau],
+    }
+    return PlayerViewModel.model_validate(
+        {
+            "id": "player-1",
+            "game": {
+                "id": "game-1",
+                "phase": phase,
+                "generation": generation,
+                "temperature": -20,
+                "oxygenLevel": 6,
+                "oceans": 3,
+                "venusScaleLevel": 0,
+                "isTerraformed": False,
+                "gameAge": game_age,
+                "undoCount": 0,
+            },
+            "players": [me, opponent],
+            "thisPlayer": dict(me),
+            "waitingFor": {
+                "type": "card",
+                "title": "Select",
+                "buttonLabel": "Save",
+                "min": 1,
+                "max": 1,
+                "cards": [
+                    {"name": "Comet", "calculatedCost": 21, "warnings": ["maxoceans"]}
+                ],
+            },
+        }
+    )
+
+
+def test_snapshot_round_trip_is_atomic_and_skips_bad_files(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache_store, "SNAPSHOT_DIR", tmp_path)
+
+    cache_store.save_snapshot("game/1", "player-1", {"last_generation": 4})
+
+    path = cache_store.snapshot_path("game/1", "player-1")
+    assert path == tmp_path / "game_1" / "player-1.json"
+    assert [p.name for p in path.parent.iterdir()] == ["player-1.json"]
+    assert cache_store.load_snapshot("game/1", "player-1") == {"last_generation": 4}
+
+    path.write_text("{not json", encoding="utf-8")
+    assert cache_store.load_snapshot("game/1", "player-1") is None
+
+    cache_store.discard_snapshot("game/1", "player-1")
+    assert not path.parent.exists()
+
+
+def test_snapshots_are_disabled_without_a_directory(monkeypatch) -> None:
+    monkeypatch.setattr(cache_store, "SNAPSHOT_DIR", None)
+
+    cache_store.save_snapshot("game-1", "player-1", {"last_generation": 4})
+
+    assert cache_store.load_snapshot("game-1", "player-1") is None
+
+
+def test_restart_resumes_from_snapshot_instead_of_resending(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache_store, "SNAPSHOT_DIR", tmp_path)
+    importlib.reload(game_state_mod)
+    first = game_state_mod.build_agent_state(_player_view(100), auto_response=True)
+    assert "terraforming" in first["game"]
+    assert first["opponent_new_cards"][0]["card_name"] == "Point Luna"
+
+    # A restarted server starts with empty in-memory caches.
+    importlib.reload(game_state_mod)
+    resumed = game_state_mod.build_agent_state(_player_view(101), auto_response=True)
+
+    assert "terraforming" not in resumed["game"]
+    assert "opponent_new_cards" not in resumed
+    assert resumed["waiting_for"]["cards"] == [{"name": "Comet"}]
+    assert resumed["card_details_version"] == first["card_details_version"]
+
+
+def test_game_end_discards_the_snapshot(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(cache_store, "SNAPSHOT_DIR", tmp_path)
+    importlib.reload(game_state_mod)
+    game_state_mod.build_agent_state(_player_view(100), auto_response=True)
+    assert cache_store.load_snapshot("game-1", "player-1") is not None
+
+    game_state_mod.build_agent_state(_player_view(200, phase="end"))
+
+    assert cache_store.load_snapshot("game-1", "player-1") is None
+
+
+def test_snapshot_rewrites_are_spaced_out_within_a_generation(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(cache_store, "SNAPSHOT_DIR", tmp_path)
+    importlib.reload(game_state_mod)
+    writes: list[int] = []
+    save_snapshot = cache_store.save_snapshot
+
+    def counting_save(game_id: str, player_id: str, data: dict[str, Any]) -> None:
+        writes.append(data["last_generation"])
+        save_snapshot(game_id, player_id, data)
+
+    monkeypatch.setattr(cache_store, "save_snapshot", counting_save)
+
+    game_state_mod.build_agent_state(_player_view(100), auto_response=True)
+    # The opponent played a card: the snapshot changed, but only just written.
+    game_state_mod.build_agent_state(
+        _player_view(101, opponent_tableau=("Point Luna", "Comet")),
+        auto_response=True,
+    )
+    assert writes == [4]
+
+    # A new generation is written right away.
+    game_state_mod.build_agent_state(
+        _player_view(200, generation=5, opponent_tableau=("Point Luna", "Comet")),
+        auto_response=True,
+    )
+    assert writes == [4, 5]
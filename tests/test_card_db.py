@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+import terraforming_mars_mcp._card_db as card_db
+import terraforming_mars_mcp.card_info as card_info_mod
+from terraforming_mars_mcp._enums import DetailLevel
+from terraforming_mars_mcp.api_response_models import CardModel
+
+_CARDS = [
+    {
+        "name": "Development Center",
+        "tags": ["science", "building"],
+        "cost": 11,
+        "metadata": {
+            "description": "Requires nothing.",
+            "renderData": {
+                "rows": [
+                    ["Action: Spend 1 energy to draw a card."],
+                    {"deep": ["Effect: nothing", "decoration"]},
+                ]
+            },
+        },
+    },
+    {
+        "name": "Comet",
+        "tags": ["event", "space"],
+        "cost": 21,
+        "victoryPoints": 0,
+        "requirements": [{"oceans": 3}],
+        "metadata": {"description": {"text": "Raise temperature 1 step."}},
+    },
+    {"tags": ["nameless"]},
+]
+
+
+def _write_cards(path: Path, cards: list[dict]) -> Path:
+    path.write_text(json.dumps(cards), encoding="utf-8")
+    return path
+
+
+def test_compiled_records_keep_only_what_card_info_reads() -> None:
+    cards = card_db.compile_cards(_CARDS)
+
+    assert set(cards) == {"Development Center", "Comet"}
+    center = cards["Development Center"]
+    assert center.tags == ("science", "building")
+    assert center.actions == ("Action: Spend 1 energy to draw a card.",)
+    assert center.effects == ("Effect: nothing",)
+    assert center.description == "Requires nothing."
+    comet = cards["Comet"]
+    assert comet.description == "Raise temperature 1 step."
+    assert comet.requirements == ({"oceans": 3},)
+    assert comet.effects == comet.actions == ()
+
+
+def test_artifact_is_reused_until_the_source_changes(tmp_path: Path) -> None:
+    cards_file = _write_cards(tmp_path / "cards.json", _CARDS)
+    artifact = tmp_path / "cache" / "card-db.pickle"
+
+    first = card_db.load_card_db(cards_file, artifact)
+    assert artifact.exists()
+    # Same size and mtime: the artifact is used without parsing the source.
+    stat = cards_file.stat()
+    cards_file.write_bytes(b"not json at all!".ljust(stat.st_size))
+    os.utime(cards_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert card_db.load_card_db(cards_file, artifact) == first
+
+    _write_cards(cards_file, _CARDS[1:])
+    os.utime(cards_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert set(card_db.load_card_db(cards_file, artifact)) == {"Comet"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"garbage",
+        # Truncated, a missing class, and a constructor that fails on load.
+        b"\x80\x05\x95",
+        b"cbuiltins\nno_such_name\n.",
+        b"c__builtin__\nint\n(S'x'\ntR.",
+    ],
+)
+def test_unreadable_artifact_is_rebuilt(tmp_path: Path, content: bytes) -> None:
+    cards_file = _write_cards(tmp_path / "cards.json", _CARDS)
+    artifact = tmp_path / "card-db.pickle"
+    artifact.write_bytes(content)
+
+    assert set(card_db.load_card_db(cards_file, artifact)) == {
+        "Development Center",
+        "Comet",
+    }
+    assert artifact.read_bytes() != content
+
+
+def test_missing_source_gives_an_empty_database(tmp_path: Path) -> None:
+    assert card_db.load_card_db(tmp_path / "missing.json", tmp_path / "db") == {}
+
+
+def test_card_info_is_computed_once_and_shared_read_only(monkeypatch) -> None:
+    monkeypatch.setattr(
+        card_info_mod, "_CARD_INFO_INDEX", card_db.compile_cards(_CARDS)
+    )
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_CACHE", {})
+
+    info = card_info_mod.card_info("Comet", include_play_details=True)
+
+    assert card_info_mod.card_info("Comet", include_play_details=True) is info
+    assert info["tags"] == ("event", "space")
+    assert info["base_cost"] == 21
+    assert info["play_requirements"] == ({"oceans": 3},)
+    with pytest.raises(TypeError):
+        info["tags"] = ()  # type: ignore[index]
+    assert card_info_mod.card_info("Unknown Card") == {}
+    assert ("Unknown Card", False) not in card_info_mod._CARD_INFO_CACHE
+
+
+def test_compact_card_overlays_dynamic_fields_on_cached_templates(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        card_info_mod, "_CARD_INFO_INDEX", card_db.compile_cards(_CARDS)
+    )
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_CACHE", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TEMPLATES", {})
+    comet = CardModel.model_validate(
+        {"name": "Comet", "calculatedCost": 18, "warnings": ["maxoceans"]}
+    )
+
+    full = card_info_mod._compact_card(comet)
+    template = card_info_mod._CARD_TEMPLATES[("Comet", DetailLevel.FULL)]
+    minimal = card_info_mod._compact_card(comet, detail_level=DetailLevel.MINIMAL)
+
+    assert list(full) == [
+        "name",
+        "cost",
+        "discounted_cost",
+        "warnings",
+        "tags",
+        "effect_texts",
+    ]
+    assert full["tags"] == ["event", "space"]
+    assert full["effect_texts"] == ["Raise temperature 1 step."]
+    assert minimal == {"name": "Comet", "warnings": ["maxoceans"]}
+    card_info_mod._compact_card("Comet")
+    assert card_info_mod._CARD_TEMPLATES[("Comet", DetailLevel.FULL)] is template
+
+
+def test_cached_template_skips_the_card_info_lookup(monkeypatch) -> None:
+    monkeypatch.setattr(
+        card_info_mod, "_CARD_INFO_INDEX", card_db.compile_cards(_CARDS)
+    )
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_CACHE", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TEMPLATES", {})
+    first = card_info_mod._compact_card("Comet")
+    lookups: list[str] = []
+
+    def counting_card_info(
+        card_name: str, include_play_details: bool = False
+    ) -> Mapping[str, object]:
+        lookups.append(card_name)
+        return {}
+
+    monkeypatch.setattr(card_info_mod, "card_info", counting_card_info)
+
+    assert card_info_mod._compact_card("Comet") == first
+    assert lookups == []
@@ -21,6 +21,7 @@ def test_extract_played_cards_omits_default_values(monkeypatch) -> None:
         }
 
     monkeypatch.setattr("terraforming_mars_mcp.card_info.card_info", fake_card_info)
+    monkeypatch.setattr("terraforming_mars_mcp.card_info._CARD_TEMPLATES", {})
 
     player = PublicPlayerModel.model_validate(
         {
@@ -62,6 +63,7 @@ def test_extract_played_cards_keeps_non_default_values(monkeypatch) -> None:
         }
 
     monkeypatch.setattr("terraforming_mars_mcp.card_info.card_info", fake_card_info)
+    monkeypatch.setattr("terraforming_mars_mcp.card_info._CARD_TEMPLATES", {})
 
     player = PublicPlayerModel.model_validate(
         {
@@ -129,6 +131,7 @@ def test_extract_played_card_effects_and_actions(monkeypatch) -> None:
         }
 
     monkeypatch.setattr("terraforming_mars_mcp.card_info.card_info", fake_card_info)
+    monkeypatch.setattr("terraforming_mars_mcp.card_info._CARD_TEMPLATES", {})
 
     player = PublicPlayerModel.model_validate(
         {
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import terraforming_mars_mcp.card_info as card_info_mod
+import terraforming_mars_mcp.server as server_mod
+from terraforming_mars_mcp._card_db import compile_cards
+from terraforming_mars_mcp._card_search import keyword_tokens
+
+_CARDS: list[dict[str, Any]] = [
+    {
+        "name": "Asteroid",
+        "type": "event",
+        "tags": ["space"],
+        "cost": 14,
+        "metadata": {"description": "Raise temperature 1 step and gain 2 titanium."},
+    },
+    {
+        "name": "Arctic Algae",
+        "type": "active",
+        "tags": ["plant"],
+        "cost": 12,
+        "requirements": [{"temperature": -12, "max": True}],
+        "metadata": {
+            "renderData": {
+                "rows": ["Effect: When anyone places an ocean tile, gain 2 plants."]
+            }
+        },
+    },
+    {
+        "name": "Herbivores",
+        "type": "active",
+        "tags": ["animal"],
+        "cost": 12,
+        "victoryPoints": {"resourcesHere": {}, "per": 2},
+        "requirements": [{"oxygen": 8}],
+        "metadata": {
+            "renderData": {
+                "rows": ["Effect: When you place a greenery tile, add an animal here."]
+            }
+        },
+    },
+    {
+        "name": "Io Mining Industries",
+        "type": "automated",
+        "tags": ["jovian", "space"],
+        "cost": 41,
+        "victoryPoints": {"tag": "jovian", "per": 1},
+    },
+    {
+        "name": "Satellites",
+        "type": "automated",
+        "tags": ["space"],
+        "cost": 10,
+        "requirements": [{"tag": "space", "count": 1}],
+    },
+]
+
+
+@pytest.fixture
+def cards(monkeypatch) -> None:
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_INDEX", compile_cards(_CARDS))
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_CACHE", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TEMPLATES", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TABLE", None)
+    monkeypatch.setattr(card_info_mod, "_CARD_SEARCH_INDEX", None)
+
+
+def _names(result: dict[str, object]) -> list[str]:
+    return [card["name"] for card in result["cards"]]  # type: ignore[attr-defined, index]
+
+
+def test_filters_intersect_over_the_indexes(cards: None) -> None:
+    index = card_info_mod.card_search_index()
+
+    def search(**filters: object) -> list[str]:
+        return index.names(index.search(**filters))  # type: ignore[arg-type]
+
+    assert search(tags=["space"], max_cost=14) == ["Asteroid", "Satellites"]
+    assert search(tags=["space"], min_cost=11, max_cost=40) == ["Asteroid"]
+    assert search(min_cost=12, max_cost=12) == ["Arctic Algae", "Herbivores"]
+    assert search(requirement="temperature") == ["Arctic Algae"]
+    assert search(requirement="tag") == ["Satellites"]
+    assert search(requirement="tag:space") == ["Satellites"]
+    assert search(vp_kind="resourcesHere") == ["Herbivores"]
+    assert search(card_type="active", keywords="plants") == ["Arctic Algae"]
+    assert search(keywords="greenery tiles") == ["Herbivores"]
+    assert search(keywords="no such words") == []
+    with pytest.raises(ValueError, match="Unknown tag 'spaec'"):
+        search(tags=["spaec"])
+
+
+def test_keyword_tokens_fold_plurals_and_skip_stop_words() -> None:
+    assert keyword_tokens("Gain 2 Plants for the tags") == ["gain", "2", "plant", "tag"]
+
+
+def test_search_cards_tool_pages_compacted_results(cards: None) -> None:
+    first = asyncio.run(server_mod.search_cards(tags=["space"], page_size=2))
+    second = asyncio.run(server_mod.search_cards(tags=["space"], page=2, page_size=2))
+
+    assert (first["total"], first["page"], first["pages"]) == (3, 1, 2)
+    assert _names(first) == ["Asteroid", "Io Mining Industries"]
+    assert _names(second) == ["Satellites"]
+    assert first["cards"][0]["cost"] == 14  # type: ignore[index]
+    assert first["cards"][0]["tags"] == ["space"]  # type: ignore[index]
+    assert asyncio.run(server_mod.search_cards(keywords="ocean"))["total"] == 1
+    with pytest.raises(ValueError):
+        asyncio.run(server_mod.search_cards(page=0))
+
+
+def test_get_card_details_returns_deduplicated_table_by_name(cards: None) -> None:
+    result = asyncio.run(
+        server_mod.get_card_details(
+            ["Satellites", "Asteroid", "Satellites", "Not A Card"]
+        )
+    )
+
+    assert list(result["cards"]) == ["Satellites", "Asteroid"]  # type: ignore[call-overload]
+    assert result["cards"]["Asteroid"]["cost"] == 14  # type: ignore[index]
+    assert "name" not in result["cards"]["Asteroid"]  # type: ignore[index]
+    assert result["unknown"] == ["Not A Card"]
+    assert "unknown" not in asyncio.run(server_mod.get_card_details(["Asteroid"]))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from terraforming_mars_mcp._card_db import compile_cards
+from terraforming_mars_mcp._card_table import NO_COST, CardTable, requirement_kind
+
+_CARDS = [
+    {
+        "name": "Research",
+        "type": "automated",
+        "module": "base",
+        "tags": ["science", "science"],
+        "cost": 11,
+        "victoryPoints": 1,
+    },
+    {
+        "name": "Comet",
+        "type": "event",
+        "module": "base",
+        # As in cards.json: only the printed tags, no "event".
+        "tags": ["space"],
+        "cost": 21,
+        "requirements": [{"oceans": 3, "max": True}],
+    },
+    {
+        "name": "Io Mining Industries",
+        "type": "automated",
+        "module": "base",
+        "tags": ["jovian", "space"],
+        "cost": 41,
+        "victoryPoints": {"tag": "jovian", "per": 1},
+        "requirements": [{"tag": "science", "count": 2}],
+    },
+    {"name": "Beginner Corporation", "type": "corporation", "module": "base"},
+]
+
+
+def _table() -> CardTable:
+    return CardTable(compile_cards(_CARDS).values())
+
+
+def test_columns_hold_each_attribute_by_card_id() -> None:
+    table = _table()
+
+    assert table.names == (
+        "Beginner Corporation",
+        "Comet",
+        "Io Mining Industries",
+        "Research",
+    )
+    comet = table.ids["Comet"]
+    io = table.ids["Io Mining Industries"]
+    corporation = table.ids["Beginner Corporation"]
+    assert table.cost[comet] == 21
+    assert table.cost[corporation] == NO_COST
+    assert table.card_types[table.card_type[comet]] == "event"
+    assert table.vp_kinds[table.vp_kind[io]] == "tag"
+    assert table.vp_kinds[table.vp_kind[table.ids["Research"]]] == "fixed"
+    assert table.vp_kind[comet] == 0
+    assert [requirement.kind for requirement in table.requirements[io]] == ["tag"]
+    assert table.requirements[corporation] == ()
+
+
+def test_requirement_kind_defaults_threshold_for_non_numeric_values() -> None:
+    assert requirement_kind({"party": "greens"}) == ("party", 1, False)
+    assert requirement_kind({"temperature": -6, "max": True}) == (
+        "temperature",
+        -6,
+        True,
+    )
+
+
+def test_event_cards_with_only_printed_tags_build_a_table() -> None:
+    # No record lists an "event" tag, as with the real cards.json.
+    table = CardTable(
+        compile_cards(
+            [{"name": "Comet", "type": "event", "tags": ["space"], "cost": 21}]
+        ).values()
+    )
+
+    assert table.cost[table.ids["Comet"]] == 21
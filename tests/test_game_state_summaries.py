@@ -4,9 +4,12 @@ import asyncio
 import importlib
 from typing import Any
 
+import pytest
+
 import terraforming_mars_mcp.card_info as card_info_mod
 import terraforming_mars_mcp.game_state as game_state_mod
 import terraforming_mars_mcp.server as server_mod
+from terraforming_mars_mcp._delta import apply_merge_patch, merge_patch
 from terraforming_mars_mcp.api_response_models import PlayerViewModel
 
 
@@ -84,7 +87,7 @@ def test_get_game_state_surfaces_milestones_and_awards() -> None:
     }
 
     player_view = PlayerViewModel.model_validate(player_model)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
     state = asyncio.run(server.get_game_state())
 
     assert state["game"]["milestones"][0]["name"] == "Builder"
@@ -138,7 +141,7 @@ def test_capped_milestones_and_awards_are_pruned() -> None:
     }
 
     player_view = PlayerViewModel.model_validate(player_model)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
     state = asyncio.run(server.get_game_state())
 
     assert state["game"]["milestones"] == "all 3 claimed"
@@ -155,7 +158,7 @@ def test_capped_milestones_and_awards_are_pruned() -> None:
     assert "milestones" not in repeat["game"]
 
     player_model["game"]["generation"] = 8
-    server.get_player = lambda player_id=None: PlayerViewModel.model_validate(
+    server.get_player_cached = lambda player_id=None: PlayerViewModel.model_validate(
         player_model
     )
     next_gen = asyncio.run(server.get_game_state())
@@ -186,8 +189,8 @@ def test_get_my_hand_cards_returns_cards_in_hand() -> None:
     }
 
     player_view = PlayerViewModel.model_validate(player_model)
-    server.get_player = lambda player_id=None: player_view
-    hand = server.get_my_hand_cards()
+    server.get_player_cached = lambda player_id=None: player_view
+    hand = asyncio.run(server.get_my_hand_cards())
 
     assert hand["cards_in_hand_count"] == 2
     assert {card["name"] for card in hand["cards_in_hand"]} == {"Comet", "Asteroid"}
@@ -281,7 +284,7 @@ def test_game_constants_sent_on_first_call_and_omitted_on_repeat() -> None:
 
     raw = _make_player_model(generation=4, game_age=100)
     player_view = PlayerViewModel.model_validate(raw)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
 
     # First call: constants are included.
     state1 = asyncio.run(server.get_game_state())
@@ -292,7 +295,7 @@ def test_game_constants_sent_on_first_call_and_omitted_on_repeat() -> None:
     # Second call, same generation, same constants: omitted.
     raw2 = _make_player_model(generation=4, game_age=101)
     player_view2 = PlayerViewModel.model_validate(raw2)
-    server.get_player = lambda player_id=None: player_view2
+    server.get_player_cached = lambda player_id=None: player_view2
 
     state2 = asyncio.run(server.get_game_state())
     assert "session" not in state2
@@ -334,7 +337,7 @@ def test_game_constants_resent_on_generation_change() -> None:
 
     raw_gen4 = _make_player_model(generation=4, game_age=100)
     player_view4 = PlayerViewModel.model_validate(raw_gen4)
-    server.get_player = lambda player_id=None: player_view4
+    server.get_player_cached = lambda player_id=None: player_view4
 
     # Prime the tracker.
     asyncio.run(server.get_game_state())
@@ -342,7 +345,7 @@ def test_game_constants_resent_on_generation_change() -> None:
     # New generation: constants should reappear, but session does not (unchanged).
     raw_gen5 = _make_player_model(generation=5, game_age=200)
     player_view5 = PlayerViewModel.model_validate(raw_gen5)
-    server.get_player = lambda player_id=None: player_view5
+    server.get_player_cached = lambda player_id=None: player_view5
 
     state = asyncio.run(server.get_game_state())
     assert "session" not in state
@@ -358,14 +361,14 @@ def test_game_constants_resent_on_value_change_within_generation() -> None:
 
     raw = _make_player_model(generation=4, temperature=-20, game_age=100)
     player_view = PlayerViewModel.model_validate(raw)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
 
     asyncio.run(server.get_game_state())
 
     # Temperature changed within same generation.
     raw2 = _make_player_model(generation=4, temperature=-18, game_age=101)
     player_view2 = PlayerViewModel.model_validate(raw2)
-    server.get_player = lambda player_id=None: player_view2
+    server.get_player_cached = lambda player_id=None: player_view2
 
     state = asyncio.run(server.get_game_state())
     assert "session" not in state
@@ -380,14 +383,14 @@ def test_you_and_opponents_omitted_between_intervals() -> None:
 
     raw = _make_player_model(generation=4, game_age=100)
     player_view = PlayerViewModel.model_validate(raw)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
     first = asyncio.run(server.get_game_state())
     # First call in a new generation → included
     assert "you" in first
 
     raw2 = _make_player_model(generation=4, game_age=101)
     player_view2 = PlayerViewModel.model_validate(raw2)
-    server.get_player = lambda player_id=None: player_view2
+    server.get_player_cached = lambda player_id=None: player_view2
     second = asyncio.run(server.get_game_state())
     # Same generation, not yet at interval → omitted
     assert "you" not in second
@@ -395,7 +398,7 @@ def test_you_and_opponents_omitted_between_intervals() -> None:
     # Advance to next generation → included again
     raw3 = _make_player_model(generation=5, game_age=120)
     player_view3 = PlayerViewModel.model_validate(raw3)
-    server.get_player = lambda player_id=None: player_view3
+    server.get_player_cached = lambda player_id=None: player_view3
     third = asyncio.run(server.get_game_state())
     assert "you" in third
 
@@ -417,7 +420,7 @@ def test_proactive_calls_always_return_full_card_details() -> None:
     }
     raw = _make_player_model(generation=4, game_age=100, waiting_for=waiting_for)
     player_view = PlayerViewModel.model_validate(raw)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
 
     # First proactive call: full details.
     state1 = asyncio.run(server.get_game_state())
@@ -429,7 +432,7 @@ def test_proactive_calls_always_return_full_card_details() -> None:
     # Second proactive call same gen: still full details (proactive = no caching).
     raw2 = _make_player_model(generation=4, game_age=101, waiting_for=waiting_for)
     player_view2 = PlayerViewModel.model_validate(raw2)
-    server.get_player = lambda player_id=None: player_view2
+    server.get_player_cached = lambda player_id=None: player_view2
 
     state2 = asyncio.run(server.get_game_state())
     card2 = state2["waiting_for"]["cards"][0]
@@ -508,8 +511,8 @@ def test_auto_response_resends_on_warning_change() -> None:
     assert card2["warnings"] == ["maxoceans"]
 
 
-def test_auto_response_resets_on_new_generation() -> None:
-    """Auto-returned card details reset when the generation changes."""
+def test_auto_response_keeps_name_only_across_generations() -> None:
+    """A new generation alone does not resend card details already sent."""
     importlib.reload(game_state_mod)
     _reload_card_info()
     card_info_mod._CARD_TRACKER.reset()
@@ -528,14 +531,233 @@ def test_auto_response_resets_on_new_generation() -> None:
     player_view4 = PlayerViewModel.model_validate(raw4)
     game_state_mod.build_agent_state(player_view4, auto_response=True)
 
-    # Gen 5: same card, full details should reappear.
+    # Gen 5: same card, still name only under the same version.
     raw5 = _make_player_model(generation=5, game_age=200, waiting_for=waiting_for)
     player_view5 = PlayerViewModel.model_validate(raw5)
     state = game_state_mod.build_agent_state(player_view5, auto_response=True)
-    card = state["waiting_for"]["cards"][0]
-    assert card["name"] == "Comet"
-    assert "tags" in card
-    assert "effect_texts" in card
+    assert state["waiting_for"]["cards"][0] == {"name": "Comet"}
+    assert state["card_details_version"] == 0
+
+
+def test_card_details_are_tracked_per_game_and_player() -> None:
+    """A generation change in one game does not resend details in another."""
+    importlib.reload(game_state_mod)
+    _reload_card_info()
+
+    waiting_for = {
+        "type": "card",
+        "title": "Select",
+        "buttonLabel": "Save",
+        "min": 1,
+        "max": 1,
+        "cards": [{"name": "Comet", "calculatedCost": 21}],
+    }
+
+    def view(game_id: str, generation: int, game_age: int) -> PlayerViewModel:
+        raw = _make_player_model(
+            generation=generation, game_age=game_age, waiting_for=waiting_for
+        )
+        raw["game"]["id"] = game_id
+        return PlayerViewModel.model_validate(raw)
+
+    game_state_mod.build_agent_state(view("game-a", 4, 100), auto_response=True)
+    game_state_mod.build_agent_state(view("game-b", 7, 100), auto_response=True)
+
+    state = game_state_mod.build_agent_state(view("game-a", 4, 101), auto_response=True)
+
+    assert state["waiting_for"]["cards"][0] == {"name": "Comet"}
+    assert state["card_details_version"] == 0
+
+
+def test_resync_card_details_resends_full_details_under_new_version() -> None:
+    """After a resync, auto-responses send full details again once."""
+    importlib.reload(game_state_mod)
+    _reload_card_info()
+
+    waiting_for = {
+        "type": "card",
+        "title": "Select",
+        "buttonLabel": "Save",
+        "min": 1,
+        "max": 1,
+        "cards": [{"name": "Comet", "calculatedCost": 21}],
+    }
+    views = [
+        PlayerViewModel.model_validate(
+            _make_player_model(generation=4, game_age=age, waiting_for=waiting_for)
+        )
+        for age in (100, 101, 102, 103)
+    ]
+
+    first = game_state_mod.build_agent_state(views[0], auto_response=True)
+    resync = game_state_mod.build_agent_state(views[1], resync_card_details=True)
+    after = game_state_mod.build_agent_state(views[2], auto_response=True)
+    repeat = game_state_mod.build_agent_state(views[3], auto_response=True)
+
+    assert first["card_details_version"] == 0
+    assert resync["card_details_version"] == 1
+    assert after["waiting_for"]["cards"][0] != {"name": "Comet"}
+    assert after["card_details_version"] == 1
+    assert repeat["waiting_for"]["cards"][0] == {"name": "Comet"}
+
+
+def test_stale_card_details_version_resends_full_details() -> None:
+    """An agent holding another card_details_version gets full details again."""
+    importlib.reload(game_state_mod)
+    _reload_card_info()
+
+    waiting_for = {
+        "type": "card",
+        "title": "Select",
+        "buttonLabel": "Save",
+        "min": 1,
+        "max": 1,
+        "cards": [{"name": "Comet", "calculatedCost": 21}],
+    }
+    views = [
+        PlayerViewModel.model_validate(
+            _make_player_model(generation=4, game_age=age, waiting_for=waiting_for)
+        )
+        for age in (100, 101, 102, 103)
+    ]
+
+    game_state_mod.build_agent_state(views[0], auto_response=True)
+    current = game_state_mod.build_agent_state(views[1], card_details_version=0)
+    stale = game_state_mod.build_agent_state(views[2], card_details_version=5)
+    after = game_state_mod.build_agent_state(views[3], auto_response=True)
+
+    assert "card_details_version" not in current
+    assert stale["card_details_version"] == 1
+    assert after["waiting_for"]["cards"][0] != {"name": "Comet"}
+
+
+def test_delta_responses_patch_the_last_state_sent() -> None:
+    """Delta mode numbers each state and sends later ones as merge patches."""
+    importlib.reload(game_state_mod)
+
+    def view(game_age: int, opponent_tableau: list[dict[str, Any]]) -> Any:
+        return PlayerViewModel.model_validate(
+            _make_two_player_model(game_age=game_age, opponent_tableau=opponent_tableau)
+        )
+
+    full = game_state_mod.build_agent_state(view(100, []), delta=True)
+    patched = game_state_mod.build_agent_state(
+        view(101, [{"name": "Trans-Neptune Probe"}]), auto_response=True, delta=True
+    )
+
+    assert full["sequence"] == 1
+    assert "delta" not in full
+    assert full["opponents"]["blue"]["name"] == "Bob"
+    assert full["game"]["terraforming"] == {
+        "temperature": -20,
+        "oxygen": 6,
+        "oceans": 3,
+    }
+    assert patched["sequence"] == 2
+    assert patched["base_sequence"] == 1
+    assert patched["delta"] == {"game": {"game_age": 101}}
+    # Events are sent alongside the patch, not diffed.
+    assert [card["card_name"] for card in patched["opponent_new_cards"]] == [
+        "Trans-Neptune Probe"
+    ]
+
+    state = {key: full[key] for key in ("session", "game", "you", "opponents")}
+    state = apply_merge_patch(state, patched["delta"])
+    assert state["game"]["game_age"] == 101
+
+
+def test_delta_mode_resends_full_state_unless_the_client_holds_the_last() -> None:
+    importlib.reload(game_state_mod)
+    views = [
+        PlayerViewModel.model_validate(_make_player_model(game_age=age))
+        for age in (100, 101, 102)
+    ]
+
+    first = game_state_mod.build_agent_state(views[0], delta=True)
+    stale = game_state_mod.build_agent_state(views[1], delta=True, since_sequence=0)
+    current = game_state_mod.build_agent_state(
+        views[2], delta=True, since_sequence=stale["sequence"]
+    )
+
+    assert (first["sequence"], stale["sequence"]) == (1, 2)
+    assert "delta" not in stale
+    assert stale["game"]["game_age"] == 101
+    assert current["base_sequence"] == 2
+    assert current["delta"] == {"game": {"game_age": 102}}
+
+
+def test_sections_limit_what_is_built_and_returned(monkeypatch) -> None:
+    importlib.reload(game_state_mod)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("unrequested section was computed")
+
+    monkeypatch.setattr(game_state_mod, "_detect_new_opponent_cards", fail)
+    monkeypatch.setattr(game_state_mod, "_summarize_milestones", fail)
+    monkeypatch.setattr(game_state_mod, "_summarize_players", fail)
+    waiting_for = {"type": "option", "title": "Confirm", "buttonLabel": "OK"}
+    view = PlayerViewModel.model_validate(
+        _make_two_player_model(game_age=100) | {"waitingFor": waiting_for}
+    )
+
+    state = game_state_mod.build_agent_state(view, sections=["waiting_for"])
+
+    assert set(state) == {"waiting_for", "suggested_tools"}
+    assert state["waiting_for"]["title"] == "Confirm"
+    # The skipped game section still reports constants when first requested.
+    monkeypatch.undo()
+    later = game_state_mod.build_agent_state(view, sections=["game", "opponents"])
+    assert set(later) == {"game", "opponents"}
+    assert later["game"]["generation"] == 4
+    assert "terraforming" in later["game"]
+    assert later["opponents"][0]["name"] == "Bob"
+
+
+def test_generation_start_is_sent_to_proactive_calls_only_when_named() -> None:
+    importlib.reload(game_state_mod)
+    view = PlayerViewModel.model_validate(
+        _make_player_model(game_age=100) | {"cardsInHand": [{"name": "Comet"}]}
+    )
+
+    assert "generation_start" not in game_state_mod.build_agent_state(view)
+    state = game_state_mod.build_agent_state(view, sections=["generation_start"])
+
+    assert state["generation_start"]["cards_in_hand_count"] == 1
+    assert state["generation_start"]["cards_in_hand"][0]["name"] == "Comet"
+
+
+def test_unknown_sections_are_rejected() -> None:
+    view = PlayerViewModel.model_validate(_make_player_model())
+
+    with pytest.raises(ValueError, match=r"\['cards'\]"):
+        game_state_mod.build_agent_state(view, sections=["waiting_for", "cards"])
+
+
+def test_delta_with_sections_keeps_the_other_sections_as_last_sent() -> None:
+    importlib.reload(game_state_mod)
+    first, second = (
+        PlayerViewModel.model_validate(_make_player_model(game_age=age))
+        for age in (100, 101)
+    )
+
+    full = game_state_mod.build_agent_state(first, delta=True)
+    patch = game_state_mod.build_agent_state(
+        second, delta=True, since_sequence=full["sequence"], sections=["waiting_for"]
+    )
+
+    # Neither a game_age change nor a removal of the unrequested sections.
+    assert patch["delta"] == {}
+
+
+def test_merge_patch_round_trips_removals_and_nested_changes() -> None:
+    old = {"a": 1, "b": {"c": [1], "d": 2}, "gone": True}
+    new = {"a": 1, "b": {"c": [1, 2]}, "added": {"x": 1}}
+
+    patch = merge_patch(old, new)
+
+    assert patch == {"gone": None, "b": {"d": None, "c": [1, 2]}, "added": {"x": 1}}
+    assert apply_merge_patch(old, patch) == new
+    assert merge_patch(new, new) == {}
 
 
 def test_auto_response_includes_generation_start_context_on_new_generation(
@@ -607,6 +829,7 @@ def test_auto_response_includes_generation_start_context_on_new_generation(
         }
 
     monkeypatch.setattr("terraforming_mars_mcp.card_info.card_info", fake_card_info)
+    monkeypatch.setattr("terraforming_mars_mcp.card_info._CARD_TEMPLATES", {})
 
     raw4 = _make_player_model(generation=4, game_age=100)
     player_view4 = PlayerViewModel.model_validate(raw4)
@@ -685,7 +908,7 @@ def test_disabled_cards_are_filtered_out() -> None:
     }
     raw = _make_player_model(generation=4, game_age=100, waiting_for=waiting_for)
     player_view = PlayerViewModel.model_validate(raw)
-    server.get_player = lambda player_id=None: player_view
+    server.get_player_cached = lambda player_id=None: player_view
 
     state = asyncio.run(server.get_game_state())
     cards = state["waiting_for"]["cards"]
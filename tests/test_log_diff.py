@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from terraforming_mars_mcp._log_diff import LogAnchor, entries_after
+
+
+def _entry(timestamp: int, message: str, value: object = "blue") -> dict[str, object]:
+    return {
+        "timestamp": timestamp,
+        "message": message,
+        "data": [{"type": 2, "value": value}],
+    }
+
+
+def test_appended_entries_are_returned_in_order() -> None:
+    read = [_entry(1, "a"), _entry(2, "b")]
+    page = [*read, _entry(3, "c"), _entry(3, "d")]
+
+    assert [
+        entry["message"] for entry in entries_after(page, LogAnchor.at_end_of(read))
+    ] == [
+        "c",
+        "d",
+    ]
+
+
+def test_same_millisecond_entries_past_the_anchor_are_kept() -> None:
+    read = [_entry(1, "a"), _entry(2, "b"), _entry(2, "c")]
+    # The page dropped its oldest entry and gained one in the anchor's millisecond.
+    page = [_entry(2, "b"), _entry(2, "c"), _entry(2, "d"), _entry(3, "e")]
+
+    assert [
+        entry["message"] for entry in entries_after(page, LogAnchor.at_end_of(read))
+    ] == [
+        "d",
+        "e",
+    ]
+
+
+def test_undone_entries_are_ignored() -> None:
+    # "b" was undone and replaced by "b2".
+    read = [_entry(1, "a"), _entry(2, "b")]
+    page = [_entry(1, "a"), _entry(4, "b2"), _entry(5, "f")]
+
+    assert [
+        entry["message"] for entry in entries_after(page, LogAnchor.at_end_of(read))
+    ] == [
+        "b2",
+        "f",
+    ]
+
+
+def test_entries_with_unhashable_json_values_are_compared_by_content() -> None:
+    read = [_entry(1, "a", ["Livestock", {"n": 1}])]
+    page = [_entry(1, "a", ["Livestock", {"n": 1}]), _entry(1, "a", ["Fish"])]
+
+    assert [
+        entry["data"][0]["value"]  # type: ignore[index]
+        for entry in entries_after(page, LogAnchor.at_end_of(read))
+    ] == [["Fish"]]
+
+
+def test_an_empty_read_anchors_before_everything() -> None:
+    page = [_entry(1, "a")]
+
+    assert entries_after(page, LogAnchor.at_end_of([])) == page
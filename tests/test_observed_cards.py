@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import terraforming_mars_mcp.observed_cards as observed_cards_mod
 from terraforming_mars_mcp.api_response_models import PlayerViewModel
 from terraforming_mars_mcp.observed_cards import observe_player_model
 
@@ -94,3 +95,7 @@ def test_observe_player_model_flushes_only_at_end(monkeypatch, tmp_path: Path) -
     assert data["draft"]["drafted_card_names"] == ["Research"]
     assert data["played_cards"]["Codex"] == ["Inventors' Guild"]
     assert data["played_cards"]["Claude"] == ["Point Luna", "Security Fleet"]
+    # The accumulated state is dropped once flushed; only the marker remains.
+    assert observed_cards_mod._IN_MEMORY_STATE == {
+        "game-1:" + end_model.id: {"finalized": True}
+    }
@@ -737,3 +737,21 @@ def test_select_resources_validates_single_resource_selection() -> None:
         assert False, "Expected ValueError for ambiguous resource choice"
     except ValueError as exc:
         assert "exactly one" in str(exc).lower()
+
+
+def test_wait_for_turn_follows_session_delta_setting(monkeypatch) -> None:
+    extra = _reload_extra()
+    calls: list[dict[str, Any]] = []
+
+    def fake_build_agent_state(player_model: Any, **kwargs: Any) -> dict[str, Any]:
+        calls.append(kwargs)
+        return {"state": "current"}
+
+    extra.get_player = lambda player_id=None: SimpleNamespace(waitingFor=_wf("card"))
+    extra.build_agent_state = fake_build_agent_state
+    monkeypatch.setattr(turn_flow.CFG, "delta_responses", True)
+
+    result = _run(extra.wait_for_turn())
+
+    assert result == {"status": "GO", "state": {"state": "current"}}
+    assert calls[0]["delta"] is True
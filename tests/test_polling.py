@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Literal
+
+import pytest
+
+from terraforming_mars_mcp import turn_flow
+from terraforming_mars_mcp._polling import PollingPolicy, PollMetrics
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+
+
+def test_schedule_backs_off_on_wait_and_resets_on_refresh() -> None:
+    schedule = PollingPolicy(1, 8, backoff=2, jitter=0).schedule()
+
+    delays = [schedule.next_delay("WAIT") for _ in range(5)]
+    assert delays == [1, 2, 4, 8, 8]
+
+    assert schedule.next_delay("REFRESH") == 1
+    assert schedule.next_delay("WAIT") == 1
+    assert schedule.next_delay("WAIT") == 2
+
+
+def test_schedule_jitter_stays_within_bounds_and_differs_per_session() -> None:
+    policy = PollingPolicy(10, 10, backoff=1, jitter=0.2)
+    first = policy.schedule(random.Random(1))
+    second = policy.schedule(random.Random(2))
+
+    first_delays = [first.next_delay("WAIT") for _ in range(20)]
+    second_delays = [second.next_delay("WAIT") for _ in range(20)]
+
+    assert all(8 <= delay <= 12 for delay in first_delays + second_delays)
+    assert first_delays != second_delays
+
+
+def test_policy_rejects_inverted_bounds_and_overrides_keep_them_ordered() -> None:
+    with pytest.raises(ValueError):
+        PollingPolicy(min_interval=5, max_interval=1)
+
+    raised_floor = PollingPolicy(1, 4).with_overrides(min_interval=6)
+    assert (raised_floor.min_interval, raised_floor.max_interval) == (6, 6)
+
+
+def test_policy_reads_environment(monkeypatch) -> None:
+    monkeypatch.setenv("TM_POLL_MIN_SECONDS", "0.5")
+    monkeypatch.setenv("TM_POLL_MAX_SECONDS", "30")
+    monkeypatch.setenv("TM_POLL_JITTER", "0")
+
+    policy = PollingPolicy.from_env()
+
+    assert (policy.min_interval, policy.max_interval, policy.jitter) == (0.5, 30, 0)
+
+
+def test_wait_records_polls_per_turn(monkeypatch) -> None:
+    player_model = PlayerViewModel.model_validate(
+        {
+            "id": "player-1",
+            "game": {
+                "phase": "action",
+                "generation": 1,
+                "temperature": -30,
+                "oxygenLevel": 0,
+                "oceans": 0,
+                "venusScaleLevel": 0,
+                "isTerraformed": False,
+            },
+            "players": [{"name": "Me", "color": "red", "isActive": True}],
+            "thisPlayer": {"name": "Me", "color": "red", "isActive": True},
+        }
+    )
+    sleeps: list[float] = []
+
+    class FakeContext:
+        async def report_progress(self, **kwargs: object) -> None:
+            return None
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    results: list[Literal["GO", "REFRESH", "WAIT"]] = ["WAIT", "WAIT", "WAIT", "GO"]
+    statuses = iter(results)
+    metrics = PollMetrics()
+    monkeypatch.setattr(turn_flow, "POLL_METRICS", metrics)
+    monkeypatch.setattr(turn_flow.mcp, "get_context", lambda: FakeContext())
+    monkeypatch.setattr(turn_flow.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        turn_flow.CFG, "polling", PollingPolicy(1, 3, backoff=2, jitter=0)
+    )
+    monkeypatch.setattr(
+        turn_flow,
+        "_get_waiting_for_state",
+        lambda game_age, undo_count: turn_flow.ApiWaitingForStatusModel(
+            result=next(statuses), waitingFor=[]
+        ),
+    )
+    monkeypatch.setattr(turn_flow, "get_player", lambda: player_model)
+    monkeypatch.setattr(
+        turn_flow, "_get_game_logs_since", lambda cursor, generation: ([], cursor)
+    )
+
+    asyncio.run(
+        turn_flow.wait_for_turn_from_player_model(player_model, turn_flow.LogCursor(1))
+    )
+
+    assert sleeps == [1, 2, 3]
+    assert metrics.snapshot()["last_wait_polls"] == 4
+    assert metrics.snapshot()["waits"] == 1
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import queue
+import socket
+import threading
+import time
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar, Literal
+
+from terraforming_mars_mcp import turn_flow
+from terraforming_mars_mcp._polling import PollingPolicy
+from terraforming_mars_mcp._push import PushChannel
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+
+
+class _PushHandler(BaseHTTPRequestHandler):
+    """Stand-in push server: streams whatever is put on `events` as SSE."""
+
+    events: ClassVar[queue.Queue[str | None]] = queue.Queue()
+    paths: ClassVar[list[str]] = []
+
+    def do_GET(self) -> None:
+        self.paths.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        while True:
+            data = self.events.get()
+            if data is None:
+                return
+            self.wfile.write(f"event: game\ndata: {data}\n\n".encode())
+            self.wfile.flush()
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@contextmanager
+def _push_server() -> Iterator[str]:
+    _PushHandler.events = queue.Queue()
+    _PushHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PushHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        _PushHandler.events.put(None)
+        server.shutdown()
+        server.server_close()
+
+
+def _player_model() -> PlayerViewModel:
+    return PlayerViewModel.model_validate(
+        {
+            "id": "player-1",
+            "game": {
+                "phase": "action",
+                "generation": 1,
+                "temperature": -30,
+                "oxygenLevel": 0,
+                "oceans": 0,
+                "venusScaleLevel": 0,
+                "isTerraformed": False,
+                "gameAge": 5,
+            },
+            "players": [{"name": "Me", "color": "red", "isActive": True}],
+            "thisPlayer": {"name": "Me", "color": "red", "isActive": True},
+        }
+    )
+
+
+class _FakeContext:
+    async def report_progress(self, **kwargs: object) -> None:
+        return None
+
+
+def _patch_wait(
+    monkeypatch, statuses: list[Literal["GO", "REFRESH", "WAIT"]]
+) -> list[str]:
+    polled: list[str] = []
+    remaining = iter(statuses)
+    player_model = _player_model()
+
+    def fake_waiting_for_state(game_age: int, undo_count: int):
+        status = next(remaining)
+        polled.append(status)
+        return turn_flow.ApiWaitingForStatusModel(result=status, waitingFor=[])
+
+    monkeypatch.setattr(turn_flow.mcp, "get_context", lambda: _FakeContext())
+    monkeypatch.setattr(turn_flow, "_get_waiting_for_state", fake_waiting_for_state)
+    monkeypatch.setattr(turn_flow, "get_player", lambda: player_model)
+    monkeypatch.setattr(
+        turn_flow, "_get_game_logs_since", lambda cursor, generation: ([], cursor)
+    )
+    monkeypatch.setattr(turn_flow.CFG, "player_id", "player-1")
+    # A poll interval far longer than the test: only a push can end the sleep.
+    monkeypatch.setattr(
+        turn_flow.CFG, "polling", PollingPolicy(60, 60, backoff=1, jitter=0)
+    )
+    return polled
+
+
+def test_push_event_wakes_turn_wait_without_waiting_out_poll_interval(
+    monkeypatch,
+) -> None:
+    polled = _patch_wait(monkeypatch, ["WAIT", "GO"])
+    with _push_server() as base_url:
+        monkeypatch.setattr(turn_flow.CFG, "push_url", base_url + "/events/{player_id}")
+
+        def announce() -> None:
+            time.sleep(0.2)
+            _PushHandler.events.put('{"gameAge": 4}')  # stale: ignored
+            _PushHandler.events.put('{"gameAge": 6}')
+
+        threading.Thread(target=announce, daemon=True).start()
+        started = time.monotonic()
+        asyncio.run(
+            turn_flow.wait_for_turn_from_player_model(
+                _player_model(), turn_flow.LogCursor(1)
+            )
+        )
+        elapsed = time.monotonic() - started
+
+    assert polled == ["WAIT", "GO"]
+    assert elapsed < 5
+    assert _PushHandler.paths == ["/events/player-1"]
+
+
+def test_unavailable_push_endpoint_falls_back_to_polling(monkeypatch) -> None:
+    polled = _patch_wait(monkeypatch, ["WAIT", "WAIT", "GO"])
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(turn_flow.CFG, "push_url", "http://127.0.0.1:9/events")
+    monkeypatch.setattr(turn_flow.asyncio, "sleep", fake_sleep)
+
+    asyncio.run(
+        turn_flow.wait_for_turn_from_player_model(
+            _player_model(), turn_flow.LogCursor(1)
+        )
+    )
+
+    assert polled == ["WAIT", "WAIT", "GO"]
+    assert len(sleeps) == 2
+
+
+def test_push_channel_reports_drop_so_waiters_resume_polling() -> None:
+    async def scenario(base_url: str) -> tuple[bool, bool]:
+        channel = await PushChannel.connect(base_url + "/events")
+        assert channel is not None
+        _PushHandler.events.put(None)
+        woke = await channel.wait(timeout=5, game_age=1)
+        connected = channel.connected
+        await channel.close()
+        return woke, connected
+
+    with _push_server() as base_url:
+        woke, connected = asyncio.run(scenario(base_url))
+
+    assert woke is False
+    assert connected is False
+
+
+def test_ageless_event_between_waits_wakes_the_next_wait() -> None:
+    async def scenario(base_url: str) -> tuple[bool, bool]:
+        channel = await PushChannel.connect(base_url + "/events")
+        assert channel is not None
+        _PushHandler.events.put("ping")
+        # Nobody is waiting while the event arrives.
+        await asyncio.sleep(0.2)
+        woke = await channel.wait(timeout=5, game_age=1)
+        woke_again = await channel.wait(timeout=0.1, game_age=1)
+        await channel.close()
+        return woke, woke_again
+
+    with _push_server() as base_url:
+        woke, woke_again = asyncio.run(scenario(base_url))
+
+    assert woke is True
+    assert woke_again is False
+
+
+def test_connect_closes_the_socket_when_headers_time_out() -> None:
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def silent_server() -> None:
+        conn, _ = listener.accept()
+        conn.settimeout(5)
+        with conn:
+            # Read the request and answer nothing until the client hangs up.
+            while conn.recv(1024):
+                pass
+
+    threading.Thread(target=silent_server, daemon=True).start()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            channel = asyncio.run(
+                PushChannel.connect(f"http://127.0.0.1:{port}/events", timeout=0.2)
+            )
+            gc.collect()
+    finally:
+        listener.close()
+
+    assert channel is None
+    # A writer left open would only be closed, with a warning, when collected.
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+
+import terraforming_mars_mcp.card_info as card_info_mod
+import terraforming_mars_mcp.server as server_mod
+from terraforming_mars_mcp._card_db import compile_cards
+from terraforming_mars_mcp._requirements import Requirement, compile_requirement
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+
+_CARDS = [
+    {"name": "Ants", "tags": ["microbe"], "requirements": [{"oxygen": 4}]},
+    {"name": "Kelp Farming", "tags": ["plant"], "requirements": [{"oceans": 6}]},
+    {
+        "name": "Arctic Algae",
+        "tags": ["plant"],
+        "requirements": [{"temperature": -12, "max": True}],
+    },
+    {
+        "name": "Io Mining Industries",
+        "tags": ["jovian", "space"],
+        "requirements": [{"tag": "science", "count": 2}],
+    },
+    {"name": "Power Supply Consortium", "requirements": [{"production": "energy"}]},
+    {"name": "Urbanized Area", "requirements": [{"cities": 2}]},
+    {"name": "Banned Delegate", "requirements": [{"chairman": True}]},
+    {"name": "Research", "type": "automated", "tags": ["science", "science"]},
+    {"name": "Search For Life", "tags": ["science"]},
+]
+
+
+def test_compile_requirement_reads_kind_subject_and_modifiers() -> None:
+    assert compile_requirement({"temperature": -12, "max": True}) == Requirement(
+        "temperature", -12, is_max=True
+    )
+    assert compile_requirement({"tag": "science", "count": 2}) == Requirement(
+        "tag", 2, subject="science"
+    )
+    assert compile_requirement({"production": "energy"}) == Requirement(
+        "production", 1, subject="energy"
+    )
+    assert compile_requirement({"cities": 3, "all": True}) == Requirement(
+        "cities", 3, all_players=True
+    )
+
+
+def test_hand_playability_sorts_the_hand_in_one_pass(monkeypatch) -> None:
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_INDEX", compile_cards(_CARDS))
+    monkeypatch.setattr(card_info_mod, "_CARD_INFO_CACHE", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TEMPLATES", {})
+    monkeypatch.setattr(card_info_mod, "_CARD_TABLE", None)
+    player = {
+        "name": "Alice",
+        "color": "red",
+        "isActive": True,
+        "energyProduction": 1,
+        # The server's counts are used as is, tableau or not.
+        "tags": {"science": 2, "wild": 0},
+    }
+    spaces: list[dict[str, object]] = [
+        {"id": f"0{i}", "x": i, "y": 0, "spaceType": "land", "bonus": []}
+        | {"tileType": 2, "color": color}
+        for i, color in enumerate(["red", "blue"])
+    ]
+    view = PlayerViewModel.model_validate(
+        {
+            "id": "player-1",
+            "game": {
+                "phase": "action",
+                "generation": 3,
+                "temperature": -10,
+                "oxygenLevel": 4,
+                "oceans": 3,
+                "venusScaleLevel": 0,
+                "isTerraformed": False,
+                "spaces": spaces,
+            },
+            "players": [player],
+            "thisPlayer": player,
+            "cardsInHand": [
+                {"name": name}
+                for name in (
+                    "Ants",
+                    "Kelp Farming",
+                    "Arctic Algae",
+                    "Io Mining Industries",
+                    "Power Supply Consortium",
+                    "Urbanized Area",
+                    "Banned Delegate",
+                    "Not A Card",
+                )
+            ],
+        }
+    )
+    monkeypatch.setattr(server_mod, "get_player_cached", lambda player_id=None: view)
+
+    playability = asyncio.run(server_mod.get_my_hand_cards())["playability"]
+
+    assert playability == {
+        "playable_now": [
+            "Ants",
+            "Io Mining Industries",
+            "Power Supply Consortium",
+        ],
+        "steps_away": {"Kelp Farming": 3, "Urbanized Area": 1},
+        "blocked": ["Arctic Algae"],
+        "unchecked": {"Banned Delegate": ["chairman"]},
+    }
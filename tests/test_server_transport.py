@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from mcp.server.transport_security import TransportSecuritySettings
+
+import terraforming_mars_mcp.server as server_mod
+
+
+def test_http_transport_binds_host_and_port(monkeypatch) -> None:
+    settings = server_mod.mcp.settings
+    guard = TransportSecuritySettings(enable_dns_rebinding_protection=True)
+    monkeypatch.setattr(settings, "host", settings.host)
+    monkeypatch.setattr(settings, "port", settings.port)
+    monkeypatch.setattr(settings, "transport_security", guard)
+
+    server_mod._configure_http_transport("127.0.0.1", 9123)
+    assert (settings.host, settings.port) == ("127.0.0.1", 9123)
+    assert settings.transport_security is guard
+
+    # A public bind keeps the guard, admitting the given hosts as well.
+    server_mod._configure_http_transport("0.0.0.0", 9124, ["mcp.example.com:9124"])
+    security = settings.transport_security
+    assert security is not None
+    assert security.enable_dns_rebinding_protection
+    assert "mcp.example.com:9124" in security.allowed_hosts
+    assert "127.0.0.1:*" in security.allowed_hosts
+    assert "https://mcp.example.com:9124" in security.allowed_origins
+
+    # Without allowed hosts it stays loopback-only rather than switching off.
+    server_mod._configure_http_transport("0.0.0.0", 9125)
+    security = settings.transport_security
+    assert security is not None
+    assert security.enable_dns_rebinding_protection
+    assert security.allowed_hosts == ["127.0.0.1:*", "localhost:*", "[::1]:*"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import contextvars
+from types import SimpleNamespace
+from typing import Any, cast
+
+from mcp.server.lowlevel.server import request_ctx
+
+import terraforming_mars_mcp.server as server_mod
+from terraforming_mars_mcp import _session, turn_flow
+
+
+class _Client:
+    """Stand-in for an MCP ServerSession (weak-referenceable, like the real one)."""
+
+
+def _as_client(client: object, func, *args, **kwargs):
+    """Run ``func`` as if inside a tool call from MCP client session ``client``."""
+
+    def call():
+        request_ctx.set(cast(Any, SimpleNamespace(session=client)))
+        return func(*args, **kwargs)
+
+    return contextvars.copy_context().run(call)
+
+
+def test_each_mcp_client_configures_its_own_session(monkeypatch) -> None:
+    monkeypatch.setattr(turn_flow.CFG, "base_url", "http://default:8080")
+    monkeypatch.setattr(turn_flow.CFG, "player_id", None)
+    alice, bob = _Client(), _Client()
+
+    _as_client(alice, server_mod.configure_session, player_id="p-alice")
+    _as_client(
+        bob, server_mod.configure_session, base_url="http://other/", player_id="p-bob"
+    )
+
+    seen = {
+        name: _as_client(client, turn_flow.current_session)
+        for name, client in (("alice", alice), ("bob", bob))
+    }
+    assert (seen["alice"].base_url, seen["alice"].player_id) == (
+        "http://default:8080",
+        "p-alice",
+    )
+    assert (seen["bob"].base_url, seen["bob"].player_id) == ("http://other", "p-bob")
+    assert turn_flow.CFG.player_id is None
+    # A client that never configured anything still runs on the defaults.
+    assert _as_client(_Client(), turn_flow.current_session) is turn_flow.CFG
+
+
+def test_session_handle_attaches_client_to_named_session(monkeypatch) -> None:
+    monkeypatch.setattr(_session, "_NAMED_SESSIONS", {})
+    client = _Client()
+
+    result = _as_client(
+        client, server_mod.configure_session, player_id="p-7", session_handle="seat-7"
+    )
+
+    assert result["session_handle"] == "seat-7"
+    assert _as_client(client, turn_flow.current_session) is _session.named_session(
+        "seat-7"
+    )
+    with _session.use_session("seat-7") as session:
+        assert turn_flow.current_session() is session
+        assert session.player_id == "p-7"
+    assert turn_flow.current_session() is turn_flow.CFG
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from terraforming_mars_mcp.game_state import thin_raw_player_model
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
+from terraforming_mars_mcp.game_state import build_agent_state, thin_raw_player_model
 
 
 def _make_raw_model(
@@ -315,3 +316,18 @@ def test_all_nonzero_tags_kept() -> None:
     )
     result = thin_raw_player_model(raw)
     assert result["players"][0]["tags"] == {"building": 3, "space": 1}
+
+
+def test_raw_player_model_thins_the_response_body_like_the_model_dump() -> None:
+    # The server sends every field, so start from a complete, validated body.
+    body = PlayerViewModel.model_validate(_make_raw_model()).model_dump_json().encode()
+    from_dump = PlayerViewModel.model_validate_json(body)
+    from_body = PlayerViewModel.model_validate_json(body)
+    from_body._raw_json = body
+
+    def raw_player_model(player_model: PlayerViewModel) -> dict[str, Any]:
+        return build_agent_state(
+            player_model, include_full_model=True, sections=["raw_player_model"]
+        )["raw_player_model"]
+
+    assert raw_player_model(from_body) == raw_player_model(from_dump)
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar, Literal
+
+import pytest
+
+from terraforming_mars_mcp import turn_flow
+from terraforming_mars_mcp._http_pool import HttpConnectionPool
+
+_PLAYER_VIEW = {
+    "id": "p1",
+    "game": {
+        "phase": "action",
+        "generation": 2,
+        "temperature": -28,
+        "oxygenLevel": 1,
+        "oceans": 0,
+        "venusScaleLevel": 0,
+        "isTerraformed": False,
+        "gameAge": 7,
+    },
+    "players": [{"name": "Me", "color": "red", "isActive": True}],
+    "thisPlayer": {"name": "Me", "color": "red", "isActive": True},
+    "cardsInHand": [{"name": "Comet", "calculatedCost": 21}],
+}
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: ClassVar[list[int]] = []
+
+    def _reply(self, status: int, payload: object) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.peers.append(self.client_address[1])
+        if self.path.startswith("/missing"):
+            self._reply(404, {"message": "no such game"})
+            return
+        if self.path.startswith("/api/player"):
+            self._reply(200, _PLAYER_VIEW)
+            return
+        if self.path.startswith("/api/waitingfor"):
+            self._reply(200, ["not", "an", "object"])
+            return
+        self._reply(200, {"path": self.path})
+
+    def do_POST(self) -> None:
+        self.peers.append(self.client_address[1])
+        length = int(self.headers.get("Content-Length", "0"))
+        self._reply(200, json.loads(self.rfile.read(length)))
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@contextmanager
+def _server() -> Iterator[str]:
+    _KeepAliveHandler.peers = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_reuses_one_connection_for_sequential_requests() -> None:
+    with _server() as base_url:
+        pool = HttpConnectionPool(base_url, max_size=2)
+        for _ in range(5):
+            assert pool.request("GET", "/api/player?id=p1").status == 200
+        pool.close()
+
+    # Every request arrived from the same client socket.
+    assert len(set(_KeepAliveHandler.peers)) == 1
+
+
+def test_pool_evicts_connections_past_idle_timeout(monkeypatch) -> None:
+    clock = {"now": 0.0}
+    monkeypatch.setattr(
+        "terraforming_mars_mcp._http_pool.time.monotonic", lambda: clock["now"]
+    )
+    with _server() as base_url:
+        pool = HttpConnectionPool(base_url, max_size=2, idle_timeout=4)
+        pool.request("GET", "/a")
+        clock["now"] = 10.0
+        pool.request("GET", "/b")
+        assert pool.idle_count() == 1
+        pool.close()
+
+    assert len(set(_KeepAliveHandler.peers)) == 2
+
+
+def test_pool_with_zero_size_keeps_no_idle_connections() -> None:
+    with _server() as base_url:
+        pool = HttpConnectionPool(base_url, max_size=0)
+        pool.request("GET", "/a")
+        pool.request("GET", "/b")
+        assert pool.idle_count() == 0
+
+    assert len(set(_KeepAliveHandler.peers)) == 2
+
+
+def test_http_json_round_trips_through_pool(monkeypatch) -> None:
+    with _server() as base_url:
+        monkeypatch.setattr(turn_flow.CFG, "base_url", base_url)
+        posted = turn_flow._http_json(
+            "POST", "/player/input", {"id": "p1"}, {"type": "option"}
+        )
+        fetched = turn_flow._http_json("GET", "/echo", {"id": "p1"})
+        with pytest.raises(RuntimeError, match="HTTP 404 GET /missing: no such game"):
+            turn_flow._http_json("GET", "/missing")
+
+    assert posted == {"type": "option"}
+    assert fetched == {"path": "/echo?id=p1"}
+    assert len(set(_KeepAliveHandler.peers)) == 1
+
+
+def test_http_json_reports_unreachable_server(monkeypatch) -> None:
+    monkeypatch.setattr(turn_flow.CFG, "base_url", "http://127.0.0.1:9")
+    with pytest.raises(RuntimeError, match="Cannot reach server"):
+        turn_flow._http_json("GET", "/api/player", {"id": "p1"})
+
+
+def test_get_player_validates_response_bytes_into_model(monkeypatch) -> None:
+    with _server() as base_url:
+        monkeypatch.setattr(turn_flow.CFG, "base_url", base_url)
+        player_model = turn_flow.get_player("p1")
+        with pytest.raises(RuntimeError, match="Unexpected /api/waitingfor response"):
+            turn_flow._get_waiting_for_state(7, 0, "p1")
+
+    assert isinstance(player_model, turn_flow.ApiPlayerViewModel)
+    assert player_model.game.gameAge == 7
+    assert player_model.cardsInHand[0].calculatedCost == 21
+
+
+def _player_model(
+    game_age: int, waiting_for: Mapping[str, object] | None = None
+) -> turn_flow.ApiPlayerViewModel:
+    raw = json.loads(json.dumps(_PLAYER_VIEW))
+    raw["game"]["gameAge"] = game_age
+    if waiting_for is not None:
+        raw["waitingFor"] = waiting_for
+    return turn_flow.ApiPlayerViewModel.model_validate(raw)
+
+
+def test_get_player_cached_reuses_model_within_ttl_then_revalidates(
+    monkeypatch,
+) -> None:
+    clock = {"now": 100.0}
+    fetches: list[int] = []
+    results: list[Literal["GO", "REFRESH", "WAIT"]] = ["WAIT", "REFRESH"]
+    statuses = iter(results)
+    status_queries: list[tuple[int, int]] = []
+
+    def fake_http_model(response_type, method, path, query=None, body=None):
+        fetches.append(len(fetches))
+        return _player_model(game_age=7 + len(fetches) - 1)
+
+    def fake_waiting_for_state(game_age, undo_count, player_id=None):
+        status_queries.append((game_age, undo_count))
+        return turn_flow.ApiWaitingForStatusModel(result=next(statuses), waitingFor=[])
+
+    monkeypatch.setattr(turn_flow, "_PLAYER_CACHE", {})
+    monkeypatch.setattr(turn_flow.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(turn_flow, "_http_model", fake_http_model)
+    monkeypatch.setattr(turn_flow, "_get_waiting_for_state", fake_waiting_for_state)
+    monkeypatch.setattr(turn_flow, "observe_player_model", lambda model: None)
+
+    first = turn_flow.get_player_cached("p1")
+    clock["now"] += 1
+    assert turn_flow.get_player_cached("p1") is first
+    assert status_queries == []
+
+    # Past the TTL: WAIT at the cached gameAge confirms the model is current.
+    clock["now"] += turn_flow.PLAYER_CACHE_TTL_SECONDS + 1
+    assert turn_flow.get_player_cached("p1") is first
+    assert status_queries == [(7, 0)]
+
+    # REFRESH means the game moved on, so the full model is refetched.
+    clock["now"] += turn_flow.PLAYER_CACHE_TTL_SECONDS + 1
+    refreshed = turn_flow.get_player_cached("p1")
+    assert refreshed.game.gameAge == 8
+    assert len(fetches) == 2
+
+
+@pytest.mark.parametrize(
+    ("reported_age", "refetched"), [((7, 0), False), ((7, 1), True), (None, True)]
+)
+def test_get_player_cached_reuses_prompt_on_go_only_at_the_same_age(
+    monkeypatch, reported_age: tuple[int, int] | None, refetched: bool
+) -> None:
+    clock = {"now": 100.0}
+    prompt = {"type": "option", "title": "Play", "buttonLabel": "OK"}
+    fetched = [_player_model(game_age=7, waiting_for=prompt), _player_model(8)]
+    game_age, undo_count = reported_age or (None, None)
+
+    def fake_http_model(response_type, method, path, query=None, body=None):
+        return fetched.pop(0)
+
+    monkeypatch.setattr(turn_flow, "_PLAYER_CACHE", {})
+    monkeypatch.setattr(turn_flow.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(turn_flow, "_http_model", fake_http_model)
+    monkeypatch.setattr(
+        turn_flow,
+        "_get_waiting_for_state",
+        lambda game_age_, undo_count_, player_id=None: (
+            turn_flow.ApiWaitingForStatusModel(
+                result="GO", waitingFor=[], gameAge=game_age, undoCount=undo_count
+            )
+        ),
+    )
+    monkeypatch.setattr(turn_flow, "observe_player_model", lambda model: None)
+
+    # GO holds all through this player's turn, so only a matching
+    # (gameAge, undoCount) shows the cached prompt is still the one to answer.
+    first = turn_flow.get_player_cached("p1")
+    clock["now"] += turn_flow.PLAYER_CACHE_TTL_SECONDS + 1
+    assert (turn_flow.get_player_cached("p1") is not first) is refetched
+    assert len(fetched) == (0 if refetched else 1)
+
+
+def test_post_input_result_replaces_cached_player_model(monkeypatch) -> None:
+    submitted = _player_model(game_age=9)
+    monkeypatch.setattr(turn_flow, "_PLAYER_CACHE", {})
+    monkeypatch.setattr(turn_flow, "_http_model", lambda *args, **kwargs: submitted)
+    monkeypatch.setattr(turn_flow, "observe_player_model", lambda model: None)
+
+    turn_flow._post_input({"type": "option"}, "p1")
+
+    assert turn_flow.get_player_cached("p1") is submitted
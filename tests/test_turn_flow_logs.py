@@ -73,3 +73,93 @@ def test_game_log_entry_accepts_list_value_payloads() -> None:
     )
 
     assert entry.data[1].value == ["Livestock"]
+
+
+def _log(
+    timestamp: int, message: str, entry_type: int = 0
+) -> dict[str, turn_flow.JsonValue]:
+    return {"timestamp": timestamp, "message": message, "data": [], "type": entry_type}
+
+
+def test_game_logs_since_fetches_only_new_generation_pages(monkeypatch) -> None:
+    pages = {
+        3: [_log(10, "Generation 3", 1), _log(11, "a"), _log(12, "b")],
+        4: [_log(20, "Generation 4", 1), _log(21, "c")],
+    }
+    fetched: list[int] = []
+
+    def fake_page(
+        generation: int, player_id: str | None
+    ) -> list[dict[str, turn_flow.JsonValue]]:
+        fetched.append(generation)
+        return pages[generation]
+
+    monkeypatch.setattr(turn_flow, "_get_game_log_page", fake_page)
+
+    start = turn_flow._cursor_at_end(3, pages[3][:2])
+    logs, cursor = turn_flow._get_game_logs_since(start, 4)
+
+    assert [entry.message for entry in logs] == ["b", "Generation 4", "c"]
+    assert cursor == turn_flow._cursor_at_end(4, pages[4])
+    assert fetched == [3, 4]
+
+
+def test_game_logs_since_trims_unscoped_log_locally(monkeypatch) -> None:
+    # A server without generation-scoped logs returns everything every time.
+    full_log = [
+        _log(1, "a"),
+        _log(10, "Generation 2", 1),
+        _log(11, "b"),
+        _log(20, "Generation 3", 1),
+        _log(21, "c"),
+    ]
+    fetched: list[int] = []
+
+    def fake_page(
+        generation: int, player_id: str | None
+    ) -> list[dict[str, turn_flow.JsonValue]]:
+        fetched.append(generation)
+        return full_log
+
+    monkeypatch.setattr(turn_flow, "_get_game_log_page", fake_page)
+
+    start = turn_flow._cursor_at_end(2, full_log[:3])
+    logs, cursor = turn_flow._get_game_logs_since(start, 3)
+
+    assert [entry.message for entry in logs] == ["Generation 3", "c"]
+    assert cursor == turn_flow._cursor_at_end(3, full_log)
+    assert fetched == [2]
+
+
+def test_game_logs_since_falls_back_to_timestamps_after_undo(monkeypatch) -> None:
+    # Entry 12 was undone and replaced; the page no longer extends the cursor.
+    page = [_log(11, "a"), _log(14, "redo"), _log(15, "d")]
+    monkeypatch.setattr(
+        turn_flow, "_get_game_log_page", lambda generation, player_id: page
+    )
+
+    start = turn_flow._cursor_at_end(1, [_log(11, "a"), _log(12, "b")])
+    logs, cursor = turn_flow._get_game_logs_since(start, 1)
+
+    assert [entry.message for entry in logs] == ["redo", "d"]
+    assert cursor == turn_flow._cursor_at_end(1, page)
+
+
+def test_game_logs_since_keeps_same_millisecond_entries_of_a_capped_page(
+    monkeypatch,
+) -> None:
+    # The server sends only the latest 50 entries of a generation. Between
+    # reads the window slid past the oldest entries, and the action being
+    # read logged a third line in the cursor's millisecond.
+    read = [_log(timestamp, f"old {timestamp}") for timestamp in range(48)]
+    read += [_log(100, "x1"), _log(100, "x2")]
+    page = read[3:] + [_log(100, "x3"), _log(101, "d"), _log(102, "e")]
+    assert len(read) == len(page) == 50
+    monkeypatch.setattr(
+        turn_flow, "_get_game_log_page", lambda generation, player_id: page
+    )
+
+    logs, cursor = turn_flow._get_game_logs_since(turn_flow._cursor_at_end(1, read), 1)
+
+    assert [entry.message for entry in logs] == ["x3", "d", "e"]
+    assert cursor == turn_flow._cursor_at_end(1, page)
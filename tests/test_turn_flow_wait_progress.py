@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import threading
 
-from terraforming_mars_mcp.api_response_models import GameLogEntryModel, PlayerViewModel
 import terraforming_mars_mcp.game_state as game_state_mod
 import terraforming_mars_mcp.turn_flow as turn_flow
+from terraforming_mars_mcp._polling import PollingPolicy
+from terraforming_mars_mcp.api_response_models import PlayerViewModel
 
 
 def test_wait_for_turn_reports_progress_every_30_seconds(
@@ -54,6 +56,10 @@ def test_wait_for_turn_reports_progress_every_30_seconds(
 
     monkeypatch.setattr(turn_flow.mcp, "get_context", lambda: FakeContext())
     monkeypatch.setattr(turn_flow.time, "monotonic", lambda: clock["now"])
+    # A fixed, jitter-free schedule keeps the fake clock on whole seconds.
+    monkeypatch.setattr(
+        turn_flow.CFG, "polling", PollingPolicy(2, 2, backoff=1, jitter=0)
+    )
 
     async def fake_sleep(seconds: float) -> None:
         clock["now"] += seconds
@@ -67,10 +73,14 @@ def test_wait_for_turn_reports_progress_every_30_seconds(
 
     monkeypatch.setattr(turn_flow, "_get_waiting_for_state", fake_waiting_for_state)
     monkeypatch.setattr(turn_flow, "get_player", lambda: player_model)
-    monkeypatch.setattr(turn_flow, "_get_game_logs", lambda: [])
+    monkeypatch.setattr(
+        turn_flow, "_get_game_logs_since", lambda cursor, generation: ([], cursor)
+    )
 
     refreshed, opponent_actions = asyncio.run(
-        turn_flow.wait_for_turn_from_player_model(player_model, initial_logs=[])
+        turn_flow.wait_for_turn_from_player_model(
+            player_model, log_cursor=turn_flow.LogCursor(1)
+        )
     )
 
     assert refreshed is player_model
@@ -153,32 +163,19 @@ def test_submit_and_return_state_surfaces_between_turn_opponent_new_cards(
         }
     )
 
-    logs = [
-        GameLogEntryModel.model_validate(
-            {
-                "timestamp": 1,
-                "message": "${0} played Trans-Neptune Probe",
-                "data": [{"type": 2, "value": "blue"}],
-            }
-        ),
-        GameLogEntryModel.model_validate(
-            {
-                "timestamp": 2,
-                "message": "${0} played Anti-Gravity Technology",
-                "data": [{"type": 2, "value": "blue"}],
-            }
-        ),
-    ]
-
     monkeypatch.setattr(turn_flow, "_post_input", lambda response: post_input_model)
-    monkeypatch.setattr(turn_flow, "_get_game_logs", lambda: logs)
     monkeypatch.setattr(turn_flow, "get_player", lambda: post_input_model)
+    end_of_own_turn = turn_flow._cursor_at_end(1, [{"timestamp": 70}])
+    monkeypatch.setattr(
+        turn_flow, "_get_game_log_cursor", lambda generation: end_of_own_turn
+    )
 
     async def fake_wait_for_turn_from_player_model(
-        player_model, initial_logs=None, committed_summary=""
+        player_model, log_cursor=None, committed_summary=""
     ):
+        # The wait reads the log from the end of the submitted turn.
         assert player_model == post_input_model
-        assert initial_logs == logs
+        assert log_cursor == end_of_own_turn
         return refreshed_model, [
             "John played Trans-Neptune Probe",
             "John played Anti-Gravity Technology",
@@ -321,10 +318,90 @@ def test_wait_for_turn_skips_revisable_prompt_until_real_prompt(
         lambda game_age, undo_count: FakeWaitingFor(next(states)),
     )
     monkeypatch.setattr(turn_flow, "get_player", lambda: next(players))
-    monkeypatch.setattr(turn_flow, "_get_game_logs", lambda: [])
+    monkeypatch.setattr(
+        turn_flow, "_get_game_logs_since", lambda cursor, generation: ([], cursor)
+    )
+
+    refreshed, _ = asyncio.run(
+        turn_flow.wait_for_turn_from_player_model(
+            revisable, log_cursor=turn_flow.LogCursor(1)
+        )
+    )
+
+    assert refreshed is real_prompt
+
+
+def test_wait_for_turn_backs_off_while_revisable_prompt_is_unchanged(
+    monkeypatch,
+) -> None:
+    sleeps: list[float] = []
+
+    class FakeContext:
+        async def report_progress(self, **kwargs: object) -> None:
+            return None
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    revisable = _player_view_with_waiting_for(
+        "You can change your selection until all players have selected a card. "
+        "Passing to ${0}"
+    )
+    real_prompt = _player_view_with_waiting_for(
+        "Select a card to keep and pass the rest to ${0}"
+    )
+    # waitingfor answers GO all through the draft; only the refreshed prompt
+    # tells whether the other players have picked yet.
+    players = iter([revisable, revisable, revisable, real_prompt])
+
+    monkeypatch.setattr(turn_flow.mcp, "get_context", lambda: FakeContext())
+    monkeypatch.setattr(turn_flow.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        turn_flow.CFG, "polling", PollingPolicy(1, 8, backoff=2, jitter=0)
+    )
+    monkeypatch.setattr(
+        turn_flow,
+        "_get_waiting_for_state",
+        lambda game_age, undo_count: turn_flow.ApiWaitingForStatusModel(
+            result="GO", waitingFor=[]
+        ),
+    )
+    monkeypatch.setattr(turn_flow, "get_player", lambda: next(players))
+    monkeypatch.setattr(
+        turn_flow, "_get_game_logs_since", lambda cursor, generation: ([], cursor)
+    )
 
     refreshed, _ = asyncio.run(
-        turn_flow.wait_for_turn_from_player_model(revisable, initial_logs=[])
+        turn_flow.wait_for_turn_from_player_model(
+            revisable, log_cursor=turn_flow.LogCursor(1)
+        )
     )
 
     assert refreshed is real_prompt
+    assert sleeps == [1, 2, 4]
+
+
+def test_run_blocking_keeps_event_loop_free_during_http_calls() -> None:
+    release = threading.Event()
+    ticks: list[int] = []
+
+    def slow_get_player() -> str:
+        # Only returns once the loop has run the ticker below; a blocking call
+        # on the loop thread would time out here instead.
+        assert release.wait(timeout=5)
+        return "player"
+
+    async def ticker() -> None:
+        for i in range(3):
+            ticks.append(i)
+            await asyncio.sleep(0)
+        release.set()
+
+    async def scenario() -> str:
+        result, _ = await asyncio.gather(
+            turn_flow.run_blocking(slow_get_player), ticker()
+        )
+        return result
+
+    assert asyncio.run(scenario()) == "player"
+    assert ticks == [0, 1, 2]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Literal
+
+from terraforming_mars_mcp import turn_flow
+from terraforming_mars_mcp._polling import PollMetrics
+
+_Result = Literal["GO", "REFRESH", "WAIT"]
+
+
+def _status(result: _Result) -> turn_flow.ApiWaitingForStatusModel:
+    return turn_flow.ApiWaitingForStatusModel(result=result, waitingFor=[])
+
+
+class _FakeServer:
+    """Per-seat waitingfor answers; counts the polls that reach it."""
+
+    def __init__(self, answers: dict[str, list[_Result]]) -> None:
+        self.answers = {seat: iter(results) for seat, results in answers.items()}
+        self.polls: list[str] = []
+        self.gate: asyncio.Event | None = None
+
+    def fetch(self, seat: str):
+        async def poll() -> turn_flow.ApiWaitingForStatusModel:
+            self.polls.append(seat)
+            if self.gate is not None:
+                await self.gate.wait()
+            return _status(next(self.answers[seat]))
+
+        return poll
+
+
+def test_waiting_seats_of_one_game_share_an_in_flight_poll(monkeypatch) -> None:
+    monkeypatch.setattr(turn_flow, "POLL_METRICS", PollMetrics())
+    waiter = turn_flow.TurnWaiter()
+    server = _FakeServer({"a": ["WAIT", "WAIT"], "b": ["WAIT"]})
+
+    async def run() -> list[str]:
+        # Each seat's own first poll confirms it is waiting at this state.
+        for seat in ("a", "b"):
+            await waiter.poll(seat, "g1", 5, 0, server.fetch(seat), fresh_for=0)
+        server.gate = asyncio.Event()
+        first = asyncio.create_task(
+            waiter.poll("a", "g1", 5, 0, server.fetch("a"), fresh_for=0)
+        )
+        await asyncio.sleep(0)
+        second = asyncio.create_task(
+            waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=0)
+        )
+        await asyncio.sleep(0)
+        server.gate.set()
+        return [(await first).result, (await second).result]
+
+    assert asyncio.run(run()) == ["WAIT", "WAIT"]
+    assert server.polls == ["a", "b", "a"]
+    assert turn_flow.POLL_METRICS.snapshot()["shared_polls"] == 1
+
+
+def test_game_moving_for_one_seat_refreshes_the_others(monkeypatch) -> None:
+    monkeypatch.setattr(turn_flow, "POLL_METRICS", PollMetrics())
+    waiter = turn_flow.TurnWaiter()
+    server = _FakeServer({"a": ["WAIT", "GO"], "b": ["WAIT"], "c": ["GO"]})
+
+    async def run() -> list[str]:
+        for seat in ("a", "b"):
+            await waiter.poll(seat, "g1", 5, 0, server.fetch(seat), fresh_for=0)
+        moved = await waiter.poll("a", "g1", 5, 0, server.fetch("a"), fresh_for=0)
+        told = await waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=0)
+        # A seat that never saw WAIT here may have its prompt already: it
+        # always polls for itself.
+        own = await waiter.poll("c", "g1", 5, 0, server.fetch("c"), fresh_for=0)
+        return [moved.result, told.result, own.result]
+
+    assert asyncio.run(run()) == ["GO", "REFRESH", "GO"]
+    assert server.polls == ["a", "b", "a", "c"]
+
+
+def test_recent_wait_from_another_seat_answers_without_polling(monkeypatch) -> None:
+    monkeypatch.setattr(turn_flow, "POLL_METRICS", PollMetrics())
+    clock = {"now": 100.0}
+    monkeypatch.setattr(turn_flow.time, "monotonic", lambda: clock["now"])
+    waiter = turn_flow.TurnWaiter()
+    server = _FakeServer({"a": ["WAIT", "WAIT"], "b": ["WAIT", "WAIT"]})
+
+    async def run() -> None:
+        await waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=1)
+        clock["now"] += 5
+        await waiter.poll("a", "g1", 5, 0, server.fetch("a"), fresh_for=1)
+        await waiter.poll("a", "g1", 5, 0, server.fetch("a"), fresh_for=1)
+        clock["now"] += 0.5
+        # a's WAIT is newer than b's last poll and younger than fresh_for.
+        await waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=1)
+        clock["now"] += 2
+        await waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=1)
+
+    asyncio.run(run())
+
+    assert server.polls == ["b", "a", "a", "b"]
+
+
+def test_leaving_seats_drop_their_watched_state() -> None:
+    waiter = turn_flow.TurnWaiter()
+    server = _FakeServer({"a": ["WAIT"], "b": ["WAIT"]})
+
+    async def run() -> None:
+        await waiter.poll("a", "g1", 5, 0, server.fetch("a"), fresh_for=0)
+        await waiter.poll("b", "g1", 5, 0, server.fetch("b"), fresh_for=0)
+
+    asyncio.run(run())
+    assert waiter.watched_states() == 1
+    waiter.leave("a")
+    assert waiter.watched_states() == 1
+    waiter.leave("b")
+    assert waiter.watched_states() == 0
@@ -181,6 +181,8 @@ def test_waiting_for_card_surfaces_base_and_discounted_cost() -> None:
         assert card["discounted_cost"] == 7
     finally:
         card_info.card_info = original_card_info_fn
+        # Templates are cached by card name, so drop the ones built from the fake.
+        card_info._CARD_TEMPLATES.clear()
 
 
 def test_waiting_for_surfaces_warnings_and_branch_metadata() -> None: